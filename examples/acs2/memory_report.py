@@ -0,0 +1,70 @@
+import argparse
+import random
+import sys
+import tracemalloc
+
+from lcs.agents.acs2 import Classifier, ClassifiersList, Configuration
+
+
+def random_classifier(cfg, specificity):
+    def symbols(wildcard_prob):
+        return ''.join('#' if random.random() < wildcard_prob
+                       else random.choice('01')
+                       for _ in range(cfg.classifier_length))
+
+    return Classifier(condition=symbols(1 - specificity),
+                      action=random.randrange(cfg.number_of_possible_actions),
+                      effect=symbols(1 - specificity / 2),
+                      cfg=cfg)
+
+
+def build_population(cfg, size, specificity):
+    population = ClassifiersList()
+    while len(population) < size:
+        parent = random_classifier(cfg, specificity)
+        population.append(parent)
+
+        # Offspring share the condition and effect of their parent
+        if len(population) < size and random.random() < 0.5:
+            population.append(Classifier.copy_from(parent, 0))
+
+    return population
+
+
+def measure(cfg, size, specificity, seed):
+    random.seed(seed)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    population = build_population(cfg, size, specificity)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cl = population[0]
+    components = {
+        'classifier': sys.getsizeof(cl),
+        'condition': sys.getsizeof(cl.condition),
+        'effect': sys.getsizeof(cl.effect),
+        'mark': sys.getsizeof(cl.mark),
+    }
+    return (after - before) / size, components
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Bytes per classifier in default and memory-lean mode")
+    parser.add_argument("-l", "--length", default=8, type=int)
+    parser.add_argument("-n", "--size", default=100_000, type=int)
+    parser.add_argument("-s", "--specificity", default=0.25, type=float)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    for memory_lean in (False, True):
+        cfg = Configuration(args.length, 4, memory_lean=memory_lean)
+        total, components = measure(
+            cfg, args.size, args.specificity, args.seed)
+
+        print(f"memory_lean={memory_lean}")
+        print(f"  traced bytes per classifier: {total:.1f}")
+        for name, size in components.items():
+            print(f"  sys.getsizeof({name}): {size}")
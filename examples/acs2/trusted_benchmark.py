@@ -0,0 +1,102 @@
+import argparse
+import random
+import time
+
+import numpy as np
+
+from lcs.agents.acs2 import ACS2, Configuration
+
+MAZE = [
+    "1111111111",
+    "1000100001",
+    "1010101101",
+    "1010001001",
+    "1011101011",
+    "1000001091",
+    "1111111111",
+]
+
+# Neighbouring cells (perception) and moves - clockwise starting from north
+MOVES = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+class ActionSpace:
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    def sample(self) -> int:
+        return random.randrange(self.n)
+
+
+class Maze:
+    """
+    Minimal maze environment (gym interface) - the agent perceives
+    eight neighbouring cells and is rewarded for reaching the '9' cell.
+    """
+
+    def __init__(self, max_steps: int = 50) -> None:
+        self.env = self
+        self.action_space = ActionSpace(len(MOVES))
+        self.max_steps = max_steps
+        self.free = [(row, col) for row, cells in enumerate(MAZE)
+                     for col, cell in enumerate(cells) if cell == '0']
+
+    def reset(self):
+        self.pos = random.choice(self.free)
+        self.steps = 0
+        return self._observe()
+
+    def step(self, action: int):
+        row, col = self.pos
+        drow, dcol = MOVES[action]
+        cell = MAZE[row + drow][col + dcol]
+        self.steps += 1
+
+        if cell != '1':
+            self.pos = (row + drow, col + dcol)
+
+        done = cell == '9' or self.steps >= self.max_steps
+        return self._observe(), 1000 if cell == '9' else 0, done, {}
+
+    def _observe(self):
+        row, col = self.pos
+        return tuple(MAZE[row + drow][col + dcol] for drow, dcol in MOVES)
+
+
+def steps_per_second(trusted: bool, trials: int, seed: int) -> float:
+    random.seed(seed)
+    np.random.seed(seed)
+
+    cfg = Configuration(8, 8, do_ga=True, trusted=trusted,
+                        metrics_trial_frequency=1)
+    agent = ACS2(cfg)
+
+    start = time.perf_counter()
+    _, metrics = agent.explore(Maze(), trials)
+    elapsed = time.perf_counter() - start
+
+    return sum(m['steps_in_trial'] for m in metrics) / elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Explore steps per second with and without "
+                    "the trusted mode")
+    parser.add_argument("--trials", default=100, type=int)
+    parser.add_argument("--repeats", default=3, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    # Modes are interleaved and the best repeat is taken to reduce
+    # the influence of the machine load
+    results = {False: 0.0, True: 0.0}
+    for _ in range(args.repeats):
+        for trusted in results:
+            results[trusted] = max(
+                results[trusted],
+                steps_per_second(trusted, args.trials, args.seed))
+
+    for trusted, result in results.items():
+        print(f"trusted={trusted}: {result:.1f} steps/s")
+
+    print(f"speedup: {results[True] / results[False]:.3f}x")
@@ -1,5 +1,16 @@
+from __future__ import annotations
+
 import collections.abc
 
+from typing import Dict, Optional
+
+from .utils import compact_symbols
+
+_NOT_PACKED = object()
+
+# Maximum number of canonical perceptions (see `Perception.intern`)
+INTERN_POOL_SIZE = 65536
+
 
 class Perception(collections.abc.Sequence):
     """
@@ -7,24 +18,137 @@ class Perception(collections.abc.Sequence):
     By default each environment attribute is represented as `str` type.
     """
 
-    __slots__ = ['_items', 'oktypes']
+    __slots__ = ['_items', 'oktypes', '_binary', '_hash']
+
+    # Canonical perceptions keyed by observations and their storage
+    _pool: Dict = {}
 
     def __init__(self, observation, oktypes=(str,)):
         for el in observation:
             assert type(el) in oktypes
 
-        self._items = tuple(observation)
+        self._items = compact_symbols(observation)
+        self._binary = _NOT_PACKED
+        self._hash = None
+
+    @classmethod
+    def _from_tuple(cls, observation) -> Perception:
+        """
+        Internal constructor used by agents in the trusted mode
+        (see `Configuration.trusted`) - types of the observation
+        elements are not validated. They must be non-empty `str`
+        symbols, so the compact storage (see `compact_symbols`) is
+        built without examining each of them.
+
+        Parameters
+        ----------
+        observation
+            tuple of symbols (or another perception)
+
+        Returns
+        -------
+        Perception
+            perception of given observation
+        """
+        p = cls.__new__(cls)
+        if isinstance(observation, Perception):
+            p._items, p._binary = observation._items, observation._binary
+        elif type(observation) is str:
+            p._items, p._binary = observation, _NOT_PACKED
+        else:
+            symbols = tuple(observation)
+            items = ''.join(symbols)
+
+            # Joined symbols are longer only if some is multi-character
+            p._items = items if len(items) == len(symbols) else symbols
+            p._binary = _NOT_PACKED
+
+        p._hash = None
+        return p
+
+    @classmethod
+    def intern(cls, observation, trusted: bool = False) -> Perception:
+        """
+        Returns the canonical perception of given observation - the same
+        object is returned for all equal observations, so wrapping
+        a repeated state allocates nothing. Its hash is precomputed
+        and comparison with itself is an identity check.
+
+        The pool of canonical perceptions is bounded and cleared when
+        it gets full (perceptions returned before remain valid).
+
+        Parameters
+        ----------
+        observation
+            tuple of symbols (or another perception)
+        trusted: bool
+            skip validation of a new observation (see `_from_tuple`)
+
+        Returns
+        -------
+        Perception
+            canonical perception
+        """
+        if type(observation) is cls:
+            if observation._hash is not None:
+                return observation
+            key = observation._items
+        elif type(observation) is tuple or type(observation) is str:
+            key = observation
+        else:
+            key = tuple(observation)
+
+        p = cls._pool.get(key)
+        if p is not None:
+            return p
+
+        p = cls._from_tuple(observation) if trusted else cls(observation)
+        p._hash = hash(p._items)
+
+        if len(cls._pool) >= INTERN_POOL_SIZE:
+            cls._pool.clear()
+
+        # Registered under the storage too, so that observations
+        # in other forms (i.e. a tuple and a string) share the perception
+        cls._pool[key] = p
+        cls._pool.setdefault(p._items, p)
+        return p
 
     @classmethod
     def empty(cls):
         return cls([], oktypes=(None,))
 
+    @property
+    def binary(self) -> Optional[int]:
+        """
+        Returns
+        -------
+        Optional[int]
+            perception packed into an integer (first attribute being the most
+            significant bit) if it is composed only of '0' and '1' symbols,
+            None otherwise. Computed once per perception.
+        """
+        if self._binary is _NOT_PACKED:
+            items = self._items
+            if type(items) is str and items and not items.strip('01'):
+                self._binary = int(items, 2)
+            else:
+                self._binary = None
+
+        return self._binary
+
     def __hash__(self):
+        if self._hash is not None:
+            return self._hash
+
         return hash(self._items)
 
     def __getitem__(self, i):
         return self._items[i]
 
+    def __iter__(self):
+        return iter(self._items)
+
     def __len__(self) -> int:
         return len(self._items)
 
@@ -32,6 +156,14 @@ class Perception(collections.abc.Sequence):
         return ' '.join(map(str, self))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
+        if type(other) is Perception and type(self._items) is str \
+                and type(other._items) is str \
+                and len(self._items) == len(other._items):
+            return self._items == other._items
+
         for si, oi in zip(self, other):
             if si != oi:
                 return False
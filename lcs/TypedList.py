@@ -1,24 +1,92 @@
 import collections.abc
+from typing import Iterable, List
 
 from . import check_types
 
 
 class TypedList(collections.abc.MutableSequence):
 
-    __slots__ = ['_items', 'oktypes']
+    __slots__ = ['_items', 'oktypes', '_version', '_shared']
 
     def __init__(self, *args, oktypes):
         self._items = list()
         self.oktypes = oktypes
+        self._version = 0
+        self._shared = False
 
         for el in args:
             check_types(oktypes, el)
 
         self._items.extend(list(args))
 
+    @property
+    def version(self) -> int:
+        """
+        Returns
+        -------
+        int
+            counter incremented on every modification of the list
+        """
+        return self._version
+
+    @classmethod
+    def view(cls, items: List, **kwargs):
+        """
+        Creates a list over the given storage without copying it and
+        without checking types of its items (they must be trusted).
+
+        The storage is shared until the first modification of the list
+        (copy-on-write), so its owner must not modify it either.
+
+        Parameters
+        ----------
+        items: List
+            storage to be shared
+        kwargs
+            passed to the constructor
+
+        Returns
+        -------
+        TypedList
+            list sharing given storage
+        """
+        lst = cls(**kwargs)
+        lst._items = items
+        lst._shared = True
+        return lst
+
     def insert(self, index: int, o) -> None:
         check_types(self.oktypes, o)
+        self._insert(index, o)
+
+    def extend(self, values: Iterable) -> None:
+        if values is self:
+            values = list(values)
+
+        if not isinstance(values, TypedList) or not self._accepts(values):
+            super().extend(values)
+            return
+
+        # Items of such a list were already checked
+        for o in values:
+            self._insert(len(self._items), o)
+
+    def _insert(self, index: int, o) -> None:
+        # Inserts the item which type was already checked
+        self._own()
         self._items.insert(index, o)
+        self._version += 1
+
+    def _accepts(self, lst) -> bool:
+        oktypes = lst.oktypes if isinstance(lst.oktypes, tuple) \
+            else (lst.oktypes,)
+        return all(issubclass(t, self.oktypes) for t in oktypes)
+
+    def _own(self) -> None:
+        # Copies the shared storage before it gets modified
+        if self._shared:
+            self._items = list(self._items)
+            self._shared = False
 
     def safe_remove(self, o) -> None:
         try:
@@ -27,17 +95,23 @@ class TypedList(collections.abc.MutableSequence):
             pass
 
     def sort(self, *args, **kwargs) -> None:
+        self._own()
         self._items.sort(*args, **kwargs)
+        self._version += 1
 
     def __repr__(self):
         return f"{len(self._items)} items"
 
     def __setitem__(self, i, o):
         check_types(self.oktypes, o)
+        self._own()
         self._items[i] = o
+        self._version += 1
 
     def __delitem__(self, i):
+        self._own()
         del self._items[i]
+        self._version += 1
 
     def __getitem__(self, i):
         return self._items[i]
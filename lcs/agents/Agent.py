@@ -2,7 +2,7 @@ import logging
 from collections import namedtuple
 from typing import Callable, List, Tuple
 
-from lcs.metrics import basic_metrics
+from lcs.metrics import basic_metrics, match_set_cache_metrics
 
 import numpy as np
 
@@ -25,6 +25,22 @@ class Agent:
     def get_cfg(self):
         raise NotImplementedError()
 
+    def get_match_set_cache(self):
+        """
+        Returns
+        -------
+        MatchSetCache
+            cache of match sets consulted by the agent (or None)
+        """
+        return None
+
+    def _form_match_set(self, situation):
+        cache = self.get_match_set_cache()
+        if cache is not None:
+            return cache.get(situation)
+
+        return self.get_population().form_match_set(situation)
+
     def explore(self, env, trials, decay: bool = False) -> Tuple:
         """
         Explores the environment in given set of trials.
@@ -126,6 +142,10 @@ class Agent:
             if current_trial % self.get_cfg().metrics_trial_frequency == 0:
                 m = basic_metrics(current_trial, steps_in_trial, reward)
 
+                cache = self.get_match_set_cache()
+                if cache is not None:
+                    m.update(match_set_cache_metrics(cache))
+
                 user_metrics = self.get_cfg().user_metrics_collector_fcn
                 if user_metrics is not None:
                     m.update(user_metrics(self.get_population(), env))
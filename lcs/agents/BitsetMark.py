@@ -0,0 +1,238 @@
+import collections.abc
+import weakref
+from typing import Dict, Iterable, Iterator, List, Set
+
+from lcs import TypedList
+
+
+class BitsetMark(TypedList):
+    """
+    Base of classifier marks - for each attribute the set of values
+    perceived in situations in which the classifier was not working
+    correctly.
+
+    Each set is stored as an integer bitmask. Bit positions are assigned
+    to values on their first use and shared by all the marks with the same
+    configuration (subclasses might map values to positions directly).
+    Bitmasks are allocated only when something gets marked, whether
+    the mark is specified at any attribute is cached.
+    Items of the mark are set-like views of the bitmasks, iterating over
+    the mark yields sets of marked values.
+    """
+    __slots__ = ['cfg', '_marked', '_frozen', '_positions', '_values']
+
+    # Empty marks shared by the classifiers (see `shared_empty`)
+    _empty = weakref.WeakKeyDictionary()
+
+    # Bit positions of values (and values at bit positions) assigned
+    # separately for each configuration
+    _tables = weakref.WeakKeyDictionary()
+
+    def __init__(self, cfg) -> None:
+        self.cfg = cfg
+        self._marked = False
+        self._frozen = False
+        super().__init__(oktypes=(int,))
+
+        table = BitsetMark._tables.setdefault(cfg, ({}, []))
+        self._positions: Dict = table[0]
+        self._values: List = table[1]
+
+    @classmethod
+    def shared_empty(cls, cfg):
+        """
+        Returns the empty mark shared by all the classifiers (with given
+        configuration) that were never marked. It can't be modified -
+        classifier replaces it with its own mark when it gets marked.
+
+        Parameters
+        ----------
+        cfg
+            configuration
+
+        Returns
+        -------
+        BitsetMark
+            shared empty mark
+        """
+        marks = BitsetMark._empty.setdefault(cfg, {})
+        if cls not in marks:
+            mark = cls(cfg)
+            mark._frozen = True
+            marks[cls] = mark
+
+        return marks[cls]
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True for the shared empty mark (see `shared_empty`)
+        """
+        return self._frozen
+
+    def _position(self, value) -> int:
+        """
+        Returns bit position representing given value.
+        """
+        position = self._positions.get(value)
+        if position is None:
+            position = self._positions[value] = len(self._values)
+            self._values.append(value)
+
+        return position
+
+    def _value(self, position: int):
+        """
+        Returns value represented by given bit position.
+        """
+        return self._values[position]
+
+    def is_marked(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            If mark is specified at any attribute
+        """
+        return self._marked
+
+    def bits(self, idx: int) -> int:
+        """
+        Parameters
+        ----------
+        idx: int
+            attribute index
+
+        Returns
+        -------
+        int
+            bitmask of values marked at given attribute
+        """
+        return self._items[idx] if self._items else 0
+
+    def mark(self, idx: int, value) -> bool:
+        """
+        Marks the value at given attribute.
+
+        Returns
+        -------
+        bool
+            True if the value was not marked before
+        """
+        if self._frozen:
+            raise TypeError("Shared empty mark can't be modified")
+
+        bit = 1 << self._position(value)
+        if not self._items:
+            self._items = [0] * self.cfg.classifier_length
+
+        if self._items[idx] & bit:
+            return False
+
+        self._items[idx] |= bit
+        self._marked = True
+        self._version += 1
+        return True
+
+    def unmark(self, idx: int, value) -> None:
+        """
+        Removes the value (if present) from the given attribute.
+        """
+        if self._frozen:
+            raise TypeError("Shared empty mark can't be modified")
+
+        if self._items:
+            self._items[idx] &= ~(1 << self._position(value))
+            self._marked = any(self._items)
+            self._version += 1
+
+    def values(self, idx: int) -> Iterator:
+        """
+        Iterates over values marked at given attribute
+        (in the order of bit positions).
+        """
+        bits = self.bits(idx)
+        while bits:
+            lowest = bits & -bits
+            yield self._value(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    def _extend(self, idx: int, bit: int) -> bool:
+        # Marks the bit at already marked attribute only
+        bits = self._items[idx] if self._items else 0
+        if not bits or bits & bit:
+            return False
+
+        self._items[idx] = bits | bit
+        self._version += 1
+        return True
+
+    def __getitem__(self, i):
+        return MarkedValues(self, range(len(self))[i])
+
+    def __iter__(self) -> Iterator[Set]:
+        return (set(self.values(idx)) for idx in range(len(self)))
+
+    def __len__(self) -> int:
+        return self.cfg.classifier_length
+
+    def __setitem__(self, i, values: Iterable) -> None:
+        i = range(len(self))[i]
+        for value in list(self.values(i)):
+            self.unmark(i, value)
+        for value in values:
+            self.mark(i, value)
+
+    def __delitem__(self, i):
+        raise TypeError("Mark has a fixed length")
+
+    def _insert(self, index: int, o) -> None:
+        raise TypeError("Mark has a fixed length")
+
+    def _all_bits(self) -> List[int]:
+        return [self.bits(idx) for idx in range(len(self))]
+
+    def __hash__(self):
+        return hash(tuple(self._all_bits()))
+
+    def __eq__(self, o) -> bool:
+        return isinstance(o, BitsetMark) and \
+            self._all_bits() == o._all_bits()
+
+
+class MarkedValues(collections.abc.MutableSet):
+    """
+    Set-like view of values marked at a single attribute of the mark.
+    """
+
+    __slots__ = ['_mark', '_idx']
+
+    def __init__(self, mark: BitsetMark, idx: int) -> None:
+        self._mark = mark
+        self._idx = idx
+
+    def __contains__(self, value) -> bool:
+        return bool(self._mark.bits(self._idx) >> self._mark._position(value)
+                    & 1)
+
+    def __iter__(self) -> Iterator:
+        return self._mark.values(self._idx)
+
+    def __len__(self) -> int:
+        return bin(self._mark.bits(self._idx)).count('1')
+
+    def add(self, value) -> None:
+        self._mark.mark(self._idx, value)
+
+    def discard(self, value) -> None:
+        self._mark.unmark(self._idx, value)
+
+    def update(self, values: Iterable) -> None:
+        for value in values:
+            self.add(value)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
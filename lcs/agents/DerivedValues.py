@@ -0,0 +1,52 @@
+from typing import Any, Callable
+
+
+class DerivedValues:
+    """
+    Mixin caching values derived from the attributes of a sequence
+    (i.e. specificity). Classes using it declare the `_derived` attribute
+    and call `forget_derived` whenever the attributes change.
+    """
+    __slots__ = ()
+
+    # Debug mode - each cached derived value is compared with a fresh
+    # recomputation whenever it is read
+    verify_derived = False
+
+    def derived(self, name: str, compute: Callable[[Any], Any]):
+        """
+        Returns the value derived from the attributes of this sequence.
+        It is computed once and kept until the sequence gets modified.
+
+        Parameters
+        ----------
+        name: str
+            name of the derived value
+        compute: Callable[[Any], Any]
+            function computing the value from the sequence
+
+        Returns
+        -------
+        Any
+            derived value
+        """
+        derived = self._derived
+        if derived is None:
+            derived = self._derived = {}
+        elif name in derived:
+            value = derived[name]
+            if DerivedValues.verify_derived and value != compute(self):
+                raise AssertionError(
+                    f"Cached {name} of {self!r} is not up to date")
+
+            return value
+
+        value = derived[name] = compute(self)
+        return value
+
+    def forget_derived(self) -> None:
+        """
+        Discards all the cached derived values. Has to be called when
+        attributes were modified in place (i.e. interval bounds widened).
+        """
+        self._derived = None
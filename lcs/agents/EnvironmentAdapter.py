@@ -47,3 +47,38 @@ class EnvironmentAdapter:
         representation.
         """
         return genotype
+
+    @classmethod
+    def with_symbol_table(cls, symbol_table):
+        """
+        Creates an adapter translating states produced by this adapter into
+        compact one-byte symbol codes (and back).
+
+        Parameters
+        ----------
+        symbol_table: SymbolTable
+            table used for interning symbols
+
+        Returns
+        -------
+        EnvironmentAdapter
+            adapter class to be passed to the agent configuration
+        """
+        base = cls
+
+        class SymbolTableAdapter(base):
+            table = symbol_table
+
+            @classmethod
+            def to_genotype(cls, phenotype):
+                genotype = base.to_genotype(phenotype)
+                if genotype is None:
+                    return None
+
+                return cls.table.encode(genotype)
+
+            @classmethod
+            def to_phenotype(cls, genotype):
+                return base.to_phenotype(cls.table.decode(genotype))
+
+        return SymbolTableAdapter
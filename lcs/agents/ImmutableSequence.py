@@ -1,18 +1,71 @@
+import sys
 from copy import copy
+from typing import Any, Dict
 
+from lcs.utils import compact_symbols
+from .DerivedValues import DerivedValues
 
-class ImmutableSequence:
+
+class ImmutableSequence(DerivedValues):
+    # `_listeners` - objects notified (`sequence_changed(seq)`) after
+    # each modification, `_derived` - values computed from the storage
+    # (see `derived`)
+    __slots__ = ['_items', '_listeners', '_derived']
 
     WILDCARD = '#'
     OK_TYPES = (str, dict)  # PEEs are stored in dict
 
     def __init__(self, observation):
-        obs = tuple(observation)
+        self._listeners = ()
+        self._derived = None
+
+        if isinstance(observation, ImmutableSequence):
+            # Storage is never modified in place - it is shared with
+            # the copy until either of the sequences gets modified
+            # (so are the values derived from it)
+            self._items = observation._items
+            self._derived = observation._derived
+            return
+
+        obs = compact_symbols(observation)
 
         assert type(self.WILDCARD) in self.OK_TYPES
         assert all(isinstance(o, self.OK_TYPES) for o in obs)
 
-        self._items = obs
+        # Sequences of one-character symbols are stored as a single
+        # (interned) `str`, so that identical sequences share it
+        self._items = sys.intern(obs) if type(obs) is str else obs
+
+    @classmethod
+    def _unchecked(cls, observation):
+        """
+        Internal constructor used by agents in the trusted mode
+        (see `Configuration.trusted`) - symbols are not validated.
+
+        Parameters
+        ----------
+        observation
+            sequence of symbols
+
+        Returns
+        -------
+        ImmutableSequence
+            sequence of given symbols
+        """
+        seq = cls.__new__(cls)
+        seq._listeners = ()
+        seq._derived = None
+
+        if isinstance(observation, ImmutableSequence):
+            obs = observation._items
+            seq._derived = observation._derived
+        elif type(observation) is str:
+            obs = observation
+        else:
+            obs = compact_symbols(observation)
+
+        seq._items = sys.intern(obs) if type(obs) is str else obs
+        return seq
 
     @classmethod
     def empty(cls, length: int):
@@ -35,6 +88,26 @@ class ImmutableSequence:
         """
         raise NotImplementedError()
 
+    def add_listener(self, listener) -> None:
+        """
+        Registers an object which `sequence_changed(seq)` method will be
+        called each time an attribute of this sequence is modified.
+        Used by population indexes to stay in sync with in-place edits.
+
+        Parameters
+        ----------
+        listener
+            object implementing `sequence_changed` method
+        """
+        self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener) -> None:
+        for idx, registered in enumerate(self._listeners):
+            if registered is listener:
+                self._listeners = \
+                    self._listeners[:idx] + self._listeners[idx + 1:]
+                break
+
     def __iter__(self):
         return iter(self._items)
 
@@ -45,14 +118,54 @@ class ImmutableSequence:
         return self._items[index]
 
     def __setitem__(self, index, value):
-        assert isinstance(value, self.OK_TYPES)
-        lst = list(self._items)
-        lst[index] = value
+        self.set_many({index: value})
+
+    def set_many(self, edits: Dict[int, Any]) -> None:
+        """
+        Modifies multiple attributes at once. The sequence is rebuilt
+        (and listeners are notified) only once, no matter how many
+        attributes are changed.
+
+        Parameters
+        ----------
+        edits: Dict[int, Any]
+            new values of attributes at given positions
+        """
+        if not edits:
+            return
+
+        assert all(isinstance(v, self.OK_TYPES) for v in edits.values())
+
+        items = self._items
+        symbols = type(items) is str and \
+            all(type(v) is str and len(v) == 1 for v in edits.values())
+
+        if symbols and len(edits) == 1:
+            # Single symbol is spliced into the compact storage
+            [(idx, value)] = edits.items()
+            idx = range(len(items))[idx]
+            self._items = sys.intern(items[:idx] + value + items[idx + 1:])
+        else:
+            lst = list(items)
+            for idx, value in edits.items():
+                lst[idx] = value
+
+            items = ''.join(lst) if symbols else compact_symbols(lst)
+            self._items = sys.intern(items) if type(items) is str else items
 
-        self._items = tuple(lst)
+        self.forget_derived()
+        for listener in self._listeners:
+            listener.sequence_changed(self)
 
     def __eq__(self, other):
-        return self._items == other._items
+        items, other_items = self._items, other._items
+        if type(items) is str and type(other_items) is str:
+            return items == other_items
+
+        # Attributes are compared one by one - enhanced attributes
+        # (see `ProbabilityEnhancedAttribute`) might equal plain symbols
+        return len(items) == len(other_items) and \
+            all(a == b for a, b in zip(items, other_items))
 
     def __hash__(self):
         return hash(self._items)
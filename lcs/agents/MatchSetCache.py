@@ -0,0 +1,76 @@
+from collections import OrderedDict
+
+from lcs import Perception
+
+
+class MatchSetCache:
+    """
+    Bounded LRU cache of match sets formed from a single population.
+
+    Match sets are stored under the perception they were formed for.
+    Whenever the version of the population changes (classifier
+    was added, removed or its condition was modified) all the entries
+    are discarded. The cache pays off when the same states are visited
+    repeatedly without modifying the population (i.e. exploitation or
+    action planning).
+
+    Note that in-place modifications of conditions must be reflected
+    in the population version (see `ClassifiersList.track_conditions`).
+    """
+
+    def __init__(self, population, maxsize: int = 256) -> None:
+        self.population = population
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._version = population.version
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, situation: Perception):
+        """
+        Returns the match set for given situation, forming it with
+        the population if it is not present in the cache.
+
+        Parameters
+        ----------
+        situation: Perception
+            current situation
+
+        Returns
+        -------
+        ClassifiersList
+            fresh list of matching classifiers (might be freely modified)
+        """
+        if self._version != self.population.version:
+            self._entries.clear()
+            self._version = self.population.version
+
+        # Raw observations (i.e. real-valued vectors) might not be
+        # hashable at all. Canonical perceptions (see `Perception.intern`)
+        # have their hash precomputed and are compared by identity.
+        key = situation if isinstance(situation, Perception) \
+            else tuple(situation)
+        match_set = self._entries.get(key)
+
+        if match_set is None:
+            self.misses += 1
+            match_set = self.population.form_match_set(situation)
+            self._entries[key] = match_set
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        return match_set.subset(match_set._items)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,252 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from lcs.agents.PopulationIndex import PopulationIndex
+
+
+class StoredParameter:
+    """
+    Descriptor of a classifier learning parameter. The value is kept
+    in the `_<name>` slot of the classifier, or in a `ParameterStore`
+    column (at the row of the classifier) once the classifier has been
+    adopted by the store (its `_params` and `_row` are attached).
+
+    Parameters
+    ----------
+    dtype: type
+        `float` or `int`
+    nullable: bool
+        whether the parameter might be None (it is then kept in a float
+        column, None being represented as NaN)
+    """
+
+    def __init__(self, dtype: type, nullable: bool = False) -> None:
+        self.dtype = dtype
+        self.nullable = nullable
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+        # Accessors of the slot keeping the value outside of the store
+        slot = getattr(owner, '_' + name)
+        self._get_slot, self._set_slot = slot.__get__, slot.__set__
+
+    @property
+    def column_dtype(self) -> type:
+        return np.float64 if self.dtype is float or self.nullable \
+            else np.int64
+
+    def __get__(self, cl, owner=None):
+        if cl is None:
+            return self
+
+        store = cl._params
+        if store is None:
+            return self._get_slot(cl)
+
+        value = store._columns[self.name].item(cl._row)
+        if self.nullable:
+            return None if value != value else self.dtype(value)
+
+        return value
+
+    def __set__(self, cl, value) -> None:
+        store = cl._params
+        if store is None:
+            self._set_slot(cl, value)
+            return
+
+        store._columns[self.name][cl._row] = np.nan if value is None \
+            else value
+
+
+def stored_parameters(cls: type) -> Dict[str, StoredParameter]:
+    """
+    Parameters
+    ----------
+    cls: type
+        classifier type
+
+    Returns
+    -------
+    Dict[str, StoredParameter]
+        stored parameters of the classifier type (including inherited)
+    """
+    return {name: attr
+            for klass in reversed(cls.__mro__)
+            for name, attr in vars(klass).items()
+            if isinstance(attr, StoredParameter)}
+
+
+class ParameterStore(PopulationIndex):
+    """
+    Struct-of-arrays storage of classifier learning parameters.
+
+    For each parameter (`StoredParameter` of the `classifier_type`)
+    a NumPy column is kept. Every classifier of the population gets a row
+    (released rows are reused) and from then on its parameters are read
+    from and written to the columns. Classifiers get their values back
+    into their own attributes once their last occurrence is removed
+    from the population.
+
+    Parameters of a whole set of classifiers can be then processed
+    with vectorized operations (see `rows`).
+
+    Attach it to the population with `ClassifiersList.attach_index`.
+    """
+
+    def __init__(self, classifier_type: type, capacity: int = 64) -> None:
+        self.fields = stored_parameters(classifier_type)
+
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=field.column_dtype)
+            for name, field in self.fields.items()}
+        self._free: List[int] = list(reversed(range(capacity)))
+        self._members: Dict[int, object] = {}
+
+        # Number of occurrences of the members in the population by rows
+        self._occurrences: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Parameters
+        ----------
+        name: str
+            parameter name
+
+        Returns
+        -------
+        np.ndarray
+            whole column of given parameter (to be indexed with `rows`)
+        """
+        return self._columns[name]
+
+    def rows(self, classifiers: Iterable) -> Optional[np.ndarray]:
+        """
+        Parameters
+        ----------
+        classifiers: Iterable
+            classifiers (i.e. match or action set)
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            rows of given classifiers, None if some of them
+            is not kept in this store
+        """
+        rows = []
+        for cl in classifiers:
+            if cl._params is not self:
+                return None
+            rows.append(cl._row)
+
+        return np.array(rows, dtype=np.intp)
+
+    def adopt(self, cl) -> None:
+        """
+        Moves parameters of given classifier into the store.
+        """
+        if cl._params is not None:
+            return
+
+        if not self._free:
+            self._grow()
+
+        row = self._free.pop()
+        for name, column in self._columns.items():
+            value = getattr(cl, name)
+            column[row] = np.nan if value is None else value
+
+        cl._params, cl._row = self, row
+        self._members[row] = cl
+        self._occurrences[row] = 0
+
+    def release(self, cl) -> None:
+        """
+        Moves parameters of given classifier out of the store.
+        """
+        if cl._params is not self:
+            return
+
+        values = {name: getattr(cl, name) for name in self.fields}
+        row = cl._row
+
+        cl._params = cl._row = None
+        for name, value in values.items():
+            setattr(cl, name, value)
+
+        del self._members[row]
+        del self._occurrences[row]
+        self._free.append(row)
+
+    def rebuild(self, population) -> None:
+        present = {id(cl) for cl in population}
+        for cl in [cl for cl in self._members.values()
+                   if id(cl) not in present]:
+            self.release(cl)
+
+        for row in self._occurrences:
+            self._occurrences[row] = 0
+
+        for cl in population:
+            self.insert(0, cl)
+
+    def insert(self, idx: int, cl) -> None:
+        self.adopt(cl)
+        if cl._params is self:
+            self._occurrences[cl._row] += 1
+
+    def remove(self, idx: int, cl) -> None:
+        if cl._params is not self:
+            return
+
+        # The same classifier might still be present at other position
+        self._occurrences[cl._row] -= 1
+        if not self._occurrences[cl._row]:
+            self.release(cl)
+
+    def update(self, idx: int, cl) -> None:
+        pass
+
+    def _grow(self) -> None:
+        capacity = len(next(iter(self._columns.values())))
+        new_capacity = max(2 * capacity, 1)
+
+        for name, column in self._columns.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:capacity] = column
+            self._columns[name] = grown
+
+        self._free.extend(reversed(range(capacity, new_capacity)))
+
+
+def stored_rows(classifiers) -> Tuple[Optional[ParameterStore],
+                                      Optional[np.ndarray]]:
+    """
+    Finds the store keeping parameters of all given classifiers.
+
+    Parameters
+    ----------
+    classifiers
+        non-empty set of classifiers
+
+    Returns
+    -------
+    Tuple[Optional[ParameterStore], Optional[np.ndarray]]
+        store and rows of the classifiers, (None, None) if they are
+        not kept in a single store
+    """
+    store = getattr(next(iter(classifiers)), '_params', None)
+    if not isinstance(store, ParameterStore):
+        return None, None
+
+    rows = store.rows(classifiers)
+    if rows is None:
+        return None, None
+
+    return store, rows
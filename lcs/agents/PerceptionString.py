@@ -4,9 +4,17 @@ from copy import copy
 from typing import Any, Tuple
 
 from lcs import TypedList
+from .DerivedValues import DerivedValues
 
 
-class PerceptionString(TypedList):
+class PerceptionString(DerivedValues, TypedList):
+
+    # Objects notified (`sequence_changed(seq)`) after each assignment.
+    # Instance attribute is created on first subscription.
+    _listeners: tuple = ()
+
+    # Values computed from the attributes (see `derived`)
+    _derived = None
 
     def __init__(self, observation, wildcard='#', oktypes=(str,)):
         super().__init__(*observation, oktypes=oktypes)
@@ -40,6 +48,26 @@ class PerceptionString(TypedList):
         ps_str = [copy(wildcard) for _ in range(length)]
         return cls(ps_str, wildcard=wildcard, oktypes=oktypes)
 
+    def add_listener(self, listener) -> None:
+        """
+        Registers an object which `sequence_changed(seq)` method will be
+        called each time an attribute of this sequence is replaced.
+        Used by population indexes to stay in sync with in-place edits.
+
+        Parameters
+        ----------
+        listener
+            object implementing `sequence_changed(seq)`
+        """
+        self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener) -> None:
+        for idx, registered in enumerate(self._listeners):
+            if registered is listener:
+                self._listeners = \
+                    self._listeners[:idx] + self._listeners[idx + 1:]
+                break
+
     def subsumes(self, other) -> bool:
         """
         Checks if given perception string subsumes other one.
@@ -56,6 +84,20 @@ class PerceptionString(TypedList):
         """
         raise NotImplementedError()
 
+    def _insert(self, index: int, o) -> None:
+        super()._insert(index, o)
+        self.forget_derived()
+
+    def __setitem__(self, i, o):
+        super().__setitem__(i, o)
+        self.forget_derived()
+        for listener in self._listeners:
+            listener.sequence_changed(self)
+
+    def __delitem__(self, i):
+        super().__delitem__(i)
+        self.forget_derived()
+
     def __eq__(self, other):
         return self._items == other._items
 
@@ -0,0 +1,105 @@
+from typing import Iterable
+
+
+class PopulationIndex:
+    """
+    Auxiliary structure kept in sync with a population of classifiers.
+
+    Once attached to a population (see `ClassifiersList.attach_index`) it
+    gets notified about every insertion, removal and in-place modification
+    of the classifiers. Positions passed to the callbacks always correspond
+    to the position of the classifier inside the population list.
+    """
+
+    def rebuild(self, population) -> None:
+        """
+        Discards current state and indexes all classifiers from
+        the population.
+
+        Parameters
+        ----------
+        population
+            list of classifiers
+        """
+        raise NotImplementedError()
+
+    def insert(self, idx: int, cl) -> None:
+        """
+        Classifier `cl` was inserted at position `idx`.
+        """
+        raise NotImplementedError()
+
+    def remove(self, idx: int, cl) -> None:
+        """
+        Classifier `cl` was removed from position `idx`.
+        """
+        raise NotImplementedError()
+
+    def update(self, idx: int, cl) -> None:
+        """
+        Classifier `cl` placed at position `idx` was modified in place.
+        """
+        raise NotImplementedError()
+
+
+class MatchingIndex(PopulationIndex):
+    """
+    Population index capable of forming the match set by itself.
+    """
+
+    def match(self, situation) -> Iterable[int]:
+        """
+        Finds classifiers which condition matches given situation.
+
+        Parameters
+        ----------
+        situation
+            perception
+
+        Returns
+        -------
+        Iterable[int]
+            ascending positions of matching classifiers in the population
+        """
+        raise NotImplementedError()
+
+
+class ContainmentIndex(PopulationIndex):
+    """
+    Population index capable of finding classifiers which condition
+    contains (or is contained by) given condition.
+    """
+
+    def containing(self, condition) -> Iterable[int]:
+        """
+        Finds classifiers which condition incorporates given condition
+        (potential subsumers).
+
+        Parameters
+        ----------
+        condition
+            condition to be contained
+
+        Returns
+        -------
+        Iterable[int]
+            ascending positions of containing classifiers in the population
+        """
+        raise NotImplementedError()
+
+    def contained(self, condition) -> Iterable[int]:
+        """
+        Finds classifiers which condition is incorporated by given
+        condition (potentially subsumed ones).
+
+        Parameters
+        ----------
+        condition
+            containing condition
+
+        Returns
+        -------
+        Iterable[int]
+            ascending positions of contained classifiers in the population
+        """
+        raise NotImplementedError()
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from lcs import TypedList
+from .PopulationIndex import PopulationIndex, MatchingIndex, \
+    ContainmentIndex
+from .SlotIndex import SlotIndex
+
+
+class PopulationList(TypedList):
+    """
+    Base of the lists of classifiers (population, match and action sets).
+
+    Classifiers are partitioned by the action they advocate and their
+    positions are looked up by identity in the slot index.
+    Once conditions of member classifiers are tracked (see
+    `track_conditions`), the attached population indexes are kept in sync
+    with all modifications of the list and in-place edits of conditions.
+    """
+
+    def __init__(self, *args, oktypes) -> None:
+        super().__init__(*args, oktypes=oktypes)
+        self._buckets: Dict[int, List] = {}
+        self._buckets_version = -1
+        self._indexes: List[PopulationIndex] = []
+        self._matcher: Optional[MatchingIndex] = None
+        self._container: Optional[ContainmentIndex] = None
+        self._tracking = False
+        self._slots = SlotIndex()
+
+        # Tracked members by the identity of their conditions
+        self._owners: Dict[int, object] = {}
+
+        # Population the list (i.e. match or action set) was formed from
+        self._source: Optional[PopulationList] = None
+
+    def track_conditions(self) -> None:
+        """
+        Subscribes to in-place modifications of conditions of all
+        (present and future) member classifiers. Each modification bumps
+        the list `version` and is propagated to the attached indexes.
+        """
+        if not self._tracking:
+            for cl in self:
+                self._listen(cl)
+            self._tracking = True
+
+    def attach_index(self, index: PopulationIndex) -> None:
+        """
+        Attaches an auxiliary index which is kept in sync with all further
+        modifications of this list (including in-place edits of classifier
+        conditions). If the index is capable of matching it is used
+        for forming the match set, if it is capable of finding
+        containing conditions - for looking up subsumers.
+
+        Parameters
+        ----------
+        index: PopulationIndex
+            index to be attached
+        """
+        self.track_conditions()
+        index.rebuild(self)
+        self._indexes.append(index)
+
+        if isinstance(index, MatchingIndex):
+            self._matcher = index
+
+        if isinstance(index, ContainmentIndex):
+            self._container = index
+
+    @property
+    def matcher(self) -> Optional[MatchingIndex]:
+        """
+        Returns
+        -------
+        Optional[MatchingIndex]
+            attached index used for forming the match set (if any)
+        """
+        return self._matcher
+
+    @property
+    def container(self) -> Optional[ContainmentIndex]:
+        """
+        Returns
+        -------
+        Optional[ContainmentIndex]
+            attached index used for looking up subsumers (if any)
+        """
+        return self._container
+
+    @property
+    def source(self) -> PopulationList:
+        """
+        Returns
+        -------
+        PopulationList
+            population the list was formed from (see `subset`),
+            the list itself for the population
+        """
+        return self._source if self._source is not None else self
+
+    def subset(self, items: List) -> PopulationList:
+        """
+        Creates a list (i.e. match or action set) over given storage
+        (see `TypedList.view`) holding members of this list.
+        It remembers the population it was formed from.
+
+        Parameters
+        ----------
+        items: List
+            storage to be shared
+
+        Returns
+        -------
+        PopulationList
+            list of the same type sharing given storage
+        """
+        lst = type(self).view(items)
+        lst._source = self.source
+        return lst
+
+    def subsumer_candidates(self, cl) -> List:
+        """
+        Returns members which condition incorporates the condition
+        of `cl` (in the order of the list) - the only ones which might
+        subsume it. They are looked up in the containment index attached
+        to the population (see `source`), all the members are returned
+        if there is none.
+
+        Parameters
+        ----------
+        cl:
+            classifier to be subsumed
+
+        Returns
+        -------
+        List
+            candidate subsumers
+        """
+        source = self.source
+        if source._container is None:
+            return self._items
+
+        candidates = [source._items[i]
+                      for i in source._container.containing(cl.condition)]
+        if source is self:
+            return candidates
+
+        members = {id(member) for member in self._items}
+        return [member for member in candidates if id(member) in members]
+
+    def condition_position(self, condition) -> int:
+        """
+        Finds the position of the member owning given (tracked) condition.
+        Used to look up the row of the condition in attached indexes.
+
+        Parameters
+        ----------
+        condition
+            condition of a member classifier
+
+        Returns
+        -------
+        int
+            position of the member, -1 if the condition is not tracked
+        """
+        cl = self._owners.get(id(condition))
+        if cl is None or cl.condition is not condition:
+            return -1
+
+        return self._slots.position(self._items, self._version, cl)
+
+    def action_buckets(self) -> Dict[int, List]:
+        """
+        Returns classifiers partitioned by the action they advocate.
+        Order of classifiers within each partition follows the list.
+        Partitions are built once and reused as long as the list
+        is not modified.
+
+        Returns
+        -------
+        Dict[int, List]
+            classifiers grouped by action
+        """
+        if self._buckets_version != self._version:
+            buckets: Dict[int, List] = {}
+            for cl in self._items:
+                buckets.setdefault(cl.action, []).append(cl)
+
+            self._buckets = buckets
+            self._buckets_version = self._version
+
+        return self._buckets
+
+    def safe_remove(self, o) -> None:
+        """
+        Removes given classifier (compared by identity) if present.
+        Its position is looked up in the slot index, so no other
+        classifiers are compared. Order of the remaining classifiers
+        is preserved.
+
+        Parameters
+        ----------
+        o:
+            classifier to be removed
+        """
+        pos = self._slots.position(self._items, self._version, o)
+        if pos >= 0:
+            del self[pos]
+
+    def _insert(self, index: int, o) -> None:
+        version = self._version
+        size = len(self._items)
+        super()._insert(index, o)
+
+        if index >= size:
+            self._slots.appended(o, version, self._version)
+
+        if not self._tracking:
+            return
+
+        # Normalize position the same way `list.insert` does
+        if index < 0:
+            index = max(index + size, 0)
+        index = min(index, size)
+
+        self._listen(o)
+        for pop_index in self._indexes:
+            pop_index.insert(index, o)
+
+    def __setitem__(self, i, o):
+        if not self._tracking:
+            super().__setitem__(i, o)
+            return
+
+        i = range(len(self._items))[i]
+        old = self._items[i]
+        super().__setitem__(i, o)
+
+        self._unlisten(old)
+        self._listen(o)
+        for pop_index in self._indexes:
+            pop_index.remove(i, old)
+            pop_index.insert(i, o)
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            removed = self._items[i]
+            super().__delitem__(i)
+            if self._tracking:
+                for cl in removed:
+                    self._unlisten(cl)
+                for pop_index in self._indexes:
+                    pop_index.rebuild(self)
+            return
+
+        i = range(len(self._items))[i]
+        version = self._version
+        old = self._items[i]
+        super().__delitem__(i)
+        self._slots.removed(i, old, version, self._version)
+
+        if self._tracking:
+            self._unlisten(old)
+            for pop_index in self._indexes:
+                pop_index.remove(i, old)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        for pop_index in self._indexes:
+            pop_index.rebuild(self)
+
+    def sequence_changed(self, seq) -> None:
+        """
+        Called when condition of a member classifier was modified in place.
+        The member is found by its condition and its position is looked up
+        in the slot index.
+        """
+        version = self._version
+        self._version += 1
+        self._slots.modified(version, self._version)
+
+        if not self._indexes:
+            return
+
+        cl = self._owners.get(id(seq))
+        for pos in self._slots.positions(self._items, self._version, cl):
+            for pop_index in self._indexes:
+                pop_index.update(pos, cl)
+
+    def _listen(self, cl) -> None:
+        cl.condition.add_listener(self)
+        self._owners[id(cl.condition)] = cl
+
+    def _unlisten(self, cl) -> None:
+        cl.condition.remove_listener(self)
+
+        # The same classifier might still be present at other position
+        if self._slots.position(self._items, self._version, cl) < 0:
+            self._owners.pop(id(cl.condition), None)
@@ -0,0 +1,128 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+
+class SlotIndex:
+    """
+    Identity-based positions of items stored in a list.
+
+    Each item gets a stable slot number, increasing with the order of items
+    in the list, so the position of an item is found by bisection instead
+    of comparing it with all the preceding items. Slots are never reused,
+    therefore removal does not disturb numbers of other items.
+
+    The index follows the list `version` - appending and removing
+    single items is applied incrementally, other modifications cause
+    a rebuild on the next lookup.
+
+    It only locates items - the list keeps its order, so removing an
+    item still shifts the following ones (and their slots). A match or
+    an action set builds its slots on the first lookup after it is
+    formed.
+    """
+
+    def __init__(self) -> None:
+        self._slots: List[int] = []
+        self._slot_of: Dict[int, int] = {}
+        self._next = 0
+        self._version: Optional[int] = None
+
+    def position(self, items: Sequence, version: int, o) -> int:
+        """
+        Finds the position of the object `o` (compared by identity).
+
+        Parameters
+        ----------
+        items: Sequence
+            list items
+        version: int
+            current version of the list
+        o
+            object to look for
+
+        Returns
+        -------
+        int
+            position of the object, -1 if it is not present
+        """
+        if self._version != version and not self._rebuild(items, version):
+            return next((pos for pos, item in enumerate(items)
+                         if item is o), -1)
+
+        slot = self._slot_of.get(id(o))
+        if slot is None:
+            return -1
+
+        return bisect_left(self._slots, slot)
+
+    def positions(self, items: Sequence, version: int, o) -> List[int]:
+        """
+        Finds all the positions of the object `o` (compared by identity).
+        There is more than one only if the object is present in the list
+        many times.
+
+        Parameters
+        ----------
+        items: Sequence
+            list items
+        version: int
+            current version of the list
+        o
+            object to look for
+
+        Returns
+        -------
+        List[int]
+            ascending positions of the object
+        """
+        if self._version != version and not self._rebuild(items, version):
+            return [pos for pos, item in enumerate(items) if item is o]
+
+        pos = self.position(items, version, o)
+        return [pos] if pos >= 0 else []
+
+    def appended(self, o, version: int, new_version: int) -> None:
+        """
+        Object `o` was appended to the list changing its version.
+        """
+        if self._version != version:
+            return
+
+        if id(o) in self._slot_of:
+            self._version = None
+            return
+
+        self._slot_of[id(o)] = self._next
+        self._slots.append(self._next)
+        self._next += 1
+        self._version = new_version
+
+    def removed(self, pos: int, o, version: int, new_version: int) -> None:
+        """
+        Object `o` was removed from position `pos` changing list version.
+        """
+        if self._version != version:
+            return
+
+        del self._slot_of[id(o)]
+        del self._slots[pos]
+        self._version = new_version
+
+    def modified(self, version: int, new_version: int) -> None:
+        """
+        Items were modified in place (without moving) changing list version.
+        """
+        if self._version == version:
+            self._version = new_version
+
+    def _rebuild(self, items: Sequence, version: int) -> bool:
+        self._slot_of = {id(item): slot for slot, item in enumerate(items)}
+        if len(self._slot_of) != len(items):
+            # The same object is present more than once
+            self._version = None
+            return False
+
+        self._slots = list(range(len(items)))
+        self._next = len(items)
+        self._version = version
+        return True
@@ -0,0 +1,86 @@
+from typing import Dict, Hashable, Iterable, List
+
+# Order in which codes are handed out - starting from '0' keeps small
+# alphabets readable when classifiers are printed
+_CODES = [chr(i) for i in range(ord('0'), 256)] + \
+         [chr(i) for i in range(0, ord('0'))]
+
+
+class SymbolTable:
+    """
+    Interns environment symbols into one-byte codes.
+
+    Each distinct symbol observed in the environment gets its own code
+    (a one-character string with ordinal in range [0, 255]) assigned
+    on the fly. The wildcard code is reserved and never assigned.
+    One-character string symbols are coded as themselves whenever possible.
+
+    Encoded perceptions (and conditions/effects built from them) are stored
+    as a single `str` with one byte per attribute, so they are compared
+    byte-wise.
+    """
+
+    def __init__(self, wildcard: str = '#') -> None:
+        self.wildcard = wildcard
+        self._codes: Dict[Hashable, str] = {}
+        self._symbols: Dict[str, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def code(self, symbol: Hashable) -> str:
+        """
+        Returns the code of given symbol, assigning a new one if needed.
+
+        Raises
+        ------
+        ValueError
+            if the alphabet does not fit into one byte
+        """
+        code = self._codes.get(symbol)
+        if code is None:
+            code = self._next_code(symbol)
+            self._codes[symbol] = code
+            self._symbols[code] = symbol
+
+        return code
+
+    def symbol(self, code: str) -> Hashable:
+        """
+        Returns the environment symbol represented by given code.
+        """
+        if code == self.wildcard:
+            return self.wildcard
+
+        return self._symbols[code]
+
+    def encode(self, observation: Iterable[Hashable]) -> str:
+        """
+        Translates the environment observation into compact string of codes.
+        """
+        codes = self._codes
+        return ''.join([codes.get(s) or self.code(s) for s in observation])
+
+    def decode(self, encoded: Iterable[str]) -> List[Hashable]:
+        """
+        Translates codes (i.e. perception, condition or effect) back into
+        the environment symbols. Wildcards are left untouched.
+        """
+        return [self.symbol(c) for c in encoded]
+
+    def decode_str(self, encoded: Iterable[str]) -> str:
+        """
+        Returns human-readable representation of encoded sequence.
+        """
+        return ''.join(map(str, self.decode(encoded)))
+
+    def _next_code(self, symbol: Hashable) -> str:
+        if isinstance(symbol, str) and len(symbol) == 1 \
+                and symbol != self.wildcard and symbol not in self._symbols:
+            return symbol
+
+        for code in _CODES:
+            if code != self.wildcard and code not in self._symbols:
+                return code
+
+        raise ValueError("Too many distinct symbols to be coded in one byte")
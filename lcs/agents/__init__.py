@@ -1,5 +1,12 @@
 # flake8: noqa
+from .DerivedValues import DerivedValues
 from .ImmutableSequence import ImmutableSequence
 from .Agent import Agent
 from .EnvironmentAdapter import EnvironmentAdapter
+from .SymbolTable import SymbolTable
 from .PerceptionString import PerceptionString
+from .PopulationIndex import PopulationIndex, MatchingIndex, \
+    ContainmentIndex
+from .PopulationList import PopulationList
+from .MatchSetCache import MatchSetCache
+from .ParameterStore import ParameterStore, StoredParameter
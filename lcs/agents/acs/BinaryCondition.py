@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Dict, Any
+
+from lcs import Perception
+from .Condition import Condition
+
+_CARE = str.maketrans('01#', '110')
+_VALUE = str.maketrans('#', '0')
+
+
+class BinaryCondition(Condition):
+    """
+    Condition for binary environments (i.e. multiplexer, parity) encoded
+    additionally as two integers - the care mask (specified attributes)
+    and the value of specified attributes. The first attribute is the most
+    significant bit.
+
+    Matching binary perception, subsumption and specificity become a few
+    big-integer operations regardless of the classifier length.
+    Only '0', '1' and the wildcard symbols are allowed.
+    """
+    __slots__ = ['_care', '_value']
+
+    def __init__(self, observation):
+        super().__init__(observation)
+        self._pack()
+
+    @classmethod
+    def _unchecked(cls, observation):
+        cond = super()._unchecked(observation)
+        cond._pack()
+        return cond
+
+    @property
+    def care(self) -> int:
+        """
+        Returns
+        -------
+        int
+            bit mask of specified (not wildcard) attributes
+        """
+        return self._care
+
+    @property
+    def value(self) -> int:
+        """
+        Returns
+        -------
+        int
+            bits of specified attributes (zeros for wildcards)
+        """
+        return self._value
+
+    @property
+    def specificity(self) -> int:
+        return bin(self._care).count('1')
+
+    def set_many(self, edits: Dict[int, Any]) -> None:
+        super().set_many(edits)
+        self._pack()
+
+    def does_match(self, p) -> bool:
+        if isinstance(p, Perception) and len(p) == len(self):
+            bits = p.binary
+            if bits is not None:
+                return bits & self._care == self._value
+
+        if isinstance(p, BinaryCondition):
+            return self.subsumes(p)
+
+        return super().does_match(p)
+
+    def subsumes(self, other) -> bool:
+        if isinstance(other, BinaryCondition):
+            return (self._value ^ other._value) & \
+                   self._care & other._care == 0
+
+        return super().subsumes(other)
+
+    def _pack(self) -> None:
+        items = self._items
+        if type(items) is not str or items.strip('01#') or \
+                self.WILDCARD != '#':
+            raise ValueError(
+                "Binary condition accepts only '0', '1' and '#' symbols")
+
+        if not items:
+            self._care = self._value = 0
+            return
+
+        self._care = int(items.translate(_CARE), 2)
+        self._value = int(items.translate(_VALUE), 2)
@@ -4,14 +4,24 @@ import logging
 from typing import Optional, Union, List
 
 from lcs import Perception
+from lcs.agents import DerivedValues
+from lcs.agents.ParameterStore import StoredParameter
 from lcs.agents.acs import Condition, Configuration, PMark, Effect
 
 logger = logging.getLogger(__name__)
 
 
 class Classifier:
-    __slots__ = ['condition', 'action', 'effect', 'mark', 'q', 'r',
-                 'talp', 'tav', 'cfg']
+    __slots__ = ['_condition', 'action', '_effect', 'mark', '_q', '_r',
+                 '_talp', '_tav', 'cfg', '_indexed_by', '_fingerprint',
+                 '_fingerprint_of', '_unchanging_of', '_params', '_row']
+
+    # Learning parameters processed in a vectorized way when kept
+    # in a `ParameterStore`
+    q = StoredParameter(float)
+    r = StoredParameter(float)
+    talp = StoredParameter(int, nullable=True)
+    tav = StoredParameter(float)
 
     def __init__(self,
                  condition: Union[Condition, str, None] = None,
@@ -27,6 +37,10 @@ class Classifier:
             raise TypeError("Configuration should be passed to Classifier")
 
         self.cfg = cfg
+        self._params = self._row = None
+        self._indexed_by = ()
+        self._fingerprint_of = None
+        self._unchanging_of = None
 
         def build_perception_string(cls, initial,
                                     length=self.cfg.classifier_length):
@@ -35,7 +49,8 @@ class Classifier:
 
             return cls.empty(length=length)
 
-        self.condition = build_perception_string(Condition, condition)
+        self.condition = build_perception_string(
+            self.cfg.condition_type or Condition, condition)
         self.action = action
         self.effect = build_perception_string(Effect, effect)
 
@@ -60,7 +75,70 @@ class Classifier:
         return False
 
     def __hash__(self):
-        return hash((str(self.condition), self.action, str(self.effect)))
+        return hash(self.fingerprint)
+
+    @property
+    def condition(self):
+        return self._condition
+
+    @condition.setter
+    def condition(self, condition) -> None:
+        self._condition = condition
+        condition.add_listener(self)
+
+    @property
+    def effect(self):
+        return self._effect
+
+    @effect.setter
+    def effect(self, effect) -> None:
+        self._effect = effect
+        effect.add_listener(self)
+
+    @property
+    def fingerprint(self) -> tuple:
+        """
+        Structural (condition, action, effect) fingerprint. It is computed
+        once and reused until the condition, action or effect changes.
+        Effects with enhanced (mutable) attributes are always recomputed.
+
+        Returns
+        -------
+        tuple
+            hashable representation of the classifier structure
+        """
+        cond, effect = self._condition._items, self._effect._items
+        src = self._fingerprint_of
+
+        if src is None or src[0] is not cond or src[1] is not effect \
+                or src[2] != self.action:
+            self._fingerprint = \
+                (str(self._condition), self.action, str(self._effect))
+            self._fingerprint_of = (cond, effect, self.action) \
+                if type(effect) is str else None
+
+        return self._fingerprint
+
+    @property
+    def similarity_key(self) -> tuple:
+        """
+        Returns
+        -------
+        tuple
+            (condition, action) key shared by all similar classifiers
+        """
+        return self._condition._items, self.action
+
+    def sequence_changed(self, seq) -> None:
+        """
+        Called when the condition or effect was modified in place.
+        Lists which indexed the classifier
+        (see `ClassifiersList.find_similar`) are notified.
+        """
+        for ref in self._indexed_by:
+            lst = ref()
+            if lst is not None:
+                lst.member_changed(self)
 
     def __repr__(self):
         return f"{self.condition} " \
@@ -104,7 +182,7 @@ class Classifier:
 
         """
         assert p0 != p1
-        new_c = Condition(old.condition)
+        new_c = type(old.condition)(old.condition)
         new_e = Effect(old.effect)
 
         for idx, (ci, ei, p0i, p1i) in \
@@ -135,11 +213,33 @@ class Classifier:
         An unchanging attribute is one that is anticipated not to change
         in the effect part.
 
+        Indices are computed once and reused until the condition or
+        effect changes. Effects with enhanced attributes are always
+        recomputed.
+
         Returns
         -------
         List[int]
             list of specified unchanging attributes indices
         """
+        cond, effect = self._condition._items, self._effect._items
+        src = self._unchanging_of
+
+        if src is None or src[0] is not cond or src[1] is not effect:
+            indices = self._specified_unchanging_attributes()
+            self._unchanging_of = (cond, effect, tuple(indices)) \
+                if type(effect) is str else None
+            return indices
+
+        if DerivedValues.verify_derived and \
+                list(src[2]) != self._specified_unchanging_attributes():
+            raise AssertionError(
+                f"Cached unchanging attributes of {self!r} "
+                f"are not up to date")
+
+        return list(src[2])
+
+    def _specified_unchanging_attributes(self) -> List[int]:
         indices = []
 
         for idx, (cpi, epi) in enumerate(zip(self.condition, self.effect)):
@@ -228,6 +328,8 @@ class Classifier:
             Requires the effect attribute to be a wildcard to specialize it.
             By default false
         """
+        condition_edits, effect_edits = {}, {}
+
         for idx in range(len(p1)):
             if leave_specialized:
                 if self.effect[idx] != self.cfg.classifier_wildcard:
@@ -236,9 +338,12 @@ class Classifier:
 
             if p0[idx] != p1[idx]:
                 if self.effect[idx] == self.cfg.classifier_wildcard:
-                    self.effect[idx] = p1[idx]
+                    effect_edits[idx] = p1[idx]
+
+                condition_edits[idx] = p0[idx]
 
-                self.condition[idx] = p0[idx]
+        self.effect.set_many(effect_edits)
+        self.condition.set_many(condition_edits)
 
     def predicts_successfully(self,
                               p0: Perception,
@@ -1,20 +1,231 @@
 from __future__ import annotations
 
-from lcs import TypedList, Perception
+import bisect
+import heapq
+import weakref
+from itertools import count
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import lcs.strategies.reinforcement_learning as rl
+from lcs import Perception
+from lcs.agents.ParameterStore import stored_rows
+from lcs.agents.PopulationList import PopulationList
 from lcs.agents.acs import Classifier
+from lcs.strategies.subsumption import does_subsume, find_subsumers
 
 
-class ClassifiersList(TypedList):
+class ClassifiersList(PopulationList):
     """
     Represents overall population, match/action sets
     """
 
     def __init__(self, *args, oktypes=(Classifier,)) -> None:
         super().__init__(*args, oktypes=oktypes)
+        self._similar: Dict[tuple, List[Classifier]] = {}
+        self._similar_state: Optional[tuple] = None
+        self._subsumers: Dict[tuple, List[tuple]] = {}
+        self._positions: Dict[int, List[tuple]] = {}
+        self._subsumers_state: Optional[tuple] = None
+        self._counter = count()
+
+        # In-place modifications of indexed members (see `member_changed`)
+        self._structure_edits = 0
+        self._ref: Optional[weakref.ref] = None
 
     def form_match_set(self, situation: Perception) -> ClassifiersList:
         matching_ls = [cl for cl in self if cl.does_match(situation)]
-        return ClassifiersList(*matching_ls)
+        return self.subset(matching_ls)
+
+    def find_similar(self, cl, last: bool = False) -> Optional[Classifier]:
+        """
+        Searches for the first (or last) classifier with the same
+        condition, action and effect as `cl`.
+
+        Classifiers are grouped by condition and action in a dictionary,
+        which is built once and updated on appending and removal.
+        It is rebuilt after other modifications of the list or in-place
+        modifications of conditions and effects of its members.
+
+        Parameters
+        ----------
+        cl:
+            classifier to compare
+        last: bool
+            return the last similar classifier instead of the first one
+
+        Returns
+        -------
+        Optional[Classifier]
+            similar classifier, None otherwise
+        """
+        if self._similar_state != self._structure_state():
+            similar: Dict[tuple, List[Classifier]] = {}
+            for member in self._items:
+                self._index(member)
+                similar.setdefault(member.similarity_key, []).append(member)
+
+            self._similar = similar
+            self._similar_state = self._structure_state()
+
+        candidates = self._similar.get(cl.similarity_key, ())
+        for candidate in reversed(candidates) if last else candidates:
+            if candidate == cl:
+                return candidate
+
+        return None
+
+    def find_subsumer(self, cl, theta_exp: int) -> Optional[Classifier]:
+        """
+        Searches for the most general classifier subsuming `cl`
+        (the first one on the list in case of a tie).
+
+        Classifiers are grouped by action and effect, each group being
+        ordered by the condition specificity (and then by position).
+        Only classifiers more general than `cl` are examined and
+        the search stops at the first subsumer. Subsumer criteria
+        (experience, quality, mark) are checked on the fly as they change
+        continuously. Effects with enhanced attributes are grouped
+        separately and always examined.
+
+        Parameters
+        ----------
+        cl:
+            classifier to be subsumed
+        theta_exp: int
+            subsumption experience threshold
+
+        Returns
+        -------
+        Optional[Classifier]
+            most general subsumer, None otherwise
+        """
+        effect_key = self._effect_key(cl)
+        if effect_key is None:
+            return next(iter(find_subsumers(cl, self, theta_exp)), None)
+
+        if self._subsumers_state != self._structure_state():
+            self._subsumers = {}
+            self._positions = {}
+            for member in self._items:
+                self._add_subsumer(member)
+
+            self._subsumers_state = self._structure_state()
+
+        specificity = cl.condition.specificity
+        groups = [self._subsumers.get((cl.action, effect_key), ()),
+                  self._subsumers.get((cl.action, None), ())]
+
+        for member_specificity, _, member in heapq.merge(*groups):
+            if member_specificity >= specificity:
+                break
+
+            if does_subsume(member, cl, theta_exp):
+                return member
+
+        return None
+
+    def _insert(self, index: int, o) -> None:
+        state = self._structure_state()
+        append = index >= len(self._items)
+
+        super()._insert(index, o)
+
+        if append and self._similar_state == state:
+            self._index(o)
+            self._similar.setdefault(o.similarity_key, []).append(o)
+            self._similar_state = self._structure_state()
+
+        if append and self._subsumers_state == state:
+            self._add_subsumer(o)
+            self._subsumers_state = self._structure_state()
+
+    def __delitem__(self, i):
+        state = self._structure_state()
+        removed = self._items[i]
+
+        super().__delitem__(i)
+
+        if isinstance(i, slice):
+            for cl in removed:
+                self._unindex(cl)
+            return
+
+        self._unindex(removed)
+
+        if self._similar_state == state:
+            group = self._similar[removed.similarity_key]
+            del group[next(pos for pos, member in enumerate(group)
+                           if member is removed)]
+            self._similar_state = self._structure_state()
+
+        if self._subsumers_state == state:
+            entries = self._positions[id(removed)]
+            group_key, entry = entries.pop()
+            if not entries:
+                del self._positions[id(removed)]
+
+            group = self._subsumers[group_key]
+            del group[bisect.bisect_left(group, entry[:2])]
+            self._subsumers_state = self._structure_state()
+
+    def member_changed(self, cl) -> None:
+        """
+        Called when condition or effect of a member classifier indexed
+        by this list was modified in place. Similarity and subsumer
+        indexes get rebuilt on the next lookup.
+        """
+        self._structure_edits += 1
+
+    def _add_subsumer(self, cl) -> None:
+        self._index(cl)
+        group_key = (cl.action, self._effect_key(cl))
+        entry = (cl.condition.specificity, next(self._counter), cl)
+
+        bisect.insort(self._subsumers.setdefault(group_key, []), entry)
+
+        # The same classifier might be present more than once
+        self._positions.setdefault(id(cl), []).append((group_key, entry))
+
+    def _index(self, cl) -> None:
+        # Registers the list to be notified about in-place modifications
+        # of the classifier. Weak references do not keep discarded lists
+        # (i.e. action sets) alive.
+        if self._ref is None:
+            self._ref = weakref.ref(self)
+
+        refs = cl._indexed_by
+        if not any(ref is self._ref for ref in refs):
+            cl._indexed_by = tuple(ref for ref in refs
+                                   if ref() is not None) + (self._ref,)
+
+    def _unindex(self, cl) -> None:
+        if self._ref is None or not cl._indexed_by:
+            return
+
+        # The same classifier might still be present at other position
+        if self._slots.position(self._items, self._version, cl) >= 0:
+            return
+
+        cl._indexed_by = tuple(ref for ref in cl._indexed_by
+                               if ref is not self._ref and ref() is not None)
+
+    def _structure_state(self) -> tuple:
+        return self._version, self._structure_edits
+
+    @staticmethod
+    def _effect_key(cl):
+        """
+        Effects composed only of symbols are represented by their storage,
+        effects with enhanced attributes (mutable) - by None.
+        """
+        items = cl.effect._items
+        if type(items) is str or \
+                not any(isinstance(item, dict) for item in items):
+            return items
+
+        return None
 
     def get_maximum_fitness(self) -> float:
         """
@@ -26,6 +237,14 @@ class ClassifiersList(TypedList):
         float
             fitness value
         """
+        store, rows = stored_rows(self) if self._items else (None, None)
+        if store is not None and not self._items[0].cfg.fitness_fcn:
+            anticipated_change = np.fromiter(
+                (cl.does_anticipate_change() for cl in self._items),
+                dtype=bool, count=len(self._items))
+            return rl.maximum_fitness(store.column('q'), store.column('r'),
+                                      rows, anticipated_change)
+
         anticipated_change_cls = [cl for cl in self
                                   if cl.does_anticipate_change()]
 
@@ -12,6 +12,7 @@ class Condition(ImmutableSequence):
     Specifies the set of situations (perceptions) in which the classifier
     can be applied.
     """
+    __slots__ = ()
 
     @property
     def specificity(self) -> int:
@@ -21,12 +22,14 @@ class Condition(ImmutableSequence):
         int
             Number of not generic (wildcards) attributes
         """
+        return self.derived('specificity', Condition._specificity)
+
+    def _specificity(self) -> int:
         return sum(1 for attr in self if attr != self.WILDCARD)
 
     def specialize_with_condition(self, other: Condition) -> None:
-        for idx, new_el in enumerate(other):
-            if new_el != self.WILDCARD:
-                self[idx] = new_el
+        self.set_many({idx: new_el for idx, new_el in enumerate(other)
+                       if new_el != self.WILDCARD})
 
     def generalize(self, position=None):
         self[position] = self.WILDCARD
@@ -20,7 +20,10 @@ class Configuration(object):
                  epsilon: float = 0.5,
                  u_max: int = 100000,
                  theta_exp: int = 20,
-                 theta_as: int = 20) -> None:
+                 theta_as: int = 20,
+                 condition_type=None,
+                 memory_lean: bool = False,
+                 trusted: bool = False) -> None:
         """
         Creates the configuration object used during training the ACS2 agent.
 
@@ -43,6 +46,12 @@ class Configuration(object):
         :param u_max:
         :param theta_exp:
         :param theta_as:
+        :param condition_type: Condition class used by classifiers
+            (i.e. `BinaryCondition`), `Condition` by default
+        :param memory_lean: classifiers which were never marked share
+            one empty mark
+        :param trusted: perceptions, conditions and effects created
+            by the agent internally skip validation of their symbols
         """
         self.classifier_length = classifier_length
         self.number_of_possible_actions = number_of_possible_actions
@@ -59,6 +68,14 @@ class Configuration(object):
         self.epsilon = epsilon
         self.u_max = u_max
         self.theta_as = theta_as
+        self.condition_type = condition_type
+
+        # Classifiers which were never marked share one empty mark
+        self.memory_lean = memory_lean
+
+        # Perceptions, conditions and effects created by the agent
+        # internally skip validation of their symbols
+        self.trusted = trusted
 
     def __str__(self) -> str:
         return str(vars(self))
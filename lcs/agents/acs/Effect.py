@@ -7,6 +7,7 @@ class Effect(ImmutableSequence):
     Anticipates the effects that the classifier 'believes'
     to be caused by the specified action.
     """
+    __slots__ = ()
 
     def __init__(self, observation):
         super().__init__(observation)
@@ -25,6 +26,9 @@ class Effect(ImmutableSequence):
         bool
             True if the effect part predicts a change, False otherwise
         """
+        return self.derived('specify_change', Effect._specify_change)
+
+    def _specify_change(self) -> bool:
         return any(True for e in self if e != self.WILDCARD)
 
     @classmethod
@@ -1,24 +1,16 @@
 import random
-from typing import List
 
-from lcs import Perception, TypedList
-from lcs.agents.acs import Condition, Configuration
+from lcs import Perception
+from lcs.agents.BitsetMark import BitsetMark
+from lcs.agents.acs import Condition
 
 
-class PMark(TypedList):
-    def __init__(self, cfg: Configuration) -> None:
-        self.cfg = cfg
-        initial: List = [set() for _ in range(self.cfg.classifier_length)]
-        super().__init__(*initial, oktypes=(set,))
-
-    def is_marked(self) -> bool:
-        """
-        Returns
-        -------
-        bool
-            If mark is specified at any attribute
-        """
-        return any(len(attrib) != 0 for attrib in self)
+class PMark(BitsetMark):
+    """
+    Mark of the classifier. Perceived symbols are stored as bits
+    of the per-attribute bitmasks.
+    """
+    __slots__ = ()
 
     def complement_marks(self, perception: Perception) -> bool:
         """
@@ -29,17 +21,18 @@ class PMark(TypedList):
         """
         changed = False
 
-        for idx, item in enumerate(self):
-            if len(item) > 0:
-                self[idx].add(perception[idx])
-                changed = True
+        if self._marked:
+            for idx, bits in enumerate(self._items):
+                if bits:
+                    self._extend(idx, 1 << self._position(perception[idx]))
+                    changed = True
 
         return changed
 
     def set_mark_using_condition(self,
                                  condition: Condition,
                                  perception: Perception) -> bool:
-        if self.is_marked():
+        if self._marked:
             # Mark is already specified. Further specialize all
             # specified attributes
             return self.complement_marks(perception)
@@ -48,7 +41,7 @@ class PMark(TypedList):
 
         for idx, item in enumerate(condition):
             if item == self.cfg.classifier_wildcard:
-                self[idx].add(perception[idx])
+                self.mark(idx, perception[idx])
                 changed = True
 
         return changed
@@ -63,24 +56,24 @@ class PMark(TypedList):
         """
         diff = Condition.empty(length=self.cfg.classifier_length)
 
-        nr1, nr2 = 0, 0
+        if not self._marked:
+            return diff
+
+        bits = self._items
+        p0_bits = [1 << self._position(p) for p in p0]
 
-        # Count difference types
-        for idx, item in enumerate(self):
-            if len(item) > 0 and p0[idx] not in item:
-                nr1 += 1
-            elif len(item) > 1:
-                nr2 += 1
+        # Attributes not containing the perceived symbol (unique
+        # differences) and containing more than one symbol (fuzzy ones)
+        unique = [idx for idx, item in enumerate(bits)
+                  if item and not item & p0_bits[idx]]
+        fuzzy = [idx for idx, item in enumerate(bits)
+                 if item & (item - 1)]
 
-        if nr1 > 0:
-            possible_idx = [pi for pi, p in enumerate(p0) if
-                            p not in self[pi] and len(self[pi]) > 0]
-            rand_idx = random.choice(possible_idx)
+        if unique:
+            rand_idx = random.choice(unique)
             diff[rand_idx] = p0[rand_idx]
-        elif nr2 > 0:
-            for idx, item in enumerate(self):
-                if len(item) > 1:
-                    diff[idx] = p0[idx]
+        elif fuzzy:
+            diff.set_many({idx: p0[idx] for idx in fuzzy})
 
         return diff
 
@@ -93,7 +86,8 @@ class PMark(TypedList):
             else:
                 return "{" + "".join(x for x in s) + "}"
 
-        if self.is_marked():
-            return "".join(compact_set_str(x) for x in self)
+        if self._marked:
+            return "".join(compact_set_str(list(self.values(idx)))
+                           for idx in range(len(self)))
         else:
             return "empty"
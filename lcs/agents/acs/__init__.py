@@ -1,5 +1,7 @@
+# flake8: noqa
 from .Configuration import Configuration
 from .Condition import Condition
+from .BinaryCondition import BinaryCondition
 from .Effect import Effect
 from .PMark import PMark
 from .Classifier import Classifier
@@ -5,8 +5,8 @@ from lcs import Perception
 from lcs.agents.Agent import TrialMetrics
 from lcs.strategies.action_planning.action_planning import \
     search_goal_sequence, suitable_cl_exists
-from . import ClassifiersList, Configuration
-from ...agents import Agent
+from . import Classifier, ClassifiersList, Configuration
+from ...agents import Agent, MatchSetCache, ParameterStore
 from ...strategies.action_selection import choose_action
 
 logger = logging.getLogger(__name__)
@@ -20,12 +20,27 @@ class ACS2(Agent):
         self.cfg = cfg
         self.population = population or ClassifiersList()
 
+        if cfg.match_index is not None:
+            self.population.attach_index(cfg.match_index(cfg))
+
+        if cfg.parameter_store:
+            self.population.attach_index(ParameterStore(Classifier))
+
+        self.match_set_cache = None
+        if cfg.match_set_cache_size:
+            self.population.track_conditions()
+            self.match_set_cache = MatchSetCache(self.population,
+                                                 cfg.match_set_cache_size)
+
     def get_population(self):
         return self.population
 
     def get_cfg(self):
         return self.cfg
 
+    def get_match_set_cache(self):
+        return self.match_set_cache
+
     def _run_trial_explore(self, env, time, current_trial=None) \
             -> TrialMetrics:
 
@@ -51,8 +66,8 @@ class ACS2(Agent):
                                               last_reward)
                 steps += steps_ap
 
-            state = Perception(state)
-            match_set = self.population.form_match_set(state)
+            state = self._perception(state)
+            match_set = self._form_match_set(state)
 
             if steps > 0:
                 # Apply learning in the last action set
@@ -97,11 +112,11 @@ class ACS2(Agent):
             logger.debug("\tExecuting action: [%d]", action)
             action_set = match_set.form_action_set(action)
 
-            prev_state = Perception(state)
+            prev_state = self._perception(state)
             raw_state, last_reward, done, _ = env.step(iaction)
 
             state = self.cfg.environment_adapter.to_genotype(raw_state)
-            state = Perception(state)
+            state = self._perception(state)
 
             if done:
                 ClassifiersList.apply_alp(
@@ -146,14 +161,14 @@ class ACS2(Agent):
         steps = 0
         raw_state = env.reset()
         state = self.cfg.environment_adapter.to_genotype(raw_state)
-        state = Perception(state)
+        state = self._perception(state)
 
         last_reward = 0
         action_set = ClassifiersList()
         done = False
 
         while not done:
-            match_set = self.population.form_match_set(state)
+            match_set = self._form_match_set(state)
 
             if steps > 0:
                 ClassifiersList.apply_reinforcement_learning(
@@ -175,7 +190,7 @@ class ACS2(Agent):
 
             raw_state, last_reward, done, _ = env.step(iaction)
             state = self.cfg.environment_adapter.to_genotype(raw_state)
-            state = Perception(state)
+            state = self._perception(state)
 
             if done:
                 ClassifiersList.apply_reinforcement_learning(
@@ -242,7 +257,8 @@ class ACS2(Agent):
                 break
 
             act_sequence = search_goal_sequence(self.population, state,
-                                                goal_situation)
+                                                goal_situation,
+                                                self.match_set_cache)
 
             # Execute the found sequence and learn during executing
             i = 0
@@ -250,7 +266,7 @@ class ACS2(Agent):
                 if act == -1:
                     break
 
-                match_set = self.population.form_match_set(state)
+                match_set = self._form_match_set(state)
 
                 if action_set is not None and len(prev_state) != 0:
                     ClassifiersList.apply_alp(
@@ -292,7 +308,7 @@ class ACS2(Agent):
                 prev_state = state
 
                 state = self.cfg.environment_adapter.to_genotype(raw_state)
-                state = Perception(state)
+                state = self._perception(state)
 
                 if not suitable_cl_exists(action_set, prev_state,
                                           action, state):
@@ -309,5 +325,14 @@ class ACS2(Agent):
 
         return steps, state, prev_state, action_set, action, last_reward
 
+    def _perception(self, observation) -> Perception:
+        if self.cfg.intern_perceptions:
+            return Perception.intern(observation, self.cfg.trusted)
+
+        if self.cfg.trusted:
+            return Perception._from_tuple(observation)
+
+        return Perception(observation)
+
     def _time_for_action_planning(self, time):
         return time % self.cfg.action_planning_frequency == 0
@@ -6,6 +6,7 @@ from typing import Optional, Union, Callable, List
 
 import lcs.agents.acs as acs
 from lcs import Perception
+from lcs.agents.ParameterStore import StoredParameter
 from . import Configuration, Effect
 from . import ProbabilityEnhancedAttribute
 
@@ -13,8 +14,12 @@ logger = logging.getLogger(__name__)
 
 
 class Classifier(acs.Classifier):
-    __slots__ = ['condition', 'action', 'effect', 'mark', 'q', 'r',
-                 'ir', 'num', 'exp', 'talp', 'tga', 'tav', 'ee', 'cfg']
+    __slots__ = ['_ir', '_num', '_exp', '_tga', 'ee']
+
+    ir = StoredParameter(float)
+    num = StoredParameter(int)
+    exp = StoredParameter(int)
+    tga = StoredParameter(int)
 
     def __init__(self,
                  condition: Union[acs.Condition, str, None] = None,
@@ -34,19 +39,35 @@ class Classifier(acs.Classifier):
             raise TypeError("Configuration should be passed to Classifier")
 
         self.cfg = cfg
+        self._params = self._row = None
+        self._indexed_by = ()
+        self._fingerprint_of = None
+        self._unchanging_of = None
+
+        trusted = self.cfg.trusted
 
         def build_perception_string(cls, initial,
                                     length=self.cfg.classifier_length):
+            if trusted:
+                return cls._unchecked(
+                    initial or (cls.WILDCARD,) * length)
+
             if initial:
                 return cls(initial)
 
             return cls.empty(length=length)
 
-        self.condition = build_perception_string(acs.Condition, condition)
+        self.condition = build_perception_string(
+            self.cfg.condition_type or acs.Condition, condition)
         self.action = action
         self.effect = build_perception_string(Effect, effect)
 
-        self.mark = acs.PMark(cfg=self.cfg)
+        # In the memory-lean mode classifiers which were never marked
+        # share the same (immutable) empty mark
+        if self.cfg.memory_lean:
+            self.mark = acs.PMark.shared_empty(self.cfg)
+        else:
+            self.mark = acs.PMark(cfg=self.cfg)
         self.q = quality
         self.r = reward
         self.ir = immediate_reward  # Immediate reward
@@ -86,7 +107,7 @@ class Classifier(acs.Classifier):
             copied classifier
         """
         new_cls = cls(
-            condition=acs.Condition(old_cls.condition),
+            condition=type(old_cls.condition)(old_cls.condition),
             action=old_cls.action,
             effect=old_cls.effect,
             quality=old_cls.q,
@@ -100,18 +121,9 @@ class Classifier(acs.Classifier):
 
         return new_cls
 
-    @property
-    def specified_unchanging_attributes(self) -> List[int]:
-        """
-        Determines the specified unchanging attributes in the classifier.
-        An unchanging attribute is one that is anticipated not to change
-        in the effect part.
-
-        Returns
-        -------
-        List[int]
-            list of specified unchanging attributes indices
-        """
+    def _specified_unchanging_attributes(self) -> List[int]:
+        # Enhanced attributes are unchanging if they contain
+        # the condition symbol
         indices = []
 
         for idx, (cpi, epi) in enumerate(zip(self.condition, self.effect)):
@@ -159,6 +171,8 @@ class Classifier(acs.Classifier):
             Requires the effect attribute to be a wildcard to specialize it.
             By default false
         """
+        condition_edits, effect_edits = {}, {}
+
         for idx in range(len(p1)):
             if leave_specialized:
                 if self.effect[idx] != self.cfg.classifier_wildcard:
@@ -167,20 +181,25 @@ class Classifier(acs.Classifier):
 
             if p0[idx] != p1[idx]:
                 if self.effect[idx] == self.cfg.classifier_wildcard:
-                    self.effect[idx] = p1[idx]
+                    effect_edits[idx] = p1[idx]
                 elif self.cfg.do_pee:
-                    if not isinstance(self.effect[idx], ProbabilityEnhancedAttribute):
-                        self.effect[idx] = ProbabilityEnhancedAttribute(self.effect[idx])
-                    self.effect[idx].insert_symbol(p1[idx])
+                    pea = self.effect[idx]
+                    if not isinstance(pea, ProbabilityEnhancedAttribute):
+                        pea = ProbabilityEnhancedAttribute(pea)
+                        effect_edits[idx] = pea
+                    pea.insert_symbol(p1[idx])
 
-                self.condition[idx] = p0[idx]
+                condition_edits[idx] = p0[idx]
+
+        self.effect.set_many(effect_edits)
+        self.condition.set_many(condition_edits)
 
     def merge_with(self, other_classifier, perception, time):
         assert self.cfg.do_pee
 
         result = Classifier(cfg=self.cfg)
 
-        result.condition = acs.Condition(self.condition)
+        result.condition = type(self.condition)(self.condition)
         result.condition.specialize_with_condition(other_classifier.condition)
 
         # action is an int, so we can assign directly
@@ -191,8 +210,6 @@ class Classifier(acs.Classifier):
             self.q, other_classifier.q,
             perception)
 
-        result.mark = acs.PMark(cfg=self.cfg)
-
         result.r = (self.r + other_classifier.r) / 2.0
         result.q = (self.q + other_classifier.q) / 2.0
 
@@ -226,6 +243,9 @@ class Classifier(acs.Classifier):
         perception: Perception
             current situation
         """
+        if self.mark.frozen:
+            self.mark = acs.PMark(cfg=self.cfg)
+
         if self.mark.set_mark_using_condition(self.condition, perception):
             self.ee = False
 
@@ -266,8 +286,9 @@ class Classifier(acs.Classifier):
         bool
             True if attribute was generalized, False otherwise
         """
-        if len(self.specified_unchanging_attributes) > 0:
-            ridx = randomfunc(self.specified_unchanging_attributes)
+        unchanging = self.specified_unchanging_attributes
+        if len(unchanging) > 0:
+            ridx = randomfunc(unchanging)
             self.condition.generalize(ridx)
             return True
 
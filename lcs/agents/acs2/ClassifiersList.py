@@ -5,12 +5,15 @@ import random
 from itertools import chain
 from typing import Optional, List
 
+import numpy as np
+
 import lcs.agents.acs as acs
 import lcs.agents.acs2.alp as alp_acs2
 import lcs.strategies.anticipatory_learning_process as alp
 import lcs.strategies.genetic_algorithms as ga
 import lcs.strategies.reinforcement_learning as rl
 from lcs import Perception
+from lcs.agents.ParameterStore import stored_rows
 from lcs.agents.acs2 import Configuration
 from . import Classifier
 
@@ -21,18 +24,23 @@ class ClassifiersList(acs.ClassifiersList):
         super().__init__(*args, oktypes=oktypes)
 
     def form_match_set(self, situation: Perception) -> ClassifiersList:
+        if self._matcher is not None:
+            return self.subset(
+                [self._items[i] for i in self._matcher.match(situation)])
+
         matching_ls = [cl for cl in self if cl.does_match(situation)]
-        return ClassifiersList(*matching_ls)
+        return self.subset(matching_ls)
 
     def form_action_set(self, action: int) -> ClassifiersList:
-        matching = [cl for cl in self if cl.action == action]
-        return ClassifiersList(*matching)
+        # Partitions are rebuilt (not modified) when the list changes,
+        # so the action set can share one of them
+        return self.subset(self.action_buckets().get(action, []))
 
     def form_match_set_backwards(self,
                                  situation: Perception) -> ClassifiersList:
 
         matching = [cl for cl in self if cl.does_match_backwards(situation)]
-        return ClassifiersList(*matching)
+        return self.subset(matching)
 
     def expand(self) -> List[Classifier]:
         """
@@ -220,5 +228,11 @@ class ClassifiersList(acs.ClassifiersList):
                                      p: float,
                                      beta: float,
                                      gamma: float) -> None:
+        store, rows = stored_rows(action_set) if action_set else (None, None)
+        if store is not None and len(np.unique(rows)) == len(rows):
+            rl.update_classifiers(store.column('r'), store.column('ir'), rows,
+                                  reward, p, beta, gamma)
+            return
+
         for cl in action_set:
             rl.update_classifier(cl, reward, p, beta, gamma)
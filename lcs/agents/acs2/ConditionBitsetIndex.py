@@ -0,0 +1,103 @@
+from typing import Dict, List
+
+import numpy as np
+
+from lcs import Perception
+from lcs.agents import MatchingIndex
+from lcs.agents.acs2 import Configuration
+from lcs.utils import bitset_insert, bitset_remove, bitset_indices
+
+
+class ConditionBitsetIndex(MatchingIndex):
+    """
+    Inverted index of classifier conditions.
+
+    For every attribute one bitset (Python `int`) of population positions
+    is kept for each specified symbol and one for the wildcard. Classifiers
+    matching the perception `p` are then obtained as an intersection
+    of `wildcards[i] | symbols[i][p[i]]` over all attributes, which for
+    small alphabets boils down to a few big-integer operations.
+
+    Attach it to the population with `ClassifiersList.attach_index` or
+    pass the class as `match_index` in the `Configuration`.
+    """
+
+    def __init__(self, cfg: Configuration) -> None:
+        self.cfg = cfg
+        self._size = 0
+        self._wildcards: List[int] = []
+        self._symbols: List[Dict[str, int]] = []
+        self._clear()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def rebuild(self, population) -> None:
+        self._clear()
+        for idx, cl in enumerate(population):
+            self._set(idx, cl.condition)
+        self._size = len(population)
+
+    def insert(self, idx: int, cl) -> None:
+        if idx < self._size:
+            self._transform(lambda bits: bitset_insert(bits, idx))
+
+        self._set(idx, cl.condition)
+        self._size += 1
+
+    def remove(self, idx: int, cl) -> None:
+        self._transform(lambda bits: bitset_remove(bits, idx))
+        self._size -= 1
+
+    def update(self, idx: int, cl) -> None:
+        mask = ~(1 << idx)
+        self._transform(lambda bits: bits & mask)
+        self._set(idx, cl.condition)
+
+    def match_bits(self, situation: Perception) -> int:
+        """
+        Returns
+        -------
+        int
+            bitset of population positions matching the situation
+        """
+        wildcard = self.cfg.classifier_wildcard
+        matching = (1 << self._size) - 1
+
+        for attr, symbol in enumerate(situation):
+            if symbol == wildcard:
+                continue
+
+            matching &= self._wildcards[attr] | \
+                self._symbols[attr].get(symbol, 0)
+
+            if not matching:
+                break
+
+        return matching
+
+    def match(self, situation: Perception) -> np.ndarray:
+        return bitset_indices(self.match_bits(situation))
+
+    def _clear(self) -> None:
+        length = self.cfg.classifier_length
+        self._size = 0
+        self._wildcards = [0] * length
+        self._symbols = [{} for _ in range(length)]
+
+    def _set(self, idx: int, condition) -> None:
+        bit = 1 << idx
+        wildcard = self.cfg.classifier_wildcard
+
+        for attr, symbol in enumerate(condition):
+            if symbol == wildcard:
+                self._wildcards[attr] |= bit
+            else:
+                symbols = self._symbols[attr]
+                symbols[symbol] = symbols.get(symbol, 0) | bit
+
+    def _transform(self, fcn) -> None:
+        self._wildcards = [fcn(bits) for bits in self._wildcards]
+        for symbols in self._symbols:
+            for symbol, bits in symbols.items():
+                symbols[symbol] = fcn(bits)
@@ -0,0 +1,157 @@
+from typing import Dict
+
+import numpy as np
+
+from lcs import Perception
+from lcs.agents import MatchingIndex
+from lcs.agents.acs2 import Configuration
+
+# Code used for wildcards and perception symbols never seen in conditions
+UNKNOWN_SYMBOL = -1
+
+
+class ConditionMatrix(MatchingIndex):
+    """
+    Columnar (NumPy) backend for classifier conditions.
+
+    Conditions of all classifiers in the population are kept as an (N, L)
+    integer matrix of symbol codes accompanied by a boolean wildcard mask.
+    Rows are aligned with classifier positions in the population, so the
+    classifier objects remain the public interface while matching
+    the perception is a single vectorized comparison.
+
+    Attach it to the population with `ClassifiersList.attach_index` or
+    pass the class as `match_index` in the `Configuration`.
+    """
+
+    def __init__(self, cfg: Configuration, capacity: int = 64) -> None:
+        self.cfg = cfg
+        self.symbols: Dict[str, int] = {}
+        self._size = 0
+        self._codes = np.full((capacity, cfg.classifier_length),
+                              UNKNOWN_SYMBOL, dtype=np.int32)
+        self._wildcards = np.ones((capacity, cfg.classifier_length),
+                                  dtype=bool)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def codes(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            (N, L) view of symbol codes of the indexed conditions
+        """
+        return self._codes[:self._size]
+
+    @property
+    def wildcards(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            (N, L) view of the wildcard mask of the indexed conditions
+        """
+        return self._wildcards[:self._size]
+
+    def row(self, idx: int) -> np.ndarray:
+        """
+        Returns a view onto the row representing condition of the classifier
+        at given position. Wildcards are coded as `UNKNOWN_SYMBOL`.
+        """
+        if not 0 <= idx < self._size:
+            raise IndexError("Row index out of range")
+
+        return self._codes[idx]
+
+    def encode(self, symbol) -> int:
+        """
+        Returns integer code for given condition symbol. New codes are
+        assigned on the fly.
+        """
+        code = self.symbols.get(symbol)
+        if code is None:
+            code = len(self.symbols)
+            self.symbols[symbol] = code
+
+        return code
+
+    def encode_perception(self, situation: Perception) -> np.ndarray:
+        """
+        Translates perception into the vector of symbol codes. Symbols
+        which never appeared in any condition (and wildcards) are coded
+        as `UNKNOWN_SYMBOL`.
+        """
+        symbols = self.symbols
+        return np.fromiter(
+            (symbols.get(s, UNKNOWN_SYMBOL) for s in situation),
+            dtype=np.int32, count=len(situation))
+
+    def rebuild(self, population) -> None:
+        self._size = 0
+        self._reserve(len(population))
+        for idx, cl in enumerate(population):
+            self._write_row(idx, cl.condition)
+        self._size = len(population)
+
+    def insert(self, idx: int, cl) -> None:
+        self._reserve(self._size + 1)
+        if idx < self._size:
+            self._codes[idx + 1:self._size + 1] = self._codes[idx:self._size]
+            self._wildcards[idx + 1:self._size + 1] = \
+                self._wildcards[idx:self._size]
+
+        self._write_row(idx, cl.condition)
+        self._size += 1
+
+    def remove(self, idx: int, cl) -> None:
+        self._codes[idx:self._size - 1] = self._codes[idx + 1:self._size]
+        self._wildcards[idx:self._size - 1] = \
+            self._wildcards[idx + 1:self._size]
+        self._size -= 1
+
+    def update(self, idx: int, cl) -> None:
+        self._write_row(idx, cl.condition)
+
+    def match(self, situation: Perception) -> np.ndarray:
+        p = self.encode_perception(situation)
+        hits = (self.codes == p) | self.wildcards
+
+        # Wildcards in the situation (i.e. when matching other conditions)
+        # are matched by anything
+        p_wildcards = [i for i, s in enumerate(situation)
+                       if s == self.cfg.classifier_wildcard]
+        if p_wildcards:
+            hits[:, p_wildcards] = True
+
+        return np.flatnonzero(hits.all(axis=1))
+
+    def _write_row(self, idx: int, condition) -> None:
+        wildcard = self.cfg.classifier_wildcard
+        for attr, symbol in enumerate(condition):
+            if symbol == wildcard:
+                self._codes[idx, attr] = UNKNOWN_SYMBOL
+                self._wildcards[idx, attr] = True
+            else:
+                self._codes[idx, attr] = self.encode(symbol)
+                self._wildcards[idx, attr] = False
+
+    def _reserve(self, size: int) -> None:
+        capacity = max(len(self._codes), 1)
+        if size <= len(self._codes):
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        codes = np.full((capacity, self.cfg.classifier_length),
+                        UNKNOWN_SYMBOL, dtype=np.int32)
+        wildcards = np.ones((capacity, self.cfg.classifier_length),
+                            dtype=bool)
+        codes[:self._size] = self._codes[:self._size]
+        wildcards[:self._size] = self._wildcards[:self._size]
+
+        self._codes = codes
+        self._wildcards = wildcards
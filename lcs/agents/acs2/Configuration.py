@@ -29,7 +29,14 @@ class Configuration(acs.Configuration):
                  theta_ga: int = 100,
                  theta_as: int = 20,
                  mu: float = 0.3,
-                 chi: float = 0.8):
+                 chi: float = 0.8,
+                 match_index=None,
+                 match_set_cache_size: int = 0,
+                 condition_type=None,
+                 parameter_store: bool = False,
+                 memory_lean: bool = False,
+                 trusted: bool = False,
+                 intern_perceptions: bool = False):
 
         super(Configuration, self).__init__(
             classifier_length,
@@ -46,7 +53,10 @@ class Configuration(acs.Configuration):
             epsilon,
             u_max,
             theta_exp,
-            theta_as)
+            theta_as,
+            condition_type,
+            memory_lean,
+            trusted)
 
         self.gamma = gamma
         self.do_pee = do_pee
@@ -57,6 +67,22 @@ class Configuration(acs.Configuration):
         self.theta_ga = theta_ga
         self.mu = mu
         self.chi = chi
+        # Optional `MatchingIndex` class (i.e. `ConditionMatrix`,
+        # `ConditionBitsetIndex` or `DeltaConditionMatrix`) attached to
+        # the agent population for faster match set formation
+        self.match_index = match_index
+
+        # Maximum number of match sets remembered by the agent (LRU),
+        # 0 disables caching
+        self.match_set_cache_size = match_set_cache_size
+
+        # Keep learning parameters of the population classifiers
+        # in NumPy columns (see `ParameterStore`)
+        self.parameter_store = parameter_store
+
+        # Agent uses canonical perceptions - one object per distinct
+        # state (see `Perception.intern`)
+        self.intern_perceptions = intern_perceptions
 
     def __str__(self) -> str:
         return str(vars(self))
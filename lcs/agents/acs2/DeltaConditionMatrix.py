@@ -0,0 +1,92 @@
+from typing import Optional
+
+import numpy as np
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, ConditionMatrix
+
+
+class DeltaConditionMatrix(ConditionMatrix):
+    """
+    Condition matrix matching consecutive perceptions incrementally.
+
+    For every classifier the number of attributes not matching the most
+    recent perception is stored. When the next perception arrives only
+    the columns of the attributes which changed are compared - classifiers
+    specifying the old value gain a match, the ones specifying a new value
+    lose it. Classifiers with no mismatches form the match set.
+
+    Classifiers inserted or modified (i.e. by ALP or GA) between
+    the steps get their counters recomputed against the last perception,
+    so the result is always the same as for matching from scratch.
+    """
+
+    def __init__(self, cfg: Configuration, capacity: int = 64) -> None:
+        super().__init__(cfg, capacity)
+        self._mismatches = np.zeros(len(self._codes), dtype=np.int32)
+        self._last: Optional[tuple] = None
+
+    def rebuild(self, population) -> None:
+        super().rebuild(population)
+        self._last = None
+
+    def insert(self, idx: int, cl) -> None:
+        super().insert(idx, cl)
+        if self._last is not None:
+            size = self._size
+            self._mismatches[idx + 1:size] = self._mismatches[idx:size - 1]
+            self._mismatches[idx] = self._count_mismatches(cl.condition)
+
+    def remove(self, idx: int, cl) -> None:
+        super().remove(idx, cl)
+        if self._last is not None:
+            self._mismatches[idx:self._size] = \
+                self._mismatches[idx + 1:self._size + 1]
+
+    def update(self, idx: int, cl) -> None:
+        super().update(idx, cl)
+        if self._last is not None:
+            self._mismatches[idx] = self._count_mismatches(cl.condition)
+
+    def match(self, situation: Perception) -> np.ndarray:
+        current = tuple(situation)
+        last = self._last
+
+        if last is None or len(last) != len(current):
+            changed = None
+        else:
+            changed = [i for i, (old, new) in enumerate(zip(last, current))
+                       if old != new]
+
+        mismatches = self._mismatches[:self._size]
+        if changed is None or len(changed) > len(current) // 2:
+            mismatches[:] = 0
+            for attr, symbol in enumerate(current):
+                mismatches += self._column_mismatch(attr, symbol)
+        else:
+            for attr in changed:
+                mismatches -= self._column_mismatch(attr, last[attr])
+                mismatches += self._column_mismatch(attr, current[attr])
+
+        self._last = current
+        return np.flatnonzero(mismatches == 0)
+
+    def _column_mismatch(self, attr: int, symbol) -> np.ndarray:
+        if symbol == self.cfg.classifier_wildcard:
+            return np.zeros(self._size, dtype=np.int32)
+
+        code = self.symbols.get(symbol, -1)
+        return ((self.codes[:, attr] != code) &
+                ~self.wildcards[:, attr]).astype(np.int32)
+
+    def _count_mismatches(self, condition) -> int:
+        wildcard = self.cfg.classifier_wildcard
+        return sum(1 for c, p in zip(condition, self._last)
+                   if c != wildcard and p != wildcard and c != p)
+
+    def _reserve(self, size: int) -> None:
+        super()._reserve(size)
+        if len(self._mismatches) < len(self._codes):
+            mismatches = np.zeros(len(self._codes), dtype=np.int32)
+            mismatches[:len(self._mismatches)] = self._mismatches
+            self._mismatches = mismatches
@@ -9,8 +9,17 @@ DETAILED_PEE_PRINTING = True
 
 
 class Effect(acs.Effect):
+    __slots__ = ()
 
     def __init__(self, observation):
+        super().__init__(self._enhanced_attributes(observation))
+
+    @classmethod
+    def _unchecked(cls, observation):
+        return super()._unchecked(cls._enhanced_attributes(observation))
+
+    @staticmethod
+    def _enhanced_attributes(observation):
         # Convert dict to ProbabilityEnhancedAttribute
         if not all(isinstance(attr, ProbabilityEnhancedAttribute)
                    for attr in observation):
@@ -20,7 +29,7 @@ class Effect(acs.Effect):
                            else attr
                            for attr in observation)
 
-        super().__init__(observation)
+        return observation
 
     @property
     def specify_change(self) -> bool:
@@ -148,6 +157,9 @@ class Effect(acs.Effect):
         ProbabilityEnhancedAttribute elements are Enhanced.
         :return: True if this is a Probability-Enhanced Effect, False otherwise
         """
+        return self.derived('is_enhanced', Effect._is_enhanced)
+
+    def _is_enhanced(self) -> bool:
         # Sanity check
         assert not any(isinstance(elem, dict) and
                        not isinstance(elem, ProbabilityEnhancedAttribute)
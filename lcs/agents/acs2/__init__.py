@@ -1,6 +1,9 @@
 # flake8: noqa
 from .ProbabilityEnhancedAttribute import ProbabilityEnhancedAttribute
 from .Configuration import Configuration
+from .ConditionMatrix import ConditionMatrix
+from .ConditionBitsetIndex import ConditionBitsetIndex
+from .DeltaConditionMatrix import DeltaConditionMatrix
 from .Effect import Effect
 from .Classifier import Classifier
 from .ClassifiersList import ClassifiersList
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
 import random
+from copy import copy
 from typing import Optional, List, Callable, Dict
 
 import numpy as np
 
 from lcs import Perception
+from lcs.agents.ParameterStore import StoredParameter
 from lcs.representations import UBR
 from . import Condition, Effect, Mark, Configuration
+from .EncodedPerception import encode
 
 
 class Classifier:
-    __slots__ = ['condition', 'action', 'effect', 'mark', 'q', 'r',
-                 'ir', 'num', 'exp', 'talp', 'tga', 'tav', 'ee', 'cfg']
+    __slots__ = ['condition', 'action', 'effect', 'mark', '_q', '_r',
+                 '_ir', '_num', '_exp', '_talp', '_tga', '_tav', 'ee', 'cfg',
+                 '_params', '_row']
+
+    # Learning parameters processed in a vectorized way when kept
+    # in a `ParameterStore`
+    q = StoredParameter(float)
+    r = StoredParameter(float)
+    ir = StoredParameter(float)
+    num = StoredParameter(int)
+    exp = StoredParameter(int)
+    talp = StoredParameter(int, nullable=True)
+    tga = StoredParameter(int)
+    tav = StoredParameter(float)
 
     def __init__(self,
                  condition: Optional[Condition] = None,
@@ -32,6 +47,7 @@ class Classifier:
             raise TypeError("Configuration should be passed to Classifier")
 
         self.cfg = cfg
+        self._params = self._row = None
 
         def build_condition(initial):
             if initial:
@@ -84,7 +100,8 @@ class Classifier:
         """
         Copies old classifier with given time (tga, talp).
         Old tav gets replaced with new value.
-        New classifier also has no mark.
+        New classifier also has no mark and does not share intervals
+        with the old one.
 
         Parameters
         ----------
@@ -98,10 +115,12 @@ class Classifier:
         Classifier
             copied classifier
         """
+        # Intervals are copied as well - they are widened in place by
+        # the mutation, which must not affect the old classifier
         new_cls = cls(
-            condition=Condition(old_cls.condition, old_cls.cfg),
+            condition=Condition(map(copy, old_cls.condition), old_cls.cfg),
             action=old_cls.action,
-            effect=old_cls.effect,
+            effect=Effect(map(copy, old_cls.effect), old_cls.cfg),
             quality=old_cls.q,
             reward=old_cls.r,
             immediate_reward=old_cls.ir,
@@ -162,8 +181,8 @@ class Classifier:
             Requires the effect attribute to be a wildcard to specialize it.
             By default false
         """
-        p0_enc = list(map(self.cfg.encoder.encode, p0))
-        p1_enc = list(map(self.cfg.encoder.encode, p1))
+        p0_enc = encode(p0, self.cfg.encoder)
+        p1_enc = encode(p1, self.cfg.encoder)
 
         for idx, item in enumerate(p1):
             if leave_specialized:
@@ -227,8 +246,8 @@ class Classifier:
         bool
             True if anticipation is correct, False otherwise
         """
-        p0_enc = list(map(self.cfg.encoder.encode, previous_situation))
-        p1_enc = list(map(self.cfg.encoder.encode, situation))
+        p0_enc = encode(previous_situation, self.cfg.encoder)
+        p1_enc = encode(situation, self.cfg.encoder)
 
         for idx, eitem in enumerate(self.effect):
             if eitem == self.cfg.classifier_wildcard:
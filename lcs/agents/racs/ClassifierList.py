@@ -4,28 +4,51 @@ import random
 from itertools import chain
 from typing import Optional, List
 
+import numpy as np
+
 import lcs.agents.racs.components.alp as alp_racs
 import lcs.strategies.anticipatory_learning_process as alp
 import lcs.strategies.genetic_algorithms as ga
 import lcs.strategies.reinforcement_learning as rl
-from lcs import TypedList, Perception
+from lcs import Perception
+from lcs.agents.ParameterStore import stored_rows
+from lcs.agents.PopulationList import PopulationList
 from lcs.agents.racs import Configuration
 from lcs.agents.racs.components.genetic_algorithm import mutate, crossover
 from . import Classifier
 
 
-class ClassifierList(TypedList):
+class ClassifierList(PopulationList):
 
     def __init__(self, *args) -> None:
         super().__init__(*args, oktypes=(Classifier,))
 
+    def refresh(self) -> None:
+        """
+        Called when intervals of member classifiers were modified in place
+        without going through their conditions (i.e. bounds assigned
+        directly). All the attached indexes are rebuilt and values cached
+        by conditions are discarded.
+        """
+        self._version += 1
+        for cl in self._items:
+            cl.condition.forget_derived()
+
+        for pop_index in self._indexes:
+            pop_index.rebuild(self)
+
     def form_match_set(self, situation: Perception) -> ClassifierList:
+        if self._matcher is not None:
+            return self.subset(
+                [self._items[i] for i in self._matcher.match(situation)])
+
         matching = [cl for cl in self if cl.condition.does_match(situation)]
-        return ClassifierList(*matching)
+        return self.subset(matching)
 
     def form_action_set(self, action: int) -> ClassifierList:
-        matching = [cl for cl in self if cl.action == action]
-        return ClassifierList(*matching)
+        # Partitions are rebuilt (not modified) when the list changes,
+        # so the action set can share one of them
+        return self.subset(self.action_buckets().get(action, []))
 
     def expand(self) -> List[Classifier]:
         """
@@ -49,6 +72,14 @@ class ClassifierList(TypedList):
         float
             fitness value
         """
+        store, rows = stored_rows(self) if self._items else (None, None)
+        if store is not None:
+            anticipated_change = np.fromiter(
+                (cl.does_anticipate_change() for cl in self._items),
+                dtype=bool, count=len(self._items))
+            return rl.maximum_fitness(store.column('q'), store.column('r'),
+                                      rows, anticipated_change)
+
         anticipated_change_cls = [cl for cl in self
                                   if cl.does_anticipate_change()]
 
@@ -115,6 +146,12 @@ class ClassifierList(TypedList):
                                      p: float,
                                      beta: float,
                                      gamma: float) -> None:
+        store, rows = stored_rows(action_set) if action_set else (None, None)
+        if store is not None and len(np.unique(rows)) == len(rows):
+            rl.update_classifiers(store.column('r'), store.column('ir'), rows,
+                                  reward, p, beta, gamma)
+            return
+
         for cl in action_set:
             rl.update_classifier(cl, reward, p, beta, gamma)
 
@@ -3,11 +3,15 @@ from __future__ import annotations
 import random
 import statistics
 from copy import copy
-from typing import Callable
+from typing import Callable, Optional
+
+import numpy as np
 
 from lcs import Perception
 from lcs.representations.visualization import visualize
 from . import Configuration
+from .EncodedPerception import encode
+from .IntervalMatrix import IntervalMatrix
 from .. import PerceptionString
 
 
@@ -46,6 +50,13 @@ class Condition(PerceptionString):
             0.0 means that condition is nothing is covered
             1.0 means that condition is maximally general
         """
+        return self.derived('cover_ratio', Condition._cover_ratio)
+
+    def _cover_ratio(self) -> float:
+        bounds = self._indexed_bounds()
+        if bounds is not None:
+            return float(IntervalMatrix.cover_ratio_of(bounds, self.cfg))
+
         maximum_span = self.cfg.encoder.range[1] + 1
         return statistics.mean(r.bound_span / maximum_span for r in self)
 
@@ -93,12 +104,32 @@ class Condition(PerceptionString):
             self.generalize(ridx)
 
     def does_match(self, perception: Perception):
-        encoded_perception = map(self.cfg.encoder.encode, perception)
+        encoded_perception = encode(perception, self.cfg.encoder)
         return all(p in ubr for p, ubr in zip(encoded_perception, self))
 
     def subsumes(self, other: Condition):
+        bounds = self._indexed_bounds()
+        if bounds is not None:
+            other_bounds = other._indexed_bounds()
+            if other_bounds is None:
+                other_bounds = IntervalMatrix.bounds_of(other)
+
+            return IntervalMatrix.incorporates(bounds, other_bounds)
+
         return all(ci.incorporates(oi) for ci, oi in zip(self, other))
 
+    def _indexed_bounds(self) -> Optional[np.ndarray]:
+        # Row of the `IntervalMatrix` attached to a population
+        # tracking the condition (if any)
+        for population in self._listeners:
+            matrix = getattr(population, 'matcher', None)
+            if isinstance(matrix, IntervalMatrix):
+                pos = population.condition_position(self)
+                if pos >= 0:
+                    return matrix.bounds[pos]
+
+        return None
+
     def __repr__(self):
         return "|".join(visualize(
             (ubr.lower_bound, ubr.upper_bound),
@@ -27,7 +27,10 @@ class Configuration:
                  theta_ga: int = 100,
                  theta_as: int = 20,
                  mu: float = 0.3,
-                 chi: float = 0.8) -> None:
+                 chi: float = 0.8,
+                 match_index=None,
+                 match_set_cache_size: int = 0,
+                 parameter_store: bool = False) -> None:
 
         if encoder is None:
             raise TypeError('Real number encoder should be passed')
@@ -68,3 +71,16 @@ class Configuration:
 
         self.mu = mu
         self.chi = chi
+
+        # Optional class of matching index (i.e. `IntervalMatrix` or
+        # `HyperrectangleIndex`) attached to the agent population
+        # for faster match set formation
+        self.match_index = match_index
+
+        # Maximum number of match sets remembered by the agent (LRU),
+        # 0 disables caching
+        self.match_set_cache_size = match_set_cache_size
+
+        # Keep learning parameters of the population classifiers
+        # in NumPy columns (see `ParameterStore`)
+        self.parameter_store = parameter_store
@@ -5,6 +5,7 @@ from copy import copy
 from lcs import Perception
 from lcs.representations.visualization import visualize
 from . import Configuration
+from .EncodedPerception import encode
 from .. import PerceptionString
 
 
@@ -72,8 +73,8 @@ class Effect(PerceptionString):
         bool
             True if specializable, false otherwise
         """
-        encoded_p0 = list(map(self.cfg.encoder.encode, p0))
-        encoded_p1 = list(map(self.cfg.encoder.encode, p1))
+        encoded_p0 = encode(p0, self.cfg.encoder)
+        encoded_p1 = encode(p1, self.cfg.encoder)
 
         for p0i, p1i, ei in zip(encoded_p0, encoded_p1, self):
             if ei != self.wildcard:
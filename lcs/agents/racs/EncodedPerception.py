@@ -0,0 +1,52 @@
+from typing import Sequence
+
+from lcs import Perception
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class EncodedPerception(Perception):
+    """
+    Real-valued perception carrying additionally its encoded form.
+
+    Raw values are still available with regular sequence access
+    (i.e. for computing noisy interval bounds), while `encoded` holds
+    the discrete states obtained with given encoder. The perception is
+    encoded only once, no matter how many classifiers are inspecting it.
+    """
+
+    __slots__ = ['encoded', 'encoder']
+
+    def __init__(self, observation, encoder: RealValueEncoder) -> None:
+        self._items = tuple(observation)
+        self._binary = None
+        self._hash = None
+        self.oktypes = None
+
+        self.encoder = encoder
+        self.encoded = tuple(encoder.encode_batch(self._items).tolist())
+
+
+def encode(perception: Perception,
+           encoder: RealValueEncoder) -> Sequence[int]:
+    """
+    Returns the encoded form of given perception. Encoding performed
+    previously with the same encoder is reused, raw perceptions
+    are encoded attribute by attribute.
+
+    Parameters
+    ----------
+    perception: Perception
+        raw or already encoded perception
+    encoder: RealValueEncoder
+        encoder used by the classifier
+
+    Returns
+    -------
+    Sequence[int]
+        encoded attribute values
+    """
+    if isinstance(perception, EncodedPerception) \
+            and perception.encoder is encoder:
+        return perception.encoded
+
+    return [encoder.encode(p) for p in perception]
@@ -0,0 +1,218 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from lcs import Perception
+from lcs.agents import MatchingIndex, ContainmentIndex
+from lcs.agents.racs import Configuration
+from lcs.agents.racs.EncodedPerception import encode
+from lcs.utils import bitset_insert, bitset_remove, bitset_indices
+
+
+class HyperrectangleIndex(MatchingIndex, ContainmentIndex):
+    """
+    Spatial index of interval-based classifier conditions.
+
+    Each condition is an axis-aligned box in the encoded space
+    (see `RealValueEncoder.range`). For every attribute a segment tree
+    over the encoded values is kept - each interval is stored (as a bit
+    of population position) in at most `2 log(R)` canonical tree nodes.
+    Intervals containing value `v` are the union of nodes on the path
+    from leaf `v` to the root, therefore:
+
+    * point-stabbing (matching the perception) is an intersection
+      of such unions over all attributes,
+    * boxes containing another box (subsumers) are those stabbed
+      by both of its corners, as the intervals are convex.
+
+    Additionally each lower bound is stored in all the nodes on the path
+    from its leaf to the root, so the intervals starting within a range
+    are the union of its canonical nodes. Boxes contained by another box
+    are those starting within it and not stabbed just above it.
+
+    Modification of a single classifier touches only the nodes
+    representing its old and new intervals. Insertion and deletion
+    additionally shift the bit positions of the following classifiers.
+
+    Attach it to the population with `ClassifierList.attach_index` or
+    pass the class as `match_index` in the `Configuration`.
+    """
+
+    def __init__(self, cfg: Configuration) -> None:
+        self.cfg = cfg
+        self._size = 0
+
+        # Number of leaves - encoded range padded to the power of two
+        self._leaves = 1
+        while self._leaves < cfg.encoder.range[1] + 1:
+            self._leaves *= 2
+
+        self._nodes: List[Dict[int, int]] = []
+        self._lowers: List[Dict[int, int]] = []
+
+        # Bounds of indexed intervals of classifiers at each position
+        self._bounds: List[Tuple[Tuple[int, int], ...]] = []
+        self._clear()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def rebuild(self, population) -> None:
+        self._clear()
+        for idx, cl in enumerate(population):
+            self._bounds.append(self._bounds_of(cl.condition))
+            self._set(idx, self._bounds[idx])
+        self._size = len(population)
+
+    def insert(self, idx: int, cl) -> None:
+        if idx < self._size:
+            self._transform(lambda bits: bitset_insert(bits, idx))
+
+        self._bounds.insert(idx, self._bounds_of(cl.condition))
+        self._set(idx, self._bounds[idx])
+        self._size += 1
+
+    def remove(self, idx: int, cl) -> None:
+        self._transform(lambda bits: bitset_remove(bits, idx))
+        del self._bounds[idx]
+        self._size -= 1
+
+    def update(self, idx: int, cl) -> None:
+        self._unset(idx, self._bounds[idx])
+        self._bounds[idx] = self._bounds_of(cl.condition)
+        self._set(idx, self._bounds[idx])
+
+    def stab_bits(self, point: Iterable[int]) -> int:
+        """
+        Parameters
+        ----------
+        point: Iterable[int]
+            encoded value for each attribute
+
+        Returns
+        -------
+        int
+            bitset of population positions which condition contains
+            given point
+        """
+        matching = (1 << self._size) - 1
+
+        for nodes, value in zip(self._nodes, point):
+            matching &= self._stab(nodes, value)
+            if not matching:
+                break
+
+        return matching
+
+    def match(self, situation: Perception) -> np.ndarray:
+        encoded = encode(situation, self.cfg.encoder)
+        return bitset_indices(self.stab_bits(encoded))
+
+    def containing(self, condition) -> np.ndarray:
+        lower = self.stab_bits(ubr.lower_bound for ubr in condition)
+        upper = self.stab_bits(ubr.upper_bound for ubr in condition)
+        return bitset_indices(lower & upper)
+
+    def contained(self, condition) -> np.ndarray:
+        contained = (1 << self._size) - 1
+
+        for nodes, lowers, ubr in zip(self._nodes, self._lowers, condition):
+            lower, upper = ubr.lower_bound, ubr.upper_bound
+            starting = 0
+            for node in self._canonical_nodes(lower, upper):
+                starting |= lowers.get(node, 0)
+
+            contained &= starting & ~self._stab(nodes, upper + 1)
+            if not contained:
+                break
+
+        return bitset_indices(contained)
+
+    def _stab(self, nodes: Dict[int, int], value: int) -> int:
+        """
+        Returns bitset of positions which interval (of one attribute)
+        contains given value.
+        """
+        if value >= self._leaves:
+            return 0
+
+        node = value + self._leaves
+        stabbed = 0
+        while node:
+            stabbed |= nodes.get(node, 0)
+            node >>= 1
+
+        return stabbed
+
+    def _clear(self) -> None:
+        self._size = 0
+        self._nodes = [{} for _ in range(self.cfg.classifier_length)]
+        self._lowers = [{} for _ in range(self.cfg.classifier_length)]
+        self._bounds = []
+
+    @staticmethod
+    def _bounds_of(condition) -> Tuple[Tuple[int, int], ...]:
+        return tuple((ubr.lower_bound, ubr.upper_bound) for ubr in condition)
+
+    def _set(self, idx: int, bounds: Tuple[Tuple[int, int], ...]) -> None:
+        bit = 1 << idx
+
+        for nodes, lowers, (lower, upper) in zip(self._nodes, self._lowers,
+                                                 bounds):
+            for node in self._canonical_nodes(lower, upper):
+                nodes[node] = nodes.get(node, 0) | bit
+
+            node = lower + self._leaves
+            while node:
+                lowers[node] = lowers.get(node, 0) | bit
+                node >>= 1
+
+    def _unset(self, idx: int, bounds: Tuple[Tuple[int, int], ...]) -> None:
+        mask = ~(1 << idx)
+
+        def clear(tree: Dict[int, int], node: int) -> None:
+            bits = tree[node] & mask
+            if bits:
+                tree[node] = bits
+            else:
+                del tree[node]
+
+        for nodes, lowers, (lower, upper) in zip(self._nodes, self._lowers,
+                                                 bounds):
+            for node in self._canonical_nodes(lower, upper):
+                clear(nodes, node)
+
+            node = lower + self._leaves
+            while node:
+                clear(lowers, node)
+                node >>= 1
+
+    def _canonical_nodes(self, lower: int, upper: int) -> List[int]:
+        """
+        Decomposes closed interval into disjoint segment tree nodes.
+        """
+        result = []
+        left, right = lower + self._leaves, upper + self._leaves + 1
+
+        while left < right:
+            if left & 1:
+                result.append(left)
+                left += 1
+            if right & 1:
+                right -= 1
+                result.append(right)
+            left >>= 1
+            right >>= 1
+
+        return result
+
+    def _transform(self, fcn) -> None:
+        for trees in (self._nodes, self._lowers):
+            for attr, nodes in enumerate(trees):
+                transformed = {}
+                for node, bits in nodes.items():
+                    bits = fcn(bits)
+                    if bits:
+                        transformed[node] = bits
+
+                trees[attr] = transformed
@@ -0,0 +1,216 @@
+from typing import Dict
+
+import numpy as np
+
+from lcs import Perception
+from lcs.agents import MatchingIndex, ContainmentIndex
+from lcs.agents.racs import Configuration
+from lcs.agents.racs.EncodedPerception import encode
+
+LOWER, UPPER = 0, 1
+
+
+class IntervalMatrix(MatchingIndex, ContainmentIndex):
+    """
+    Columnar (NumPy) backend for interval-based classifier conditions.
+
+    Normalized bounds of all conditions in the population are kept in
+    a contiguous (N, L, 2) integer array, where `[..., LOWER]` holds lower
+    and `[..., UPPER]` upper bounds of the encoded intervals. Rows are
+    aligned with classifier positions in the population, so matching
+    an (encoded) perception is a single broadcast comparison.
+
+    The same arrays are used for looking up containing (and contained)
+    conditions, for subsumption checks and cover ratios of tracked
+    conditions (see `Condition.subsumes` and `Condition.cover_ratio`)
+    and for counting interval regions of the whole population
+    (see `metrics.count_averaged_regions`).
+
+    Attach it to the population with `ClassifierList.attach_index` or
+    pass the class as `match_index` in the `Configuration`.
+    """
+
+    def __init__(self, cfg: Configuration, capacity: int = 64) -> None:
+        self.cfg = cfg
+        self._size = 0
+        self._bounds = np.zeros((capacity, cfg.classifier_length, 2),
+                                dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            (N, L, 2) view of the bounds of indexed conditions
+        """
+        return self._bounds[:self._size]
+
+    @property
+    def lower(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            (N, L) view of the lower bounds of indexed conditions
+        """
+        return self._bounds[:self._size, :, LOWER]
+
+    @property
+    def upper(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            (N, L) view of the upper bounds of indexed conditions
+        """
+        return self._bounds[:self._size, :, UPPER]
+
+    def rebuild(self, population) -> None:
+        self._size = 0
+        self._reserve(len(population))
+        for idx, cl in enumerate(population):
+            self._write_row(idx, cl.condition)
+        self._size = len(population)
+
+    def insert(self, idx: int, cl) -> None:
+        self._reserve(self._size + 1)
+        if idx < self._size:
+            self._bounds[idx + 1:self._size + 1] = \
+                self._bounds[idx:self._size]
+
+        self._write_row(idx, cl.condition)
+        self._size += 1
+
+    def remove(self, idx: int, cl) -> None:
+        self._bounds[idx:self._size - 1] = self._bounds[idx + 1:self._size]
+        self._size -= 1
+
+    def update(self, idx: int, cl) -> None:
+        self._write_row(idx, cl.condition)
+
+    def match(self, situation: Perception) -> np.ndarray:
+        p = np.asarray(encode(situation, self.cfg.encoder))
+        hits = (self.lower <= p) & (p <= self.upper)
+        return np.flatnonzero(hits.all(axis=1))
+
+    def containing(self, condition) -> np.ndarray:
+        other = self.bounds_of(condition)
+        hits = (self.lower <= other[:, LOWER]) & \
+            (self.upper >= other[:, UPPER])
+        return np.flatnonzero(hits.all(axis=1))
+
+    def contained(self, condition) -> np.ndarray:
+        other = self.bounds_of(condition)
+        hits = (self.lower >= other[:, LOWER]) & \
+            (self.upper <= other[:, UPPER])
+        return np.flatnonzero(hits.all(axis=1))
+
+    def cover_ratios(self) -> np.ndarray:
+        """
+        Calculates `Condition.cover_ratio` of all indexed conditions.
+
+        Returns
+        -------
+        np.ndarray
+            (N,) array of cover ratios
+        """
+        return self.cover_ratio_of(self.bounds, self.cfg)
+
+    @staticmethod
+    def incorporates(bounds: np.ndarray, other: np.ndarray) -> bool:
+        """
+        Checks whether intervals given by `bounds` incorporate
+        the corresponding intervals of `other`.
+
+        Parameters
+        ----------
+        bounds: np.ndarray
+            (L, 2) bounds of the subsuming condition
+        other: np.ndarray
+            (L, 2) bounds of the subsumed condition
+
+        Returns
+        -------
+        bool
+            True if all intervals of `other` are incorporated
+        """
+        return bool((bounds[:, LOWER] <= other[:, LOWER]).all() and
+                    (bounds[:, UPPER] >= other[:, UPPER]).all())
+
+    @staticmethod
+    def cover_ratio_of(bounds: np.ndarray, cfg: Configuration):
+        """
+        Calculates cover ratio (see `Condition.cover_ratio`)
+        of the conditions given by their bounds.
+
+        Parameters
+        ----------
+        bounds: np.ndarray
+            (..., L, 2) bounds of the conditions
+        cfg: Configuration
+            configuration providing the encoder range
+
+        Returns
+        -------
+            cover ratio (array of them for more than one condition)
+        """
+        maximum_span = cfg.encoder.range[1] + 1
+        spans = bounds[..., UPPER] - bounds[..., LOWER] + 1
+        return spans.sum(axis=-1) / (bounds.shape[-2] * maximum_span)
+
+    @staticmethod
+    def bounds_of(condition) -> np.ndarray:
+        """
+        Parameters
+        ----------
+        condition: Condition
+            interval-based condition
+
+        Returns
+        -------
+        np.ndarray
+            (L, 2) array of normalized bounds of the condition
+        """
+        return np.array([(ubr.lower_bound, ubr.upper_bound)
+                         for ubr in condition], dtype=np.int32)
+
+    def interval_proportions(self) -> Dict[int, int]:
+        """
+        Counts interval regions (see
+        `Classifier.get_interval_proportions`) over all indexed conditions.
+
+        Returns
+        -------
+        Dict[int, int]
+            A dictionary with interval region counts
+        """
+        r = self.cfg.encoder.range
+        at_min = self.lower == r[0]
+        at_max = self.upper == r[1]
+
+        return {
+            1: int(np.count_nonzero(~at_min & ~at_max)),
+            2: int(np.count_nonzero(at_min & ~at_max)),
+            3: int(np.count_nonzero(~at_min & at_max)),
+            4: int(np.count_nonzero(at_min & at_max)),
+        }
+
+    def _write_row(self, idx: int, condition) -> None:
+        self._bounds[idx] = self.bounds_of(condition)
+
+    def _reserve(self, size: int) -> None:
+        capacity = max(len(self._bounds), 1)
+        if size <= len(self._bounds):
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        bounds = np.zeros((capacity, self.cfg.classifier_length, 2),
+                          dtype=np.int32)
+        bounds[:self._size] = self._bounds[:self._size]
+        self._bounds = bounds
@@ -1,26 +1,33 @@
 import random
-from typing import List
 
-from lcs import Perception, TypedList
-from lcs.agents.racs import Configuration, Condition
+from lcs import Perception
+from lcs.agents.BitsetMark import BitsetMark
+from lcs.agents.racs import Condition
+from lcs.agents.racs.EncodedPerception import encode
 from lcs.representations import UBR
 
 
-class Mark(TypedList):
+class Mark(BitsetMark):
+    """
+    Mark of the classifier. Encoded perception values are stored
+    as bits (at positions equal to the values) of the per-attribute
+    bitmasks. Other values get positions after the encoder range.
+    """
+    __slots__ = ()
 
-    def __init__(self, cfg: Configuration) -> None:
-        self.cfg = cfg
-        initial: List = [set() for _ in range(self.cfg.classifier_length)]
-        super().__init__(*initial, oktypes=(set,))
+    def _position(self, value) -> int:
+        encoded_values = self.cfg.encoder.range[1] + 1
+        if type(value) is int and 0 <= value < encoded_values:
+            return value
 
-    def is_marked(self) -> bool:
-        """
-        Returns
-        -------
-        bool
-            If mark is specified at any attribute
-        """
-        return any(len(attrib) != 0 for attrib in self)
+        return encoded_values + super()._position(value)
+
+    def _value(self, position: int):
+        encoded_values = self.cfg.encoder.range[1] + 1
+        if position < encoded_values:
+            return position
+
+        return super()._value(position - encoded_values)
 
     def complement_marks(self, perception: Perception) -> bool:
         """
@@ -39,13 +46,14 @@ class Mark(TypedList):
             True if any attribute was marked, False otherwise
 
         """
+        if not self._marked:
+            return False
+
         changed = False
-        encoded_perception = list(map(self.cfg.encoder.encode, perception))
+        encoded_perception = encode(perception, self.cfg.encoder)
 
-        for idx, attrib in enumerate(self):
-            new_elem = encoded_perception[idx]
-            if len(attrib) > 0 and new_elem not in self[idx]:
-                self[idx].add(new_elem)
+        for idx, value in enumerate(encoded_perception):
+            if self._extend(idx, 1 << value):
                 changed = True
 
         return changed
@@ -71,15 +79,15 @@ class Mark(TypedList):
         bool
             True if any attribute was marked, False otherwise
         """
-        if self.is_marked():
+        if self._marked:
             return self.complement_marks(perception)
 
         changed = False
-        encoded_perception = list(map(self.cfg.encoder.encode, perception))
+        encoded_perception = encode(perception, self.cfg.encoder)
 
         for idx, item in enumerate(condition):
             if item == self.cfg.classifier_wildcard:
-                self[idx].add(encoded_perception[idx])
+                self.mark(idx, encoded_perception[idx])
                 changed = True
 
         return changed
@@ -114,28 +122,24 @@ class Mark(TypedList):
         """
         diff = Condition.generic(self.cfg)
 
-        if self.is_marked():
-            enc_p0 = list(map(self.cfg.encoder.encode, p0))
-
-            # Unique and fuzzy difference counts
-            nr1, nr2 = 0, 0
+        if self._marked:
+            enc_p0 = encode(p0, self.cfg.encoder)
+            bits = self._items
 
-            # Count difference types
-            for idx, item in enumerate(self):
-                if len(item) > 0 and enc_p0[idx] not in item:
-                    nr1 += 1
-                elif len(item) > 1:
-                    nr2 += 1
+            # Attributes not containing the perceived value (unique
+            # differences) and containing more than one value (fuzzy ones)
+            unique = [idx for idx, item in enumerate(bits)
+                      if item and not item >> enc_p0[idx] & 1]
+            fuzzy = [idx for idx, item in enumerate(bits)
+                     if item & (item - 1)]
 
-            if nr1 > 0:
-                possible_idx = [pi for pi, p in enumerate(enc_p0) if
-                                p not in self[pi] and len(self[pi]) > 0]
-                rand_idx = random.choice(possible_idx)
+            if unique:
+                rand_idx = random.choice(unique)
                 p = enc_p0[rand_idx]
                 diff[rand_idx] = UBR(p, p)
-            elif nr2 > 0:
-                for pi, p in enumerate(enc_p0):
-                    if len(self[pi]) > 1:
-                        diff[pi] = UBR(p, p)
+            elif fuzzy:
+                for pi in fuzzy:
+                    p = enc_p0[pi]
+                    diff[pi] = UBR(p, p)
 
         return diff
@@ -3,8 +3,9 @@ import logging
 from lcs import Perception
 from lcs.agents.Agent import TrialMetrics
 from lcs.strategies.action_selection import choose_action
-from ...agents import Agent
-from ...agents.racs import Configuration, ClassifierList
+from ...agents import Agent, MatchSetCache, ParameterStore
+from ...agents.racs import Configuration, Classifier, ClassifierList, \
+    EncodedPerception
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +19,36 @@ class RACS(Agent):
         self.cfg = cfg
         self.population = population or ClassifierList()
 
+        if cfg.match_index is not None:
+            self.population.attach_index(cfg.match_index(cfg))
+
+        if cfg.parameter_store:
+            self.population.attach_index(ParameterStore(Classifier))
+
+        self.match_set_cache = None
+        if cfg.match_set_cache_size:
+            self.population.track_conditions()
+            self.match_set_cache = MatchSetCache(self.population,
+                                                 cfg.match_set_cache_size)
+
     def get_population(self):
         return self.population
 
     def get_cfg(self):
         return self.cfg
 
+    def get_match_set_cache(self):
+        return self.match_set_cache
+
+    def _perceive(self, raw_state) -> EncodedPerception:
+        """
+        Translates the raw environment state and encodes it once, so
+        that the encoding is shared by matching, ALP, RL and GA
+        within the step.
+        """
+        state = self.cfg.environment_adapter.to_genotype(raw_state)
+        return EncodedPerception(state, self.cfg.encoder)
+
     def _run_trial_explore(self, env, time, current_trial=None) \
             -> TrialMetrics:
         """
@@ -44,7 +69,7 @@ class RACS(Agent):
         # Initial conditions
         steps = 0
         raw_state = env.reset()
-        state = self.cfg.environment_adapter.to_genotype(raw_state)
+        state = self._perceive(raw_state)
 
         action = env.action_space.sample()
         reward = 0
@@ -53,7 +78,7 @@ class RACS(Agent):
         done = False
 
         while not done:
-            match_set = self.population.form_match_set(state)
+            match_set = self._form_match_set(state)
 
             if steps > 0:
                 # Apply learning in the last action set
@@ -99,7 +124,7 @@ class RACS(Agent):
             prev_state = state
             iaction = self.cfg.environment_adapter.to_lcs_action(action)
             raw_state, reward, done, _ = env.step(iaction)
-            state = self.cfg.environment_adapter.to_genotype(raw_state)
+            state = self._perceive(raw_state)
 
             if done:
                 ClassifierList.apply_alp(
@@ -141,14 +166,14 @@ class RACS(Agent):
 
         steps = 0
         raw_state = env.reset()
-        state = self.cfg.environment_adapter.to_genotype(raw_state)
+        state = self._perceive(raw_state)
 
         reward = 0
         action_set = ClassifierList()
         done = False
 
         while not done:
-            match_set = self.population.form_match_set(state)
+            match_set = self._form_match_set(state)
 
             if steps > 0:
                 ClassifierList.apply_reinforcement_learning(
@@ -168,7 +193,7 @@ class RACS(Agent):
             action_set = match_set.form_action_set(action)
 
             raw_state, reward, done, _ = env.step(iaction)
-            state = self.cfg.environment_adapter.to_genotype(raw_state)
+            state = self._perceive(raw_state)
 
             if done:
                 ClassifierList.apply_reinforcement_learning(
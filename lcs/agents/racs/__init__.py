@@ -1,5 +1,8 @@
 # flake8: noqa
 from .Configuration import Configuration
+from .EncodedPerception import EncodedPerception
+from .IntervalMatrix import IntervalMatrix
+from .HyperrectangleIndex import HyperrectangleIndex
 from .Condition import Condition
 from .Effect import Effect
 from .Mark import Mark
@@ -33,6 +33,9 @@ def mutate(cl: Classifier, mu: float) -> None:
             _widen_attribute(c, encoder, noise_max, mu)
             _widen_attribute(e, encoder, noise_max, mu)
 
+    # Intervals were modified in place
+    cl.condition.forget_derived()
+
 
 def crossover(parent: Classifier, donor: Classifier):
     assert parent.cfg.classifier_length == donor.cfg.classifier_length
@@ -1,12 +1,19 @@
 from typing import Dict
 
+from lcs.agents.racs import IntervalMatrix
+
 
 def count_averaged_regions(population) -> Dict[int, float]:
-    region_counts = {1: 0, 2: 0, 3: 0, 4: 0}
+    matcher = getattr(population, 'matcher', None)
+
+    if isinstance(matcher, IntervalMatrix):
+        region_counts = matcher.interval_proportions()
+    else:
+        region_counts = {1: 0, 2: 0, 3: 0, 4: 0}
 
-    for cl in population:
-        for region, counts in cl.get_interval_proportions().items():
-            region_counts[region] += counts
+        for cl in population:
+            for region, counts in cl.get_interval_proportions().items():
+                region_counts[region] += counts
 
     all_elems = sum(i for r, i in region_counts.items())
 
@@ -6,6 +6,14 @@ def basic_metrics(trial: int, steps: int, reward: int):
     }
 
 
+def match_set_cache_metrics(cache):
+    return {
+        'cache_hits': cache.hits,
+        'cache_misses': cache.misses,
+        'cache_evictions': cache.evictions
+    }
+
+
 def population_metrics(population, environment):
     metrics = {
         'population': 0,
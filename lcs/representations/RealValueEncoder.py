@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import Tuple
 
 import numpy as np
@@ -20,6 +21,7 @@ class RealValueEncoder:
         step = 1 / resolution
         self.upper_max = resolution - 1
         self.splits = [x * step for x in range(0, resolution + 1)]
+        self._splits = np.array(self.splits)
 
     @property
     def range(self) -> Tuple[int, int]:
@@ -54,7 +56,7 @@ class RealValueEncoder:
             raise ValueError("Value not in correct [0, 1] range")
 
         # Disturb value and limit it within range
-        val = np.clip(val + noise, 0, 1)
+        val = min(max(val + noise, 0), 1)
 
         # Check boundary conditions
         if val == 0:
@@ -63,18 +65,37 @@ class RealValueEncoder:
         if val == 1:
             return self.range[1]
 
-        # In other cases iterate over splits to find correct bucket
-        bucket = -1
-        for i, _ in enumerate(self.splits[:-1]):
-            x1 = self.splits[i]
-            x2 = self.splits[i + 1]
+        # In other cases find the bucket `i` such that
+        # `splits[i] <= val < splits[i + 1]`
+        return bisect_right(self.splits, val) - 1
 
-            if x1 <= val < x2:
-                bucket = i
+    def encode_batch(self, values, noise=None) -> np.ndarray:
+        """
+        Encodes multiple values (i.e. whole perception or a batch of
+        perceptions) at once. Gives the same results as `encode` applied
+        element-wise.
+
+        Parameters
+        ----------
+        values
+            array-like of real-valued numbers in range [0,1]
+        noise
+            optional noise (scalar or array broadcastable to `values`)
+
+        Returns
+        -------
+        np.ndarray
+            integer array of discrete states, same shape as `values`
+        """
+        values = np.asarray(values, dtype=float)
+        if np.any((values < 0) | (values > 1)):
+            raise ValueError("Value not in correct [0, 1] range")
 
-        assert bucket != -1
+        if noise is not None:
+            values = np.clip(values + noise, 0, 1)
 
-        return bucket
+        encoded = np.searchsorted(self._splits, values, side='right') - 1
+        return np.minimum(encoded, self.upper_max)
 
     def decode(self, encoded_val: int) -> float:
         """
@@ -96,3 +117,23 @@ class RealValueEncoder:
             raise ValueError("Value is not from possible resolution range")
 
         return encoded_val / self.upper_max
+
+    def decode_batch(self, encoded) -> np.ndarray:
+        """
+        Decodes multiple discrete values at once (see `decode`).
+
+        Parameters
+        ----------
+        encoded
+            array-like of encoded values
+
+        Returns
+        -------
+        np.ndarray
+            array of real-valued numbers from [0,1] range
+        """
+        encoded = np.asarray(encoded)
+        if np.any((encoded < 0) | (encoded > self.upper_max)):
+            raise ValueError("Value is not from possible resolution range")
+
+        return encoded / self.upper_max
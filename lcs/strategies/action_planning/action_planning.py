@@ -1,6 +1,7 @@
 from typing import List
 
 from lcs import Perception
+from lcs.agents import MatchSetCache
 from lcs.agents.acs2 import ClassifiersList
 from lcs.strategies.action_planning.goal_sequence_searcher \
     import GoalSequenceSearcher
@@ -40,7 +41,8 @@ def suitable_cl_exists(classifiers: ClassifiersList,
 
 def search_goal_sequence(classifiers: ClassifiersList,
                          p0: Perception,
-                         p1: Perception) -> List:
+                         p1: Perception,
+                         match_set_cache: MatchSetCache = None) -> List:
     """
     Searches a path from start to goal using a bidirectional method in the
     environmental model (i.e. the list of reliable classifiers).
@@ -52,6 +54,8 @@ def search_goal_sequence(classifiers: ClassifiersList,
         start state
     p1: Perception
         destination state
+    match_set_cache: MatchSetCache
+        optional cache of match sets formed from `classifiers`
 
     Returns
     -------
@@ -59,6 +63,6 @@ def search_goal_sequence(classifiers: ClassifiersList,
         sequence of actions
     """
     reliable = [cl for cl in classifiers if cl.is_reliable()]
-    gs = GoalSequenceSearcher()
+    gs = GoalSequenceSearcher(match_set_cache)
 
     return gs.search_goal_sequence(ClassifiersList(*reliable), p0, p1)
@@ -1,13 +1,17 @@
 from typing import List, Optional, Tuple
 
 from lcs import Perception
+from lcs.agents import MatchSetCache
 from lcs.agents.acs2 import Classifier
 from lcs.agents.acs2.ClassifiersList import ClassifiersList
 
 
 class GoalSequenceSearcher:
 
-    def __init__(self):
+    def __init__(self, match_set_cache: MatchSetCache = None):
+        # Cache of match sets formed from the whole population (reliable
+        # classifiers are a subset of it)
+        self.match_set_cache = match_set_cache
         self.forward_classifiers = []
         self.backward_classifiers = []
         self.forward_perceptions = []
@@ -93,8 +97,8 @@ class GoalSequenceSearcher:
         """
         size = forward_size
         for i in range(forward_point, forward_size):
-            match_forward = reliable_classifiers. \
-                form_match_set(situation=self.forward_perceptions[i])
+            match_forward = self._form_match_set(
+                reliable_classifiers, self.forward_perceptions[i])
             for match_set_element in match_forward:
                 anticipation = match_set_element. \
                     get_best_anticipation(self.forward_perceptions[i])
@@ -166,6 +170,15 @@ class GoalSequenceSearcher:
                             i, forward_sequence_idx, match_set_el), size
         return None, size
 
+    def _form_match_set(self,
+                        reliable_classifiers: ClassifiersList,
+                        situation: Perception) -> ClassifiersList:
+        if self.match_set_cache is None:
+            return reliable_classifiers.form_match_set(situation)
+
+        return ClassifiersList(*[cl for cl in self.match_set_cache.get(
+            situation) if cl.is_reliable()])
+
     @staticmethod
     def _form_new_classifiers(classifiers_lists: List[ClassifiersList],
                               i: int,
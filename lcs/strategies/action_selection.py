@@ -1,6 +1,5 @@
 import logging
 import random
-from itertools import groupby
 
 import numpy as np
 
@@ -126,8 +125,7 @@ def choose_latest_action(cll, all_actions: int) -> int:
     if len(cll) > 0:
         last_executed_cls = min(cll, key=lambda cl: cl.talp)
 
-        cll.sort(key=lambda cl: cl.action)
-        for _action, _clss in groupby(cll, lambda cl: cl.action):
+        for _action, _clss in sorted(cll.action_buckets().items()):
             number_of_cls_per_action[_action] = \
                 sum([cl.num for cl in _clss])
 
@@ -164,11 +162,7 @@ def choose_action_from_knowledge_array(cll, all_actions: int) -> int:
     """
     knowledge_array = {i: 0.0 for i in range(all_actions)}
 
-    cll.sort(key=lambda cl: cl.action)
-
-    for _action, _clss in groupby(cll, lambda cl: cl.action):
-        _classifiers = [cl for cl in _clss]
-
+    for _action, _classifiers in sorted(cll.action_buckets().items()):
         agg_q = sum(cl.q * cl.num for cl in _classifiers)
         agg_num = sum(cl.num for cl in _classifiers)
 
@@ -1,4 +1,5 @@
-from lcs.strategies.subsumption import does_subsume
+from lcs.strategies.subsumption import does_subsume, find_similar, \
+    subsumer_candidates
 
 
 def add_classifier(child, population, new_list, theta_exp: int) -> None:
@@ -24,22 +25,21 @@ def add_classifier(child, population, new_list, theta_exp: int) -> None:
     old_cl = None
 
     # Look if there is a classifier that subsumes the insertion candidate
-    for cl in population:
-        if does_subsume(cl, child, theta_exp):
-            if old_cl is None or cl.is_more_general(old_cl):
-                old_cl = cl
+    if hasattr(population, 'find_subsumer'):
+        old_cl = population.find_subsumer(child, theta_exp)
+    else:
+        for cl in subsumer_candidates(child, population):
+            if does_subsume(cl, child, theta_exp):
+                if old_cl is None or cl.is_more_general(old_cl):
+                    old_cl = cl
 
     # Check if any similar classifier was in this ALP run
     if old_cl is None:
-        for cl in new_list:
-            if cl == child:
-                old_cl = cl
+        old_cl = find_similar(child, new_list, last=True)
 
     # Check if there is similar classifier already
     if old_cl is None:
-        for cl in population:
-            if cl == child:
-                old_cl = cl
+        old_cl = find_similar(child, population, last=True)
 
     if old_cl is None:
         new_list.append(child)
@@ -1,10 +1,11 @@
 import random
-from typing import Callable, Dict
+from typing import Callable, List, Sequence
 
 import numpy as np
 
 from lcs import Perception
-from lcs.strategies.subsumption import find_subsumers
+from lcs.agents.ParameterStore import stored_rows
+from lcs.strategies.subsumption import find_subsumer, find_similar
 
 
 def should_apply(action_set, time: int, theta_ga: int) -> bool:
@@ -32,8 +33,14 @@ def should_apply(action_set, time: int, theta_ga: int) -> bool:
     if action_set is None:
         return False
 
-    overall_time = sum(cl.tga * cl.num for cl in action_set)
-    overall_num = sum(cl.num for cl in action_set)
+    store, rows = stored_rows(action_set) if action_set else (None, None)
+    if store is not None:
+        num = store.column('num')[rows]
+        overall_time = int(np.dot(store.column('tga')[rows], num))
+        overall_num = int(num.sum())
+    else:
+        overall_time = sum(cl.tga * cl.num for cl in action_set)
+        overall_num = sum(cl.num for cl in action_set)
 
     if overall_num == 0:
         return False
@@ -58,6 +65,11 @@ def set_timestamps(action_set, epoch: int) -> None:
     epoch: int
         current epoch
     """
+    store, rows = stored_rows(action_set) if action_set else (None, None)
+    if store is not None:
+        store.column('tga')[rows] = epoch
+        return
+
     for cl in action_set:
         cl.tga = epoch
 
@@ -67,6 +79,10 @@ def roulette_wheel_selection(population, fitnessfunc: Callable):
     Select two objects from population according
     to roulette-wheel selection.
 
+    Fitness of all the classifiers is evaluated once, both parents
+    are then picked by bisecting the cumulative sum
+    (see `batch_roulette_wheel_selection`).
+
     Parameters
     ----------
     population
@@ -78,12 +94,58 @@ def roulette_wheel_selection(population, fitnessfunc: Callable):
     tuple
         two classifiers selected as parents
     """
-    choices = {cl: fitnessfunc(cl) for cl in population}
+    return batch_roulette_wheel_selection([population], fitnessfunc)[0]
+
+
+def batch_roulette_wheel_selection(action_sets: Sequence,
+                                   fitnessfunc: Callable) -> List[tuple]:
+    """
+    Selects two parents from each of the given sets according
+    to roulette-wheel selection (i.e. when applications of GA
+    are deferred and then run together).
+
+    Fitness of all the classifiers is evaluated into one vector with
+    a single cumulative sum, all the parents are then picked with one
+    `searchsorted` call.
+
+    Parameters
+    ----------
+    action_sets: Sequence
+        non-empty populations of classifiers
+    fitnessfunc: Callable
+        function evaluating fitness for each classifier. Very often cl.q^3
+
+    Returns
+    -------
+    List[tuple]
+        two classifiers selected as parents for each set
+    """
+    if not action_sets:
+        return []
+
+    sizes = np.array([len(action_set) for action_set in action_sets])
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+
+    cumulative = np.cumsum(np.concatenate(
+        [_fitness_vector(action_set, fitnessfunc)
+         for action_set in action_sets]))
+    base = np.where(starts > 0, cumulative[starts - 1], 0.0)
+    totals = cumulative[ends - 1] - base
 
-    parent1 = _weighted_random_choice(choices)
-    parent2 = _weighted_random_choice(choices)
+    # Two spins of the wheel of each set
+    picks = base[:, None] + np.array(
+        [[random.uniform(0, total), random.uniform(0, total)]
+         for total in totals.tolist()])
 
-    return parent1, parent2
+    # The last classifier of the set is taken when no cumulative
+    # fitness exceeds the pick
+    selected = np.searchsorted(cumulative, picks, side='right')
+    selected = np.minimum(selected, ends[:, None] - 1) - starts[:, None]
+
+    return [(action_set[first], action_set[second])
+            for action_set, (first, second)
+            in zip(action_sets, selected.tolist())]
 
 
 def generalizing_mutation(cl, mu: float) -> None:
@@ -92,9 +154,10 @@ def generalizing_mutation(cl, mu: float) -> None:
     Specified attributes in classifier conditions are randomly
     generalized with `mu` probability.
     """
-    for idx, cond in enumerate(cl.condition):
-        if cond != cl.cfg.classifier_wildcard and random.random() < mu:
-            cl.condition.generalize(idx)
+    wildcard = cl.cfg.classifier_wildcard
+    cl.condition.set_many({idx: wildcard
+                           for idx, cond in enumerate(cl.condition)
+                           if cond != wildcard and random.random() < mu})
 
 
 def two_point_crossover(parent, donor) -> None:
@@ -119,9 +182,8 @@ def two_point_crossover(parent, donor) -> None:
     chromosome2 = donor.condition[left:right]
 
     # Flip them
-    for idx, el in enumerate(range(left, right)):
-        parent.condition[el] = chromosome2[idx]
-        donor.condition[el] = chromosome1[idx]
+    parent.condition.set_many(dict(zip(range(left, right), chromosome2)))
+    donor.condition.set_many(dict(zip(range(left, right), chromosome1)))
 
 
 def add_classifier(cl, p: Perception,
@@ -178,26 +240,62 @@ def delete_classifiers(population, match_set, action_set,
         the maximal number of classifiers in an action set.
     """
     while (insize + sum(cl.num for cl in action_set)) > theta_as:
-        cl_del = None
-
-        while cl_del is None:  # We must delete at least one
-            for cl in action_set.expand():
-                if random.random() < .3:
-                    if cl_del is None:
-                        cl_del = cl
-                    else:
-                        if _is_preferred_to_delete(cl_del, cl):
-                            cl_del = cl
-
-        if cl_del is not None:
-            if cl_del.num > 1:
-                cl_del.num -= 1
-            else:
-                # Removes classifier from population, match set
-                # and current list
-                lists = [x for x in [population, match_set, action_set] if x]
-                for lst in lists:
-                    lst.safe_remove(cl_del)
+        cl_del = _select_for_deletion(action_set)
+
+        if cl_del is None:
+            break
+
+        if cl_del.num > 1:
+            cl_del.num -= 1
+        else:
+            # Removes classifier from population, match set
+            # and current list
+            lists = [x for x in [population, match_set, action_set] if x]
+            for lst in lists:
+                lst.safe_remove(cl_del)
+
+
+def _select_for_deletion(action_set):
+    """
+    Selects a classifier to be deleted (or to have its numerosity
+    decreased).
+
+    Each micro-classifier is considered with probability 0.3 and
+    the worst considered one (see `_is_preferred_to_delete`) is picked.
+    Micro-classifiers of the same macro-classifier are identical,
+    therefore macro-classifier is considered when any of its `num`
+    copies is - with probability `1 - 0.7 ** num`. The whole round is
+    drawn with a single NumPy call and repeated until something
+    is considered.
+
+    Parameters
+    ----------
+    action_set:
+        classifiers competing for deletion
+
+    Returns
+    -------
+    Optional[Classifier]
+        classifier to be deleted, None for an empty action set
+    """
+    if not action_set:
+        return None
+
+    weights = 1 - .7 ** np.fromiter((cl.num for cl in action_set),
+                                    dtype=float, count=len(action_set))
+
+    considered = []
+    while not considered:  # We must delete at least one
+        # All the classifiers are drawn for a round at once
+        hits = np.random.random(len(weights)) < weights
+        considered = [action_set[i] for i in np.flatnonzero(hits)]
+
+    cl_del = considered[0]
+    for cl in considered[1:]:
+        if _is_preferred_to_delete(cl_del, cl):
+            cl_del = cl
+
+    return cl_del
 
 
 def _is_preferred_to_delete(cl_del, cl) -> bool:
@@ -236,13 +334,8 @@ def _find_old_classifier(population,
     old_cl = None
 
     if use_subsumption:
-        subsumers = find_subsumers(cl, population, theta_exp)
-
         # Try to find most general subsumer
-        try:
-            old_cl = subsumers[0]
-        except IndexError:
-            pass
+        old_cl = find_subsumer(cl, population, theta_exp)
 
     # If there is no subsumer - look for similar classifiers
     if old_cl is None:
@@ -267,15 +360,9 @@ def _find_similar(other_cl, population):
         classifier (with the same condition, action, effect),
         None otherwise
     """
-    return next(filter(lambda cl: cl == other_cl, population), None)
-
+    return find_similar(other_cl, population)
 
-def _weighted_random_choice(choices: Dict):
-    max = sum(choices.values())
-    pick = random.uniform(0, max)
-    current = 0
 
-    for key, value in choices.items():
-        current += value
-        if current > pick:
-            return key
+def _fitness_vector(population, fitnessfunc: Callable) -> np.ndarray:
+    return np.fromiter((fitnessfunc(cl) for cl in population),
+                       dtype=float, count=len(population))
@@ -1,3 +1,4 @@
+import numpy as np
 
 
 def bucket_brigade_update(cl,
@@ -52,3 +53,71 @@ def update_classifier(cl,
     # Update classifier properties
     cl.r += beta * (_discounted_reward - cl.r)
     cl.ir += beta * (step_reward - cl.ir)
+
+
+def update_classifiers(r: np.ndarray,
+                       ir: np.ndarray,
+                       rows: np.ndarray,
+                       step_reward: int,
+                       max_fitness: float,
+                       beta: float,
+                       gamma: float):
+    """
+    Vectorized `update_classifier` applied to many classifiers at once.
+
+    Reward and immediate reward columns (see `ParameterStore`) are
+    updated in place at given rows, giving exactly the same values
+    as updating classifiers one by one.
+
+    Parameters
+    ----------
+    r: np.ndarray
+        reward column
+    ir: np.ndarray
+        immediate reward column
+    rows: np.ndarray
+        distinct rows of classifiers to be updated
+    step_reward: int
+        current reward obtained from the environment after executing step
+    max_fitness: float
+        maximum fitness - back-propagated reinforcement. Maximum fitness
+        from the match set
+    beta: float
+    gamma: float
+    """
+    _discounted_reward = step_reward + gamma * max_fitness
+
+    r[rows] += beta * (_discounted_reward - r[rows])
+    ir[rows] += beta * (step_reward - ir[rows])
+
+
+def maximum_fitness(q: np.ndarray,
+                    r: np.ndarray,
+                    rows: np.ndarray,
+                    anticipated_change: np.ndarray) -> float:
+    """
+    Vectorized maximum fitness (`q * r`) of classifiers anticipating
+    a change in environment.
+
+    Parameters
+    ----------
+    q: np.ndarray
+        quality column
+    r: np.ndarray
+        reward column
+    rows: np.ndarray
+        rows of classifiers
+    anticipated_change: np.ndarray
+        boolean mask of classifiers (aligned with `rows`) anticipating
+        a change
+
+    Returns
+    -------
+    float
+        fitness value, 0.0 when no classifier anticipates a change
+    """
+    if not anticipated_change.any():
+        return 0.0
+
+    rows = rows[anticipated_change]
+    return float((q[rows] * r[rows]).max())
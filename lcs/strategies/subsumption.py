@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 
 def find_subsumers(cl, population, theta_exp: int) -> List:
@@ -20,10 +20,95 @@ def find_subsumers(cl, population, theta_exp: int) -> List:
         list of subsumers (classifiers) sorted by specificity (most general
         are first)
     """
-    subsumers = [sub for sub in population if does_subsume(sub, cl, theta_exp)]
+    candidates = subsumer_candidates(cl, population)
+    subsumers = [sub for sub in candidates if does_subsume(sub, cl, theta_exp)]
     return sorted(subsumers, key=lambda cl: cl.condition.specificity)
 
 
+def subsumer_candidates(cl, population):
+    """
+    Narrows `population` to the classifiers which might subsume `cl`
+    (keeping their order). Populations capable of doing it by themselves
+    (`subsumer_candidates` method) are asked directly.
+
+    Parameters
+    ----------
+    cl:
+        classifier
+    population:
+        population of classifiers
+
+    Returns
+    -------
+    Iterable
+        candidate subsumers (the population itself if it can't be
+        narrowed)
+    """
+    finder = getattr(population, 'subsumer_candidates', None)
+    if finder is not None:
+        return finder(cl)
+
+    return population
+
+
+def find_subsumer(cl, population, theta_exp: int) -> Optional:
+    """
+    Looks for the most general subsumer of `cl` inside `population`
+    (the first one in case of a tie). Populations capable of doing it
+    by themselves (`find_subsumer` method) are asked directly.
+
+    Parameters
+    ----------
+    cl:
+        classifier
+    population:
+        population of classifiers
+    theta_exp: int
+        subsumption experience threshold
+
+    Returns
+    -------
+    Optional
+        most general subsumer, None otherwise
+    """
+    finder = getattr(population, 'find_subsumer', None)
+    if finder is not None:
+        return finder(cl, theta_exp)
+
+    return next(iter(find_subsumers(cl, population, theta_exp)), None)
+
+
+def find_similar(cl, population, last: bool = False) -> Optional:
+    """
+    Looks for classifier with the same condition, action and effect
+    as `cl` inside `population`. Populations capable of doing it
+    by themselves (`find_similar` method) are asked directly.
+
+    Parameters
+    ----------
+    cl:
+        classifier
+    population:
+        population of classifiers
+    last: bool
+        return the last similar classifier instead of the first one
+
+    Returns
+    -------
+    Optional
+        similar classifier, None otherwise
+    """
+    finder = getattr(population, 'find_similar', None)
+    if finder is not None:
+        return finder(cl, last=last)
+
+    similar = [other for other in population if other == cl]
+    if not similar:
+        return None
+
+    return similar[-1] if last else similar[0]
+
+
 def does_subsume(cl, other_cl, theta_exp: int) -> bool:
     """
     Returns if a classifier `cl` subsumes `other_cl` classifier
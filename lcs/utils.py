@@ -1,3 +1,54 @@
+import numpy as np
+
+
 def check_types(oktypes, o):
     if not isinstance(o, oktypes):
         raise TypeError(f"Wrong element type: object {o}, type {type(o)}")
+
+
+def compact_symbols(items):
+    """
+    Returns the sequence of symbols in the most compact form. When all
+    items are one-character strings they are joined into a single `str`
+    (one byte per attribute for latin-1 alphabets, compared with `memcmp`),
+    otherwise a tuple is returned.
+    """
+    items = tuple(items)
+    if all(type(i) is str and len(i) == 1 for i in items):
+        return ''.join(items)
+
+    return items
+
+
+def bitset_insert(bits: int, idx: int) -> int:
+    """
+    Opens an unset gap at position `idx` of the bitset shifting all higher
+    bits one position up.
+    """
+    low = bits & ((1 << idx) - 1)
+    return low | ((bits >> idx) << (idx + 1))
+
+
+def bitset_remove(bits: int, idx: int) -> int:
+    """
+    Drops the bit at position `idx` of the bitset shifting all higher
+    bits one position down.
+    """
+    low = bits & ((1 << idx) - 1)
+    return low | ((bits >> (idx + 1)) << idx)
+
+
+def bitset_indices(bits: int) -> np.ndarray:
+    """
+    Returns
+    -------
+    np.ndarray
+        ascending positions of all set bits
+    """
+    if bits == 0:
+        return np.empty(0, dtype=np.intp)
+
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    unpacked = np.unpackbits(np.frombuffer(raw, dtype=np.uint8),
+                             bitorder='little')
+    return np.flatnonzero(unpacked)
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs import Condition, BinaryCondition
+
+
+class TestBinaryCondition:
+
+    @staticmethod
+    def _random_condition(length, symbols='01#'):
+        return ''.join(random.choice(symbols) for _ in range(length))
+
+    def test_should_pack_condition(self):
+        # when
+        cond = BinaryCondition('1#0#1')
+
+        # then
+        assert cond.care == 0b10101
+        assert cond.value == 0b10001
+        assert cond.specificity == 3
+        assert cond == Condition('1#0#1')
+
+    def test_should_pack_unchecked_condition(self):
+        # when
+        cond = BinaryCondition._unchecked(('1', '#', '0', '#', '1'))
+
+        # then
+        assert cond.care == 0b10101
+        assert cond.value == 0b10001
+        assert cond == BinaryCondition('1#0#1')
+
+    def test_should_reject_non_binary_symbols(self):
+        with pytest.raises(ValueError):
+            BinaryCondition('1#9#1')
+
+    def test_should_repack_after_modification(self):
+        # given
+        cond = BinaryCondition('1#0#1')
+
+        # when
+        cond.generalize(0)
+        cond[1] = '1'
+
+        # then
+        assert cond.care == 0b01101
+        assert cond.value == 0b01001
+        assert cond.does_match(Perception('01001'))
+
+    def test_should_copy_as_binary_condition(self):
+        # when
+        cond = BinaryCondition(BinaryCondition('1#0#1'))
+
+        # then
+        assert cond.care == 0b10101
+
+    def test_should_behave_like_condition(self):
+        random.seed(42)
+
+        for _ in range(200):
+            # given
+            c1 = self._random_condition(16)
+            c2 = self._random_condition(16)
+            p = Perception(self._random_condition(16, '01'))
+
+            # then
+            assert BinaryCondition(c1).does_match(p) == \
+                Condition(c1).does_match(p)
+            assert BinaryCondition(c1).subsumes(BinaryCondition(c2)) == \
+                Condition(c1).subsumes(Condition(c2))
+            assert BinaryCondition(c1).specificity == \
+                Condition(c1).specificity
+
+    def test_should_fall_back_for_non_binary_perception(self):
+        # given
+        cond = BinaryCondition('1#0#1')
+
+        # then
+        assert cond.does_match(Perception('1#0#1'))
+        assert cond.does_match(Perception('19091'))
+        assert not cond.does_match(Perception('19191'))
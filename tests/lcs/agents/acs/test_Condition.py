@@ -1,6 +1,7 @@
 import pytest
 
 from lcs import Perception
+from lcs.agents import DerivedValues
 from lcs.agents.acs.Condition import Condition
 
 
@@ -62,6 +63,34 @@ class TestCondition:
         # then
         assert 1 == condition.specificity
 
+    def test_should_share_cached_specificity_with_copy(self, mocker):
+        # given
+        condition = Condition('#11#####')
+        assert 2 == condition.specificity
+        compute = mocker.spy(Condition, '_specificity')
+
+        # when
+        copy = Condition(condition)
+        copy.specialize_with_condition(Condition('1#######'))
+
+        # then
+        assert 2 == condition.specificity
+        assert 3 == copy.specificity
+        assert compute.call_count == 1
+
+    def test_should_detect_stale_specificity_in_verify_mode(self, mocker):
+        # given
+        mocker.patch.object(DerivedValues, 'verify_derived', True)
+        condition = Condition('#11#####')
+        assert 2 == condition.specificity
+
+        # when
+        condition._items = '111#####'
+
+        # then
+        with pytest.raises(AssertionError):
+            _ = condition.specificity
+
     def test_should_only_accept_strings(self):
         condition = Condition([])
 
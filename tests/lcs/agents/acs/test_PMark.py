@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 
 from lcs import Perception
@@ -25,6 +27,54 @@ class TestPMark:
         mark[1].add('0')
         assert mark.is_marked() is True
 
+    def test_should_allocate_bits_when_marked(self, cfg):
+        # given
+        mark = PMark(cfg)
+        assert mark._items == []
+        assert mark.bits(1) == 0
+
+        # when
+        mark[1].update(['0', '1'])
+        mark[3].add('1')
+
+        # then
+        assert len(mark._items) == 8
+        assert bin(mark.bits(1)).count('1') == 2
+        assert mark.bits(1) & mark.bits(3) == mark.bits(3)
+        assert sorted(mark.values(1)) == ['0', '1']
+        assert mark[1] == {'0', '1'} and mark[3] == {'1'}
+
+        # when
+        mark[1].clear()
+        mark[3].discard('1')
+
+        # then
+        assert mark.is_marked() is False
+        assert mark == PMark(cfg)
+
+    def test_should_assign_bit_positions_per_configuration(self, cfg):
+        # given
+        other_cfg = Configuration(8, 8)
+        mark, other_mark = PMark(cfg), PMark(other_cfg)
+
+        # when
+        mark[0].update(['0', '1'])
+        other_mark[0].add('1')
+
+        # then
+        assert mark.bits(0) == 0b11
+        assert other_mark.bits(0) == 0b1
+        assert PMark(cfg)._values == ['0', '1']
+
+        # when
+        tables = len(PMark._tables)
+        del other_mark, other_cfg
+        gc.collect()
+
+        # then
+        assert len(PMark._tables) == tables - 1
+        assert cfg in PMark._tables
+
     def test_should_set_single_mark(self, cfg):
         mark = PMark(cfg)
         mark[1].add('0')
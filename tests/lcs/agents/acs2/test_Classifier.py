@@ -29,6 +29,23 @@ class TestClassifier:
         # then
         assert (cl1 == cl2) is _result
 
+    def test_should_update_fingerprint_on_modification(self, cfg):
+        # given
+        cl = Classifier(condition='1#######', action=1, effect='0#######',
+                        cfg=cfg)
+        fingerprint = cl.fingerprint
+
+        # when & then
+        assert cl.fingerprint is fingerprint
+        assert hash(cl) == hash(('1#######', 1, '0#######'))
+
+        cl.condition.generalize(0)
+        cl.effect[1] = '1'
+
+        assert cl.fingerprint == ('########', 1, '01######')
+        assert hash(cl) == hash(Classifier(condition='########', action=1,
+                                           effect='01######', cfg=cfg))
+
     def test_should_calculate_fitness(self, cfg):
         # given
         cls = Classifier(reward=0.25, cfg=cfg)
@@ -758,3 +775,52 @@ class TestClassifier:
 
         # then
         assert result0 == _result
+
+    def test_should_share_empty_mark_in_memory_lean_mode(self):
+        # given
+        cfg = Configuration(8, 8, memory_lean=True)
+        cl1 = Classifier(condition='1#######', cfg=cfg)
+        cl2 = Classifier(cfg=cfg)
+        p0 = Perception('10101010')
+
+        # when
+        cl1.set_mark(p0)
+
+        # then
+        assert cl1.mark is not cl2.mark
+        assert cl1.is_marked() is True
+        assert cl2.mark is Classifier(cfg=cfg).mark
+        assert cl2.is_marked() is False
+        with pytest.raises(TypeError):
+            cl2.mark[0].add('1')
+
+    @pytest.mark.parametrize("_c, _e", [
+        (None, None),
+        ('1#0#####', '0#1#####'),
+    ])
+    def test_should_build_the_same_classifier_in_trusted_mode(self, _c, _e):
+        # given
+        cfg = Configuration(8, 8, trusted=True)
+
+        # when
+        cl = Classifier(condition=_c, effect=_e, cfg=cfg)
+
+        # then
+        expected = Classifier(condition=_c, effect=_e,
+                              cfg=Configuration(8, 8))
+        assert cl == expected
+        assert cl.condition._items == expected.condition._items
+        assert cl.effect._items == expected.effect._items
+
+    def test_should_refresh_cached_unchanging_attributes(self, cfg):
+        # given
+        cl = Classifier(condition='1#0#####', effect='0#######', cfg=cfg)
+        assert cl.specified_unchanging_attributes == [2]
+
+        # when
+        cl.specified_unchanging_attributes.append(5)
+        cl.condition[3] = '1'
+        cl.effect[2] = '1'
+
+        # then
+        assert cl.specified_unchanging_attributes == [3]
@@ -63,6 +63,173 @@ class TestClassifierList:
         assert cl_1 in action_set
         assert cl_2 in action_set
 
+    def test_should_modify_action_set_independently(self, cfg):
+        # given
+        cl_1 = Classifier(action=0, cfg=cfg)
+        cl_2 = Classifier(action=0, cfg=cfg)
+        cl_3 = Classifier(action=0, cfg=cfg)
+        match_set = ClassifiersList(*[cl_1, cl_2])
+        action_set = match_set.form_action_set(0)
+
+        # when
+        action_set.safe_remove(cl_1)
+        action_set.extend(ClassifiersList(cl_3))
+
+        # then
+        assert list(action_set) == [cl_2, cl_3]
+        assert list(match_set) == [cl_1, cl_2]
+        assert list(match_set.form_action_set(0)) == [cl_1, cl_2]
+
+    def test_should_refresh_action_buckets(self, cfg):
+        # given
+        cl_1 = Classifier(action=0, cfg=cfg)
+        cl_2 = Classifier(action=1, cfg=cfg)
+        cl_3 = Classifier(action=0, cfg=cfg)
+        population = ClassifiersList(*[cl_1, cl_2])
+        assert population.action_buckets() == {0: [cl_1], 1: [cl_2]}
+
+        # when
+        population.append(cl_3)
+        population.safe_remove(cl_2)
+
+        # then
+        assert population.action_buckets() == {0: [cl_1, cl_3]}
+        assert list(population.form_action_set(0)) == [cl_1, cl_3]
+        assert len(population.form_action_set(1)) == 0
+
+    def test_should_remove_classifier_by_identity(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_2 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_3 = Classifier(action=1, cfg=cfg)
+        population = ClassifiersList(cl_1, cl_2, cl_3)
+        action_set = ClassifiersList(cl_1, cl_2)
+
+        # when
+        population.safe_remove(cl_2)
+        action_set.safe_remove(cl_2)
+        population.safe_remove(Classifier(action=1, cfg=cfg))
+
+        # then
+        assert cl_1 == cl_2
+        assert list(population) == [cl_1, cl_3]
+        assert population[0] is cl_1
+        assert action_set[0] is cl_1 and len(action_set) == 1
+
+    def test_should_find_similar_classifier(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_2 = Classifier(condition='1#######', action=0, effect='0#######',
+                          cfg=cfg)
+        cl_3 = Classifier(condition='1#######', action=0, cfg=cfg)
+        population = ClassifiersList(cl_1, cl_2)
+        other = Classifier(condition='1#######', action=0, cfg=cfg)
+
+        # when & then
+        assert population.find_similar(other) is cl_1
+        population.append(cl_3)
+        assert population.find_similar(other, last=True) is cl_3
+        population.safe_remove(cl_1)
+        assert population.find_similar(other) is cl_3
+        assert population.find_similar(
+            Classifier(condition='1#######', action=1, cfg=cfg)) is None
+
+    def test_should_find_similar_after_condition_modification(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_2 = Classifier(condition='11######', action=0, cfg=cfg)
+        population = ClassifiersList(cl_1, cl_2)
+        other = Classifier(condition='11######', action=0, cfg=cfg)
+        assert population.find_similar(other) is cl_2
+
+        # when
+        cl_2.condition.generalize(1)
+
+        # then
+        assert population.find_similar(other) is None
+        assert population.find_similar(cl_1) is cl_1
+
+    def test_should_invalidate_only_lists_indexing_member(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_2 = Classifier(condition='11######', action=0, cfg=cfg)
+        population = ClassifiersList(cl_1)
+        other = ClassifiersList(cl_2)
+        population.find_similar(cl_1)
+        other.find_similar(cl_2)
+        state = population._structure_state()
+
+        # when
+        cl_2.condition.generalize(1)
+
+        # then
+        assert population._structure_state() == state
+        assert other.find_similar(cl_1) is cl_2
+
+        # when member is removed it stops notifying the list
+        other.safe_remove(cl_2)
+        state = other._structure_state()
+        cl_2.condition[0] = '0'
+
+        # then
+        assert other._structure_state() == state
+        assert cl_2._indexed_by == ()
+
+    def test_should_index_duplicated_subsumer(self, cfg):
+        # given
+        cl = Classifier(condition='1#######', action=0, effect='1#######',
+                        quality=0.95, experience=cfg.theta_exp + 1, cfg=cfg)
+        population = ClassifiersList(cl, cl)
+        child = Classifier(condition='11######', action=0, effect='1#######',
+                           cfg=cfg)
+
+        # when & then
+        assert population.find_subsumer(child, cfg.theta_exp) is cl
+        state = population._subsumers_state
+        assert state == population._structure_state()
+
+        population.safe_remove(cl)
+        assert population._subsumers_state == population._structure_state()
+        assert population.find_subsumer(child, cfg.theta_exp) is cl
+
+        population.safe_remove(cl)
+        assert population.find_subsumer(child, cfg.theta_exp) is None
+
+    def test_should_find_most_general_subsumer(self, cfg):
+        # given
+        def subsumer(condition, effect='1#######'):
+            return Classifier(condition=condition, action=0, effect=effect,
+                              quality=0.95, experience=cfg.theta_exp + 1,
+                              cfg=cfg)
+
+        cl_1 = subsumer('1#0#####')
+        cl_2 = subsumer('1#######', effect='0#######')
+        cl_3 = subsumer('1##0####')
+        cl_4 = subsumer('#######0')
+        population = ClassifiersList(cl_1, cl_2, cl_3, cl_4)
+        child = Classifier(condition='110000#0', action=0, effect='1#######',
+                           cfg=cfg)
+
+        # when & then
+        assert population.find_subsumer(child, cfg.theta_exp) is cl_4
+
+        # subsumer status is examined on each search
+        cl_4.q = 0.5
+        assert population.find_subsumer(child, cfg.theta_exp) is cl_1
+        cl_4.q = 0.95
+        cl_4.mark[0].add('1')
+        assert population.find_subsumer(child, cfg.theta_exp) is cl_1
+
+        # population and condition changes are followed
+        population.safe_remove(cl_1)
+        assert population.find_subsumer(child, cfg.theta_exp) is cl_3
+        cl_2.effect[0] = '1'
+        assert population.find_subsumer(child, cfg.theta_exp) is cl_2
+        cl_2.condition[0] = '0'
+        assert population.find_subsumer(child, cfg.theta_exp) is cl_3
+        cl_3.exp = 1
+        assert population.find_subsumer(child, cfg.theta_exp) is None
+
     def test_should_expand(self, cfg):
         # given
         cl_1 = Classifier(action=0, cfg=cfg)
@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, ClassifiersList, Classifier, \
+    ConditionBitsetIndex
+
+
+class TestConditionBitsetIndex:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(8, 8)
+
+    @staticmethod
+    def _random_condition(length, symbols='01#'):
+        return ''.join(random.choice(symbols) for _ in range(length))
+
+    def test_should_form_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition='1###0###', cfg=cfg)
+        cl_3 = Classifier(condition='0###1###', cfg=cfg)
+
+        population = ClassifiersList(*[cl_1, cl_2, cl_3])
+        population.attach_index(ConditionBitsetIndex(cfg))
+
+        # when
+        match_set = population.form_match_set(Perception('11110000'))
+
+        # then
+        assert len(match_set) == 2
+        assert cl_1 in match_set
+        assert cl_2 in match_set
+
+    def test_should_not_match_unknown_symbols(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', cfg=cfg)
+        cl_2 = Classifier(condition='#######1', cfg=cfg)
+
+        population = ClassifiersList(*[cl_1, cl_2])
+        population.attach_index(ConditionBitsetIndex(cfg))
+
+        # when
+        match_set = population.form_match_set(Perception('9######1'))
+
+        # then
+        assert len(match_set) == 1
+        assert cl_2 in match_set
+
+    def test_should_track_insertions_and_removals(self, cfg):
+        # given
+        population = ClassifiersList()
+        index = ConditionBitsetIndex(cfg)
+        population.attach_index(index)
+
+        cl_1 = Classifier(condition='1#######', cfg=cfg)
+        cl_2 = Classifier(condition='0#######', cfg=cfg)
+        cl_3 = Classifier(condition='##1#####', cfg=cfg)
+
+        # when
+        population.append(cl_1)
+        population.append(cl_2)
+        population.insert(0, cl_3)
+        population.safe_remove(cl_1)
+
+        # then
+        assert len(index) == 2
+        match_set = population.form_match_set(Perception('00100000'))
+        assert list(match_set) == [cl_3, cl_2]
+
+    def test_should_track_condition_modifications(self, cfg):
+        # given
+        cl = Classifier(condition='1#######', cfg=cfg)
+        population = ClassifiersList(cl)
+        population.attach_index(ConditionBitsetIndex(cfg))
+        p = Perception('00000000')
+        assert len(population.form_match_set(p)) == 0
+
+        # when
+        cl.condition.generalize(0)
+
+        # then
+        assert len(population.form_match_set(p)) == 1
+
+    def test_should_stop_tracking_removed_classifiers(self, cfg):
+        # given
+        cl = Classifier(condition='1#######', cfg=cfg)
+        population = ClassifiersList(cl)
+        index = ConditionBitsetIndex(cfg)
+        population.attach_index(index)
+
+        # when
+        population.remove(cl)
+        cl.condition.generalize(0)
+
+        # then
+        assert len(index) == 0
+        assert cl.condition._listeners == (cl,)
+
+    def test_should_give_the_same_results_as_scanning(self, cfg):
+        # given
+        random.seed(42)
+        population = ClassifiersList()
+        population.attach_index(ConditionBitsetIndex(cfg))
+
+        for _ in range(300):
+            op = random.random()
+            if op < 0.6 or len(population) == 0:
+                population.insert(
+                    random.randint(0, len(population)),
+                    Classifier(condition=self._random_condition(8),
+                               cfg=cfg))
+            elif op < 0.8:
+                population.remove(random.choice(population))
+            else:
+                random.choice(population).condition.generalize(
+                    random.randrange(8))
+
+            p = Perception(self._random_condition(8, '01'))
+
+            # then
+            expected = [cl for cl in population if cl.does_match(p)]
+            assert list(population.form_match_set(p)) == expected
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, ClassifiersList, Classifier, \
+    DeltaConditionMatrix
+
+
+class TestDeltaConditionMatrix:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(8, 8)
+
+    @staticmethod
+    def _random_condition(length, symbols='01#'):
+        return ''.join(random.choice(symbols) for _ in range(length))
+
+    def test_should_form_match_set_for_consecutive_perceptions(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition='1###0###', cfg=cfg)
+        cl_3 = Classifier(condition='0###1###', cfg=cfg)
+
+        population = ClassifiersList(*[cl_1, cl_2, cl_3])
+        population.attach_index(DeltaConditionMatrix(cfg))
+
+        # when & then
+        match_set = population.form_match_set(Perception('11110000'))
+        assert list(match_set) == [cl_1, cl_2]
+
+        match_set = population.form_match_set(Perception('01110000'))
+        assert list(match_set) == [cl_1]
+
+        match_set = population.form_match_set(Perception('01111000'))
+        assert list(match_set) == [cl_1, cl_3]
+
+    def test_should_account_for_classifiers_added_between_steps(self, cfg):
+        # given
+        population = ClassifiersList(Classifier(cfg=cfg))
+        population.attach_index(DeltaConditionMatrix(cfg))
+        population.form_match_set(Perception('00000000'))
+
+        cl = Classifier(condition='1#######', cfg=cfg)
+
+        # when
+        population.insert(0, cl)
+        cl.condition.generalize(0)
+        match_set = population.form_match_set(Perception('00000001'))
+
+        # then
+        assert len(match_set) == 2
+
+    def test_should_give_the_same_results_as_scanning(self, cfg):
+        # given
+        random.seed(42)
+        population = ClassifiersList()
+        population.attach_index(DeltaConditionMatrix(cfg))
+        p = list(self._random_condition(8, '01'))
+
+        for _ in range(300):
+            op = random.random()
+            if op < 0.5 or len(population) == 0:
+                population.insert(
+                    random.randint(0, len(population)),
+                    Classifier(condition=self._random_condition(8),
+                               cfg=cfg))
+            elif op < 0.7:
+                population.remove(random.choice(population))
+            elif op < 0.8:
+                random.choice(population).condition.generalize(
+                    random.randrange(8))
+
+            # perception differs in single attribute only
+            p[random.randrange(8)] = random.choice('012')
+            situation = Perception(p)
+
+            # then
+            expected = [cl for cl in population if cl.does_match(situation)]
+            assert list(population.form_match_set(situation)) == expected
@@ -10,6 +10,17 @@ class TestEffect:
         effect = Effect.empty(8)
         assert 8 == len(effect)
 
+    def test_should_copy_enhanced_attributes_when_unchecked(self):
+        # given
+        effect = Effect(['#', {'0': 0.5, '1': 0.5}, '1'])
+
+        # when
+        unchecked = Effect._unchecked(effect)
+
+        # then
+        assert unchecked == effect
+        assert unchecked[1] is not effect[1]
+
     def test_should_get_initialized_with_string(self):
         effect = Effect("#1O##O##")
         assert 8 == len(effect)
@@ -127,6 +138,18 @@ class TestEffect:
             == Effect(({"0": 0.4, "1": 0.6}, {"1": 0.3, "0": 0.7},
                       {"0": 0.0, "1": 1.0}, {"0": 0.0, "1": 1.0}))
 
+    def test_should_equal_reduced_plain_effect(self):
+        # given
+        enhanced = Effect(({"0": 1.0}, "0", "1", "1", "0", "1", "1", "#"))
+        plain = Effect("0011011#")
+
+        # then
+        assert enhanced == plain
+        assert plain == enhanced
+        assert Effect(({"0": 0.5, "1": 0.5}, "0", "1", "1",
+                       "0", "1", "1", "#")) != plain
+        assert Effect(({"0": 1.0}, "0", "1")) != plain
+
     @pytest.mark.parametrize("_p0, _p1, _e, _result", [
         (['1', '1', '0', '1', '1', '1', '0', '1'],
          ['1', '1', '1', '1', '1', '0', '0', '1'],
@@ -37,11 +37,13 @@ class TestGeneticAlgorithm:
             condition=deepcopy(condition),
             effect=deepcopy(effect),
             cfg=cfg)
+        assert cl.condition.cover_ratio is not None
 
         # when
         mutate(cl, mu)
 
         # then
+        assert cl.condition.cover_ratio == cl.condition._cover_ratio()
         range_min, range_max = cfg.encoder.range
         for idx, (c, e) in enumerate(zip(cl.condition, cl.effect)):
             # assert that we have new locus
@@ -177,6 +177,9 @@ class TestClassifier:
         assert cl.action == copied_cl.action
         assert cl.effect == copied_cl.effect
         assert cl.effect is not copied_cl.effect
+        assert all(a is not b for a, b in zip(cl.condition,
+                                              copied_cl.condition))
+        assert all(a is not b for a, b in zip(cl.effect, copied_cl.effect))
         assert copied_cl.is_marked() is False
         assert cl.r == copied_cl.r
         assert cl.q == copied_cl.q
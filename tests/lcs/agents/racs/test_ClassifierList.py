@@ -1,6 +1,7 @@
 import pytest
 
 from lcs import Perception
+from lcs.agents import ParameterStore
 from lcs.agents.racs import Configuration, Condition, \
     Classifier, ClassifierList, Effect
 from lcs.representations import UBR
@@ -114,6 +115,21 @@ class TestClassifierList:
         # then
         assert mf == cl3.fitness
 
+    def test_should_get_maximum_fitness_from_parameter_store(self, cfg):
+        # given
+        population = ClassifierList(*[
+            Classifier(effect=Effect([UBR(0, upper), UBR(0, 15)], cfg),
+                       quality=quality, reward=reward, cfg=cfg)
+            for upper, quality, reward in [(1, 0.3, 7.5), (15, 0.9, 10),
+                                           (14, 0.4, 6.25), (3, 0.2, 12)]])
+        expected = population.get_maximum_fitness()
+
+        # when
+        population.attach_index(ParameterStore(Classifier))
+
+        # then
+        assert population.get_maximum_fitness() == expected == 2.5
+
     def test_should_return_zero_max_fitness(self, cfg):
         # given classifiers that does not anticipate change
         cl1 = Classifier(
@@ -96,6 +96,24 @@ class TestCondition:
         cond = Condition(_condition, cfg=cfg)
         assert cond.cover_ratio == _covered_pct
 
+    def test_should_update_cover_ratio_after_modification(self, cfg):
+        # given
+        cond = Condition([UBR(7, 8), UBR(4, 5)], cfg=cfg)
+        assert cond.cover_ratio == 0.125
+
+        # when
+        cond[0] = UBR(0, 15)
+
+        # then
+        assert cond.cover_ratio == 0.5625
+
+        # when interval is widened in place
+        cond[1].x1 = 0
+        cond.forget_derived()
+
+        # then
+        assert cond.cover_ratio == 0.6875
+
     @pytest.mark.parametrize("_condition, _perception, _result", [
         ([UBR(0, 15), UBR(0, 15)], [0.2, 0.4], True),
         ([UBR(0, 15), UBR(0, 2)], [0.5, 0.5], False),
@@ -0,0 +1,57 @@
+import pytest
+
+from lcs import Perception
+from lcs.agents.racs import Configuration, Condition, EncodedPerception
+from lcs.agents.racs.EncodedPerception import encode
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestEncodedPerception:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    @pytest.mark.parametrize("_values", [
+        [0.0, 1.0],
+        [0.2, 0.4],
+        [0.5, 0.65],
+        [0.0625, 0.9999],
+    ])
+    def test_should_encode_like_encoder(self, _values, cfg):
+        # when
+        p = EncodedPerception(_values, cfg.encoder)
+
+        # then
+        assert list(p) == _values
+        assert list(p.encoded) == [cfg.encoder.encode(v) for v in _values]
+
+    def test_should_reuse_encoding(self, cfg):
+        # given
+        p = EncodedPerception([0.2, 0.4], cfg.encoder)
+
+        # then
+        assert encode(p, cfg.encoder) is p.encoded
+        assert encode(p, RealValueEncoder(2)) == [0, 1]
+
+    def test_should_encode_raw_perception(self, cfg):
+        # given
+        p = Perception([0.2, 0.4], oktypes=(float,))
+
+        # then
+        assert encode(p, cfg.encoder) == [3, 6]
+
+    def test_should_match_like_raw_perception(self, cfg):
+        # given
+        cond = Condition([UBR(8, 8), UBR(10, 10)], cfg=cfg)
+        raw = Perception([0.5, 0.65], oktypes=(float,))
+        encoded = EncodedPerception([0.5, 0.65], cfg.encoder)
+
+        # then
+        assert cond.does_match(raw)
+        assert cond.does_match(encoded)
+        assert encoded == raw
+        assert hash(encoded) == hash(tuple(raw))
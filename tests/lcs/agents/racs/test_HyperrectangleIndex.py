@@ -0,0 +1,155 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.racs import Configuration, ClassifierList, Classifier, \
+    Condition, HyperrectangleIndex
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestHyperrectangleIndex:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    @pytest.fixture
+    def population(self, cfg):
+        return ClassifierList(*[
+            Classifier(condition=Condition([UBR(2, 3), UBR(4, 5)], cfg),
+                       cfg=cfg),
+            Classifier(condition=Condition([UBR(3, 0), UBR(4, 9)], cfg),
+                       cfg=cfg),
+            Classifier(condition=Condition([UBR(1, 3), UBR(4, 15)], cfg),
+                       cfg=cfg),
+            Classifier(cfg=cfg)])
+
+    @pytest.mark.parametrize("_point, _result", [
+        ([2, 4], [0, 1, 2, 3]),
+        ([0, 9], [1, 3]),
+        ([3, 10], [2, 3]),
+        ([15, 15], [3]),
+    ])
+    def test_should_stab_point(self, _point, _result, cfg, population):
+        # given
+        index = HyperrectangleIndex(cfg)
+        population.attach_index(index)
+
+        # when
+        stabbed = index.stab_bits(_point)
+
+        # then
+        assert [i for i in range(len(population))
+                if stabbed >> i & 1] == _result
+
+    @pytest.mark.parametrize("_perception", [
+        [0.15, 0.3],
+        [0.2, 0.3],
+        [0.05, 0.6],
+        [0.9, 0.9],
+    ])
+    def test_should_match_like_linear_scan(
+            self, _perception, cfg, population):
+        # given
+        p0 = Perception(_perception, oktypes=(float,))
+        expected = [cl for cl in population if cl.condition.does_match(p0)]
+
+        # when
+        population.attach_index(HyperrectangleIndex(cfg))
+
+        # then
+        assert list(population.form_match_set(p0)) == expected
+
+    @pytest.mark.parametrize("_cond, _result", [
+        ([UBR(2, 2), UBR(4, 5)], [0, 1, 2, 3]),
+        ([UBR(1, 2), UBR(4, 6)], [1, 2, 3]),
+        ([UBR(0, 15), UBR(0, 15)], [3]),
+    ])
+    def test_should_find_containing(self, _cond, _result, cfg, population):
+        # given
+        index = HyperrectangleIndex(cfg)
+        population.attach_index(index)
+
+        # when
+        containing = index.containing(Condition(_cond, cfg))
+
+        # then
+        assert containing.tolist() == _result
+
+    @pytest.mark.parametrize("_cond, _result", [
+        ([UBR(0, 15), UBR(0, 15)], [0, 1, 2, 3]),
+        ([UBR(0, 3), UBR(4, 9)], [0, 1]),
+        ([UBR(2, 3), UBR(0, 8)], [0]),
+        ([UBR(3, 3), UBR(4, 4)], []),
+    ])
+    def test_should_find_contained(self, _cond, _result, cfg, population):
+        # given
+        index = HyperrectangleIndex(cfg)
+        population.attach_index(index)
+
+        # when
+        contained = index.contained(Condition(_cond, cfg))
+
+        # then
+        assert contained.tolist() == _result
+
+    def test_should_narrow_action_set_to_containing(self, cfg, population):
+        # given
+        population.attach_index(HyperrectangleIndex(cfg))
+        action_set = population.form_match_set(
+            Perception([0.15, 0.3], oktypes=(float,))).form_action_set(None)
+        cl = Classifier(condition=Condition([UBR(2, 2), UBR(4, 6)], cfg),
+                        cfg=cfg)
+        expected = [member for member in action_set
+                    if member.condition.subsumes(cl.condition)]
+
+        # when
+        candidates = action_set.subsumer_candidates(cl)
+
+        # then
+        assert action_set.source is population
+        assert candidates == expected == [population[1], population[2],
+                                          population[3]]
+
+    def test_should_follow_population_changes(self, cfg, population):
+        # given
+        random.seed(5)
+        index = HyperrectangleIndex(cfg)
+        population.attach_index(index)
+
+        def random_condition():
+            return Condition([UBR(random.randint(0, 15),
+                                  random.randint(0, 15)) for _ in range(2)],
+                             cfg)
+
+        # when
+        for _ in range(50):
+            population.insert(random.randint(0, len(population)),
+                              Classifier(condition=random_condition(),
+                                         cfg=cfg))
+            del population[random.randint(0, len(population) - 1)]
+            cl = population[random.randint(0, len(population) - 1)]
+            cl.condition[random.randint(0, 1)] = UBR(random.randint(0, 15),
+                                                     random.randint(0, 15))
+
+        # then
+        for x in range(16):
+            for y in range(16):
+                expected = [i for i, cl in enumerate(population)
+                            if x in cl.condition[0] and y in cl.condition[1]]
+                stabbed = index.stab_bits([x, y])
+                assert [i for i in range(len(population))
+                        if stabbed >> i & 1] == expected
+
+        for _ in range(50):
+            condition = random_condition()
+            assert index.containing(condition).tolist() == \
+                [i for i, cl in enumerate(population)
+                 if cl.condition.subsumes(condition)]
+            assert index.contained(condition).tolist() == \
+                [i for i, cl in enumerate(population)
+                 if condition.subsumes(cl.condition)]
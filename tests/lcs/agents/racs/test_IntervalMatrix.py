@@ -0,0 +1,176 @@
+import numpy as np
+import pytest
+
+from lcs import Perception
+from lcs.agents.racs import Configuration, ClassifierList, Classifier, \
+    Condition, IntervalMatrix
+from lcs.agents.racs.components.genetic_algorithm import mutate
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestIntervalMatrix:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    @pytest.fixture
+    def population(self, cfg):
+        return ClassifierList(*[
+            Classifier(condition=Condition([UBR(2, 3), UBR(4, 5)], cfg),
+                       cfg=cfg),
+            Classifier(condition=Condition([UBR(3, 0), UBR(4, 9)], cfg),
+                       cfg=cfg),
+            Classifier(condition=Condition([UBR(1, 3), UBR(4, 15)], cfg),
+                       cfg=cfg),
+            Classifier(cfg=cfg)])
+
+    def test_should_store_normalized_bounds(self, cfg, population):
+        # given
+        index = IntervalMatrix(cfg, capacity=1)
+
+        # when
+        population.attach_index(index)
+
+        # then
+        assert index.bounds.shape == (4, 2, 2)
+        assert index.lower.tolist() == [[2, 4], [0, 4], [1, 4], [0, 0]]
+        assert index.upper.tolist() == [[3, 5], [3, 9], [3, 15], [15, 15]]
+
+    @pytest.mark.parametrize("_perception", [
+        [0.15, 0.3],
+        [0.2, 0.3],
+        [0.05, 0.6],
+        [0.9, 0.9],
+    ])
+    def test_should_match_like_linear_scan(
+            self, _perception, cfg, population):
+        # given
+        p0 = Perception(_perception, oktypes=(float,))
+        expected = [cl for cl in population if cl.condition.does_match(p0)]
+
+        # when
+        population.attach_index(IntervalMatrix(cfg))
+
+        # then
+        assert list(population.form_match_set(p0)) == expected
+
+    def test_should_follow_population_changes(self, cfg, population):
+        # given
+        index = IntervalMatrix(cfg)
+        population.attach_index(index)
+        new_cl = Classifier(condition=Condition([UBR(5, 5), UBR(6, 7)], cfg),
+                            cfg=cfg)
+
+        # when
+        population.insert(1, new_cl)
+        population.safe_remove(population[0])
+        population[0].condition.generalize(1)
+        population[1].condition[0] = UBR(8, 9)
+
+        # then
+        assert index.lower.tolist() == [[5, 0], [8, 4], [1, 4], [0, 0]]
+        assert index.upper.tolist() == [[5, 15], [9, 9], [3, 15], [15, 15]]
+
+    def test_should_stay_valid_after_child_mutation(self, cfg, population):
+        # given
+        index = IntervalMatrix(cfg)
+        population.attach_index(index)
+        child = Classifier.copy_from(population[0], 0)
+        np.random.seed(1)
+
+        # when
+        mutate(child, mu=1.0)
+
+        # then
+        assert population[0].condition == \
+            Condition([UBR(2, 3), UBR(4, 5)], cfg)
+        assert index.bounds[0].tolist() == [[2, 3], [4, 5]]
+
+    def test_should_refresh_after_in_place_modification(
+            self, cfg, population):
+        # given
+        index = IntervalMatrix(cfg)
+        population.attach_index(index)
+
+        # when
+        population[0].condition[0].x1 = 0
+        population.refresh()
+
+        # then
+        assert index.bounds[0].tolist() == [
+            [ubr.lower_bound, ubr.upper_bound]
+            for ubr in population[0].condition]
+
+    def test_should_count_interval_proportions(self, cfg, population):
+        # given
+        index = IntervalMatrix(cfg)
+        population.attach_index(index)
+        expected = {1: 0, 2: 0, 3: 0, 4: 0}
+        for cl in population:
+            for region, count in cl.get_interval_proportions().items():
+                expected[region] += count
+
+        # then
+        assert index.interval_proportions() == expected
+
+    @pytest.mark.parametrize("_cond", [
+        [UBR(2, 2), UBR(4, 5)],
+        [UBR(1, 2), UBR(4, 6)],
+        [UBR(0, 15), UBR(0, 15)],
+        [UBR(0, 3), UBR(4, 9)],
+    ])
+    def test_should_find_containing_and_contained(
+            self, _cond, cfg, population):
+        # given
+        index = IntervalMatrix(cfg)
+        population.attach_index(index)
+        cond = Condition(_cond, cfg)
+
+        # then
+        assert index.containing(cond).tolist() == \
+            [i for i, cl in enumerate(population)
+             if cl.condition.subsumes(cond)]
+        assert index.contained(cond).tolist() == \
+            [i for i, cl in enumerate(population)
+             if cond.subsumes(cl.condition)]
+
+    def test_should_calculate_cover_ratios(self, cfg, population):
+        # given
+        expected = [cl.condition.cover_ratio for cl in population]
+        index = IntervalMatrix(cfg)
+        population.attach_index(index)
+
+        # then
+        assert index.cover_ratios().tolist() == expected
+
+    def test_should_route_condition_through_matrix(
+            self, cfg, population, mocker):
+        # given
+        others = [Condition([UBR(2, 2), UBR(4, 5)], cfg),
+                  Condition([UBR(0, 3), UBR(4, 9)], cfg)] + \
+            [Condition(list(cl.condition), cfg) for cl in population]
+        expected = [[cl.condition.subsumes(other) for other in others]
+                    for cl in population]
+        ratios = [cl.condition._cover_ratio() for cl in population]
+        population.attach_index(IntervalMatrix(cfg))
+        incorporates = mocker.spy(IntervalMatrix, 'incorporates')
+        cover_ratio_of = mocker.spy(IntervalMatrix, 'cover_ratio_of')
+
+        # when
+        subsumes = [[cl.condition.subsumes(other) for other in others]
+                    for cl in population]
+        pairs = [[cl.condition.subsumes(other.condition)
+                  for other in population] for cl in population]
+
+        # then
+        assert subsumes == expected
+        assert pairs == [row[2:] for row in expected]
+        assert incorporates.call_count == 2 * len(population) ** 2 + \
+            2 * len(population)
+        assert [cl.condition._cover_ratio() for cl in population] == ratios
+        assert cover_ratio_of.call_count == len(population)
+        assert Condition([UBR(2, 2)], cfg)._indexed_bounds() is None
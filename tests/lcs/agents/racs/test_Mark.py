@@ -77,6 +77,40 @@ class TestMark:
         # then
         assert self._count_marked_attributes(mark) is marked_count
 
+    def test_should_store_encoded_values_as_bits(self, cfg):
+        # given
+        mark = Mark(cfg)
+        assert mark._items == []
+
+        # when
+        mark[0].update([2, 5])
+        mark[1].add(15)
+
+        # then
+        assert mark.bits(0) == 0b100100
+        assert mark.bits(1) == 1 << 15
+        assert list(mark) == [{2, 5}, {15}]
+
+        # when
+        mark[0].clear()
+        mark[1].discard(15)
+
+        # then
+        assert mark.is_marked() is False
+        assert mark == Mark(cfg)
+
+    def test_should_place_other_values_after_encoder_range(self, cfg):
+        # given
+        mark = Mark(cfg)
+
+        # when
+        mark[0].update([UBR(2, 5), 3])
+
+        # then
+        assert mark.bits(0) == 1 << 16 | 1 << 3
+        assert list(mark.values(0)) == [3, UBR(2, 5)]
+        assert UBR(2, 5) in mark[0]
+
     def test_should_get_no_differences(self, cfg):
         # given
         p0 = Perception([.5, .5], oktypes=(float,))
@@ -5,3 +5,64 @@ class TestImmutableSequence:
     def test_should_hash(self):
         assert hash(ImmutableSequence('111')) == hash(ImmutableSequence('111'))
         assert hash(ImmutableSequence('111')) != hash(ImmutableSequence('112'))
+
+    def test_should_share_storage_with_copy_until_modified(self):
+        # given
+        seq = ImmutableSequence('1111')
+
+        # when
+        copied = ImmutableSequence(seq)
+
+        # then
+        assert copied._items is seq._items
+
+        # when
+        copied[1] = '0'
+
+        # then
+        assert seq == ImmutableSequence('1111')
+        assert copied == ImmutableSequence('1011')
+
+    def test_should_set_many_attributes(self):
+        # given
+        seq = ImmutableSequence('1111')
+
+        # when
+        seq.set_many({0: '0', 2: '#', -1: '0'})
+
+        # then
+        assert seq == ImmutableSequence('01#0')
+
+    def test_should_set_many_non_symbol_attributes(self):
+        # given
+        seq = ImmutableSequence('1111')
+
+        # when
+        seq.set_many({1: {'0': 0.5, '1': 0.5}, 2: '0'})
+
+        # then
+        assert list(seq) == ['1', {'0': 0.5, '1': 0.5}, '0', '1']
+
+    def test_should_notify_listeners_once_per_batch(self, mocker):
+        # given
+        seq = ImmutableSequence('1111')
+        listener = mocker.Mock()
+        seq.add_listener(listener)
+
+        # when
+        seq.set_many({0: '0', 1: '0'})
+
+        # then
+        listener.sequence_changed.assert_called_once_with(seq)
+
+    def test_should_share_storage_of_equal_sequences(self):
+        # given
+        seq1 = ImmutableSequence('1011')
+        seq2 = ImmutableSequence('1111')
+
+        # when
+        seq2[1] = '0'
+
+        # then
+        assert seq1._items is seq2._items
+        assert not hasattr(seq1, '__dict__')
@@ -0,0 +1,101 @@
+import pytest
+
+from lcs import Perception
+from lcs.agents import MatchSetCache
+from lcs.agents import racs
+from lcs.agents.acs2 import Configuration, ClassifiersList, Classifier
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestMatchSetCache:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    @pytest.fixture
+    def population(self, cfg):
+        population = ClassifiersList(
+            Classifier(condition='1###', cfg=cfg),
+            Classifier(condition='0###', cfg=cfg))
+        population.track_conditions()
+        return population
+
+    def test_should_return_cached_match_set(self, population):
+        # given
+        cache = MatchSetCache(population)
+        p = Perception('1000')
+
+        # when
+        ms_1 = cache.get(p)
+        ms_2 = cache.get(Perception('1000'))
+
+        # then
+        assert list(ms_1) == list(ms_2) == [population[0]]
+        assert ms_1 is not ms_2
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_should_invalidate_when_population_changes(self, cfg, population):
+        # given
+        cache = MatchSetCache(population)
+        p = Perception('1000')
+        cache.get(p)
+
+        # when
+        population.append(Classifier(cfg=cfg))
+
+        # then
+        assert len(cache.get(p)) == 2
+        assert cache.misses == 2
+
+    def test_should_invalidate_when_condition_changes(self, population):
+        # given
+        cache = MatchSetCache(population)
+        p = Perception('1000')
+        cache.get(p)
+
+        # when
+        population[1].condition.generalize(0)
+
+        # then
+        assert len(cache.get(p)) == 2
+        assert cache.hits == 0
+
+    def test_should_invalidate_racs_cache_when_condition_changes(self):
+        # given
+        cfg = racs.Configuration(classifier_length=2,
+                                 number_of_possible_actions=2,
+                                 encoder=RealValueEncoder(4),
+                                 match_set_cache_size=8)
+        cl = racs.Classifier(
+            condition=racs.Condition([UBR(0, 3), UBR(0, 15)], cfg),
+            cfg=cfg)
+        agent = racs.RACS(cfg, racs.ClassifierList(cl))
+        cache = agent.get_match_set_cache()
+        p = Perception([0.5, 0.5], oktypes=(float,))
+        assert len(cache.get(p)) == 0
+
+        # when
+        cl.condition.generalize(0)
+
+        # then
+        assert len(cache.get(p)) == len(agent.population.form_match_set(p))
+        assert len(cache.get(p)) == 1
+
+    def test_should_evict_least_recently_used(self, population):
+        # given
+        cache = MatchSetCache(population, maxsize=2)
+
+        # when
+        cache.get(Perception('1000'))
+        cache.get(Perception('0000'))
+        cache.get(Perception('1000'))
+        cache.get(Perception('1111'))
+        cache.get(Perception('1000'))
+
+        # then
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.hits == 2
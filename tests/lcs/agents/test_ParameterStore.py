@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+import lcs.strategies.genetic_algorithms as ga
+from lcs.agents import ParameterStore
+from lcs.agents.ParameterStore import stored_rows, stored_parameters
+from lcs.agents.acs2 import Configuration, ClassifiersList, Classifier
+
+
+class TestParameterStore:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    @pytest.fixture
+    def population(self, cfg):
+        return ClassifiersList(
+            Classifier(condition='1###', quality=0.7, numerosity=2, tga=5,
+                       cfg=cfg),
+            Classifier(condition='0###', reward=12.5, talp=3, cfg=cfg))
+
+    def test_should_move_parameters_into_columns(self, population):
+        # given
+        store = ParameterStore(Classifier, capacity=1)
+
+        # when
+        population.attach_index(store)
+        cl1, cl2 = population
+
+        # then
+        assert cl1._params is store
+        assert len(store) == 2
+        rows = store.rows(population)
+        assert store.column('q')[rows].tolist() == [0.7, 0.5]
+        assert store.column('num')[rows].tolist() == [2, 1]
+        assert cl1.talp is None and cl2.talp == 3
+        assert type(cl1.num) is int and type(cl1.q) is float
+
+        # when
+        cl2.r += 0.5
+        cl1.talp = 7
+
+        # then
+        assert store.column('r')[cl2._row] == 13.0
+        assert cl1.talp == 7
+
+    def test_should_store_all_learning_parameters(self, population):
+        # given
+        store = ParameterStore(Classifier)
+
+        # when
+        population.attach_index(store)
+        cl1, cl2 = population
+        cl1.exp += 2
+        cl2.tav = 0.25
+
+        # then
+        assert sorted(stored_parameters(Classifier)) == \
+            ['exp', 'ir', 'num', 'q', 'r', 'talp', 'tav', 'tga']
+        rows = store.rows(population)
+        assert store.column('exp')[rows].tolist() == [3, 1]
+        assert store.column('tav')[rows].tolist() == [0.0, 0.25]
+        assert np.isnan(store.column('talp')[cl1._row])
+        assert store.column('talp')[cl2._row] == 3
+        assert type(cl2.talp) is int and type(cl1.exp) is int
+
+        # when
+        cl2.talp = None
+
+        # then
+        assert cl2.talp is None
+
+    def test_should_release_removed_classifier(self, cfg, population):
+        # given
+        store = ParameterStore(Classifier)
+        population.attach_index(store)
+        cl = population[0]
+        cl.q = 0.9
+
+        # when
+        population.safe_remove(cl)
+        population.append(Classifier(numerosity=4, cfg=cfg))
+
+        # then
+        assert cl._params is None and cl._row is None
+        assert cl.q == 0.9 and cl.num == 2 and cl.talp is None
+        assert len(store) == 2
+        assert stored_rows([cl, population[0]]) == (None, None)
+        assert store.column('num')[store.rows(population)].tolist() == [1, 4]
+
+    def test_should_release_after_last_occurrence(self, population):
+        # given
+        store = ParameterStore(Classifier)
+        population.attach_index(store)
+        cl = population[0]
+        population.append(cl)
+        cl.tav = 0.5
+
+        # when
+        del population[0]
+
+        # then
+        assert cl._params is store
+        assert cl.tav == 0.5 and len(store) == 2
+
+        # when
+        population.safe_remove(cl)
+
+        # then
+        assert cl._params is None
+        assert cl.tav == 0.5 and cl.talp is None and len(store) == 1
+
+    def test_should_copy_outside_of_store(self, population):
+        # given
+        population.attach_index(ParameterStore(Classifier))
+
+        # when
+        copy = population[0].copy_from(population[0], 10)
+
+        # then
+        assert copy._params is None
+        assert copy.q == 0.7 and copy.tga == 10
+
+    @pytest.mark.parametrize("_time, _result", [
+        (100, False),
+        (110, True),
+    ])
+    def test_should_apply_ga_like_unstored_classifiers(
+            self, _time, _result, cfg, population):
+        # given
+        plain = ClassifiersList(*[Classifier.copy_from(cl, 0)
+                                  for cl in population])
+        for cl, other in zip(plain, population):
+            cl.tga, cl.num = other.tga, other.num
+
+        population.attach_index(ParameterStore(Classifier))
+
+        # then
+        assert ga.should_apply(plain, _time, 100) is _result
+        assert ga.should_apply(population, _time, 100) is _result
+
+        # when
+        ga.set_timestamps(population, _time)
+
+        # then
+        assert [cl.tga for cl in population] == [_time, _time]
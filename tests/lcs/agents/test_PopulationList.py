@@ -0,0 +1,93 @@
+import pytest
+
+from lcs.agents import PerceptionString, PopulationIndex, PopulationList
+
+
+class Member:
+    def __init__(self, condition: str) -> None:
+        self.condition = PerceptionString(condition)
+
+
+class RecordingIndex(PopulationIndex):
+    def __init__(self) -> None:
+        self.rows = []
+
+    def rebuild(self, population) -> None:
+        self.rows = [str(cl.condition) for cl in population]
+
+    def insert(self, idx: int, cl) -> None:
+        self.rows.insert(idx, str(cl.condition))
+
+    def remove(self, idx: int, cl) -> None:
+        del self.rows[idx]
+
+    def update(self, idx: int, cl) -> None:
+        self.rows[idx] = str(cl.condition)
+
+
+class TestPopulationList:
+
+    @pytest.fixture
+    def population(self):
+        return PopulationList(Member('00'), Member('01'), Member('11'),
+                              oktypes=(Member,))
+
+    def test_should_keep_index_in_sync(self, population):
+        # given
+        index = RecordingIndex()
+        population.attach_index(index)
+
+        # when
+        population.insert(1, Member('10'))
+        population[0] = Member('#0')
+        del population[-1]
+        population[2].condition[1] = '#'
+
+        # then
+        assert index.rows == ['#0', '10', '0#']
+        assert index.rows == [str(cl.condition) for cl in population]
+
+    def test_should_stop_tracking_removed_members(self, population):
+        # given
+        index = RecordingIndex()
+        population.attach_index(index)
+        removed = population[1]
+
+        # when
+        population.safe_remove(removed)
+        version = population.version
+        removed.condition[0] = '#'
+
+        # then
+        assert population.version == version
+        assert index.rows == ['00', '11']
+
+    def test_should_update_all_positions_of_member(self, population):
+        # given
+        index = RecordingIndex()
+        population.attach_index(index)
+        member = population[1]
+        population.append(member)
+
+        # when
+        member.condition[0] = '#'
+
+        # then
+        assert index.rows == ['00', '#1', '11', '#1']
+
+        # when
+        population.safe_remove(member)
+        member.condition[1] = '#'
+
+        # then
+        assert index.rows == ['00', '11', '##']
+
+    def test_should_remove_by_identity(self, population):
+        # given
+        twin = Member('01')
+
+        # when
+        population.safe_remove(twin)
+
+        # then
+        assert len(population) == 3
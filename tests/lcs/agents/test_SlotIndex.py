@@ -0,0 +1,78 @@
+import random
+
+from lcs.agents.SlotIndex import SlotIndex
+
+
+class Item:
+    pass
+
+
+class TestSlotIndex:
+
+    def test_should_find_position_by_identity(self):
+        # given
+        items = [Item() for _ in range(5)]
+        index = SlotIndex()
+
+        # when & then
+        for pos, item in enumerate(items):
+            assert index.position(items, 0, item) == pos
+        assert index.position(items, 0, Item()) == -1
+
+    def test_should_follow_appending_and_removal(self):
+        # given
+        random.seed(7)
+        items = [Item() for _ in range(5)]
+        version = 0
+        index = SlotIndex()
+        index.position(items, version, items[0])
+
+        # when
+        for _ in range(100):
+            if random.random() < 0.5 and items:
+                pos = random.randrange(len(items))
+                removed = items.pop(pos)
+                index.removed(pos, removed, version, version + 1)
+            else:
+                items.append(Item())
+                index.appended(items[-1], version, version + 1)
+            version += 1
+
+        # then
+        for pos, item in enumerate(items):
+            assert index.position(items, version, item) == pos
+
+    def test_should_handle_duplicated_items(self):
+        # given
+        item = Item()
+        items = [Item(), item, item]
+        index = SlotIndex()
+
+        # when & then
+        assert index.position(items, 0, item) == 1
+        del items[1]
+        assert index.position(items, 1, item) == 1
+
+    def test_should_find_all_positions_of_duplicated_item(self):
+        # given
+        item = Item()
+        items = [item, Item(), item]
+        index = SlotIndex()
+
+        # when & then
+        assert index.positions(items, 0, item) == [0, 2]
+        assert index.positions(items, 0, items[1]) == [1]
+        assert index.positions(items, 0, Item()) == []
+
+    def test_should_stay_valid_after_in_place_modification(self):
+        # given
+        items = [Item() for _ in range(3)]
+        index = SlotIndex()
+        index.position(items, 0, items[0])
+
+        # when
+        index.modified(0, 1)
+
+        # then
+        assert index.positions(items, 1, items[2]) == [2]
+        assert index._version == 1
@@ -0,0 +1,69 @@
+import pytest
+
+from lcs import Perception
+from lcs.agents import SymbolTable, EnvironmentAdapter
+from lcs.agents.acs2 import Configuration, Classifier
+
+
+class TestSymbolTable:
+
+    def test_should_keep_single_character_symbols(self):
+        # given
+        table = SymbolTable()
+
+        # when
+        encoded = table.encode(['0', '1', '9', '1'])
+
+        # then
+        assert encoded == '0191'
+        assert len(table) == 3
+
+    def test_should_intern_arbitrary_symbols(self):
+        # given
+        table = SymbolTable()
+
+        # when
+        encoded = table.encode([10, 'wall', 10, None])
+
+        # then
+        assert len(encoded) == 4
+        assert encoded[0] == encoded[2]
+        assert len(set(encoded)) == 3
+        assert '#' not in encoded
+        assert table.decode(encoded) == [10, 'wall', 10, None]
+
+    def test_should_not_assign_wildcard(self):
+        # given
+        table = SymbolTable()
+
+        # when
+        code = table.code('#')
+
+        # then
+        assert code != '#'
+        assert table.decode(['#', code]) == ['#', '#']
+
+    def test_should_limit_alphabet_size(self):
+        # given
+        table = SymbolTable()
+        table.encode(range(255))
+
+        # then
+        with pytest.raises(ValueError):
+            table.code(255)
+
+    def test_should_adapt_environment_states(self):
+        # given
+        table = SymbolTable()
+        adapter = EnvironmentAdapter.with_symbol_table(table)
+        cfg = Configuration(3, 2, environment_adapter=adapter)
+
+        # when
+        p = Perception(adapter.to_genotype([5, 7, 5]))
+        cl = Classifier(condition='#' + table.code(7) + '#', cfg=cfg)
+
+        # then
+        assert len(p) == 3
+        assert adapter.to_phenotype(p) == [5, 7, 5]
+        assert cl.does_match(p)
+        assert table.decode_str(cl.condition) == '#7#'
@@ -128,3 +128,41 @@ class TestRealValueEncoder:
             # then
             assert encoded_with_noise >= encoder.range[0]
             assert encoded_with_noise <= encoded
+
+    @pytest.mark.parametrize("_bits", [1, 2, 4, 8])
+    def test_should_encode_batch_same_as_single_values(self, _bits):
+        # given
+        encoder = RealValueEncoder(_bits)
+        values = np.random.random((10, 3))
+        values[0] = [0., 1., 0.5]
+        noise = np.random.uniform(-0.1, 0.1, values.shape)
+
+        # when
+        encoded = encoder.encode_batch(values)
+        encoded_with_noise = encoder.encode_batch(values, noise)
+
+        # then
+        assert encoded.shape == (10, 3)
+        for v, e in zip(values.flat, encoded.flat):
+            assert encoder.encode(v) == e
+        for v, n, e in zip(values.flat, noise.flat, encoded_with_noise.flat):
+            assert encoder.encode(v, n) == e
+
+    def test_should_deny_batch_encoding_illegal_values(self):
+        with pytest.raises(ValueError):
+            RealValueEncoder(2).encode_batch([0.2, 1.1])
+
+    def test_should_decode_batch(self):
+        # given
+        encoder = RealValueEncoder(4)
+
+        # when
+        decoded = encoder.decode_batch([[0, 15], [3, 8]])
+
+        # then
+        assert decoded.shape == (2, 2)
+        assert np.allclose(decoded, [[encoder.decode(0), encoder.decode(15)],
+                                     [encoder.decode(3), encoder.decode(8)]])
+
+        with pytest.raises(ValueError):
+            encoder.decode_batch([0, 16])
@@ -1,4 +1,5 @@
 import itertools
+import random
 from dataclasses import dataclass
 
 import numpy as np
@@ -21,6 +22,7 @@ class SimpleClassifier:
     q: float
     tav: float = 0.0
     marked: bool = False
+    num: int = 1
 
     def is_marked(self):
         return self.marked
@@ -51,6 +53,52 @@ class TestGeneticAlgorithms:
 
         assert stats[cl1.id] > stats[cl2.id] * 10 > stats[cl3.id] * 10
 
+    def test_should_select_parents_for_many_sets(self):
+        # given
+        random.seed(3)
+        sets = [[IdClassifier(1, 0.7), IdClassifier(2, 0.3)],
+                [IdClassifier(3, 0.0), IdClassifier(4, 0.5)],
+                [IdClassifier(5, 0.2)]]
+
+        def fitnessfcn(cl):
+            return pow(cl.q, 3)
+
+        # when
+        n = 1000
+        results = [ga.batch_roulette_wheel_selection(sets, fitnessfcn)
+                   for _ in range(n)]
+
+        # then
+        assert all(len(pairs) == len(sets) for pairs in results)
+        for set_idx, action_set in enumerate(sets):
+            selected = [cl for pairs in results for cl in pairs[set_idx]]
+            assert all(cl in action_set for cl in selected)
+
+        first_set = [cl.id for pairs in results for cl in pairs[0]]
+        assert first_set.count(1) > first_set.count(2) * 10
+        assert all(cl.id == 4 for pairs in results for cl in pairs[1])
+        assert ga.batch_roulette_wheel_selection([], fitnessfcn) == []
+
+    def test_should_select_parents_like_single_set_selection(self):
+        # given
+        sets = [[IdClassifier(1, 0.7), IdClassifier(2, 0.3)],
+                [IdClassifier(3, 0.9), IdClassifier(4, 0.5),
+                 IdClassifier(5, 0.2)]]
+
+        def fitnessfcn(cl):
+            return pow(cl.q, 3)
+
+        # when
+        random.seed(5)
+        batched = [ga.batch_roulette_wheel_selection(sets, fitnessfcn)
+                   for _ in range(100)]
+        random.seed(5)
+        single = [[ga.roulette_wheel_selection(s, fitnessfcn) for s in sets]
+                  for _ in range(100)]
+
+        # then
+        assert batched == single
+
     @pytest.mark.parametrize("_mu, _cond1, _cond2", [
         (0.0, '1234', '1234'),
         (1.0, '1234', '####')
@@ -153,6 +201,57 @@ class TestGeneticAlgorithms:
         assert sum(cl.num for cl in population) == 18
         assert sum(cl.num for cl in action_set) == 8
 
+    def test_should_select_for_deletion_like_expanded_action_set(self):
+        # given
+        action_set = [
+            SimpleClassifier(.5, tav=1.0, num=3),
+            SimpleClassifier(.45, tav=2.0, num=1),
+            SimpleClassifier(.5, tav=0.5, marked=True, num=5),
+            SimpleClassifier(.9, num=2),
+        ]
+
+        def expanded_selection():
+            # Reference - every micro-classifier considered separately
+            cl_del = None
+            while cl_del is None:
+                for cl in action_set:
+                    for _ in range(cl.num):
+                        if random.random() < .3:
+                            if cl_del is None or \
+                                    ga._is_preferred_to_delete(cl_del, cl):
+                                cl_del = cl
+            return cl_del
+
+        random.seed(1)
+        np.random.seed(1)
+        trials = 5000
+
+        # when
+        expected = [expanded_selection() for _ in range(trials)]
+        selected = [ga._select_for_deletion(action_set)
+                    for _ in range(trials)]
+
+        # then
+        for cl in action_set:
+            assert abs(expected.count(cl) - selected.count(cl)) / trials \
+                < 0.03
+
+    def test_should_draw_deletion_round_at_once(self, mocker):
+        # given
+        action_set = [SimpleClassifier(.5, num=1),
+                      SimpleClassifier(.1, num=4),
+                      SimpleClassifier(.3, num=2)]
+        rand = mocker.patch('numpy.random.random', side_effect=[
+            np.array([.9, .9, .9]), np.array([.2, .8, .1])])
+
+        # when
+        cl_del = ga._select_for_deletion(action_set)
+
+        # then
+        assert rand.call_count == 2
+        rand.assert_called_with(3)
+        assert cl_del is action_set[2]
+
     def test_should_not_find_old_classifier(self):
         # given
         cfg = acs2.Configuration(
@@ -1,8 +1,11 @@
+import random
 from dataclasses import dataclass
 
 import pytest
 
+import lcs.agents.acs2 as acs2
 import lcs.strategies.reinforcement_learning as rl
+from lcs.agents import ParameterStore
 
 
 @dataclass
@@ -64,3 +67,65 @@ class TestReinforcementLearning:
         # then
         assert abs(cl.r - _r1) < 0.001
         assert abs(cl.ir - _ir1) < 0.001
+
+    def test_should_update_classifiers_like_scalar_path(self):
+        # given
+        random.seed(11)
+        cfg = acs2.Configuration(4, 2)
+        population = acs2.ClassifiersList(*[
+            acs2.Classifier(condition=f'{i % 2}###',
+                            effect=random.choice(['####', '1###']),
+                            quality=random.random(),
+                            reward=random.uniform(0, 1000),
+                            immediate_reward=random.uniform(0, 100),
+                            cfg=cfg)
+            for i in range(20)])
+        plain = acs2.ClassifiersList(*[acs2.Classifier.copy_from(cl, 0)
+                                       for cl in population])
+        for cl, other in zip(plain, population):
+            cl.ir = other.ir
+
+        population.attach_index(ParameterStore(acs2.Classifier))
+
+        # when
+        for step in range(50):
+            reward = random.choice([0, 0, 1000])
+            action_set = [i for i in range(len(plain))
+                          if random.random() < 0.3]
+
+            for lst in [plain, population]:
+                acs2.ClassifiersList.apply_reinforcement_learning(
+                    acs2.ClassifiersList(*[lst[i] for i in action_set]),
+                    reward, lst.get_maximum_fitness(), cfg.beta, cfg.gamma)
+
+        # then
+        assert population.get_maximum_fitness() == plain.get_maximum_fitness()
+        assert [(cl.r, cl.ir) for cl in population] == \
+            [(cl.r, cl.ir) for cl in plain]
+
+    @pytest.mark.parametrize("_effects", [
+        ['####', '1###', '#0##'],
+        ['####'],
+    ])
+    def test_should_compute_maximum_fitness_like_scalar_path(self, _effects,
+                                                             mocker):
+        # given
+        random.seed(7)
+        cfg = acs2.Configuration(4, 2)
+        population = acs2.ClassifiersList(*[
+            acs2.Classifier(effect=random.choice(_effects),
+                            quality=random.random(),
+                            reward=random.uniform(0, 1000),
+                            cfg=cfg)
+            for _ in range(30)])
+        expected = max([cl.fitness for cl in population
+                        if cl.does_anticipate_change()], default=0.0)
+        population.attach_index(ParameterStore(acs2.Classifier))
+        masked_max = mocker.spy(rl, 'maximum_fitness')
+
+        # when
+        max_fitness = population.get_maximum_fitness()
+
+        # then
+        assert masked_max.call_count == 1
+        assert max_fitness == expected
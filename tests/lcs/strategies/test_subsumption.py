@@ -1,3 +1,4 @@
+import random
 from dataclasses import dataclass
 
 import pytest
@@ -8,7 +9,7 @@ from lcs.agents.racs import Effect, Condition
 from lcs.representations import UBR
 from lcs.representations.RealValueEncoder import RealValueEncoder
 from lcs.strategies.subsumption import find_subsumers, \
-    is_subsumer, does_subsume
+    is_subsumer, does_subsume, find_similar, find_subsumer
 
 
 @dataclass
@@ -375,3 +376,41 @@ class TestSubsumption:
 
         # then
         assert does_subsume(cl1, cl2, racs_cfg.theta_exp) == _result
+
+    @pytest.mark.parametrize("_last", [False, True])
+    def test_should_find_similar_in_any_list(self, _last, acs2_cfg):
+        # given
+        cl_1 = acs2.Classifier(condition='1#######', cfg=acs2_cfg)
+        cl_2 = acs2.Classifier(condition='1#######', cfg=acs2_cfg)
+        cl_3 = acs2.Classifier(condition='#1######', cfg=acs2_cfg)
+        other = acs2.Classifier(condition='1#######', cfg=acs2_cfg)
+        expected = cl_2 if _last else cl_1
+
+        # then
+        assert find_similar(other, [cl_1, cl_2, cl_3], _last) is expected
+        assert find_similar(other, acs2.ClassifiersList(cl_1, cl_2, cl_3),
+                            _last) is expected
+        assert find_similar(other, [cl_3]) is None
+
+    def test_should_find_the_same_subsumer_with_index(self, acs2_cfg):
+        # given
+        random.seed(7)
+
+        def random_classifier():
+            return acs2.Classifier(
+                condition=''.join(random.choice('01###')
+                                  for _ in range(8)),
+                action=random.randint(0, 1),
+                effect=''.join(random.choice('0####') for _ in range(8)),
+                quality=random.uniform(0.85, 1.0),
+                experience=random.randint(0, 40),
+                cfg=acs2_cfg)
+
+        members = [random_classifier() for _ in range(300)]
+        population = acs2.ClassifiersList(*members)
+
+        # then
+        for _ in range(100):
+            cl = random_classifier()
+            assert find_subsumer(cl, population, acs2_cfg.theta_exp) is \
+                find_subsumer(cl, members, acs2_cfg.theta_exp)
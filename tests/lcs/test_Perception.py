@@ -63,3 +63,85 @@ class TestPerception:
         assert Perception("111") == Perception("111")
         assert Perception("111") is not Perception("111")
         assert hash(Perception("111")) == hash(Perception("111"))
+
+    def test_should_store_single_character_symbols_compactly(self):
+        # when
+        p = Perception(['1', '0', '1'])
+
+        # then
+        assert p._items == '101'
+        assert list(p) == ['1', '0', '1']
+        assert p == Perception('101')
+        assert hash(p) == hash(Perception('101'))
+
+    @pytest.mark.parametrize("_obs, _binary", [
+        ('1011', 0b1011),
+        ('0000', 0),
+        ('10#1', None),
+        ('1091', None),
+        ('', None),
+    ])
+    def test_should_pack_binary_perception(self, _obs, _binary):
+        assert Perception(_obs).binary == _binary
+
+    def test_should_create_trusted_perception(self):
+        # given
+        p0 = Perception(('1', '0', '1'))
+
+        # when
+        p1 = Perception._from_tuple(('1', '0', '1'))
+        p2 = Perception._from_tuple(p0)
+
+        # then
+        assert p1._items == '101'
+        assert p2._items is p0._items
+        assert p1 == p0 and p2 == p0
+        assert hash(p1) == hash(p2) == hash(p0)
+
+    @pytest.mark.parametrize("_obs", [
+        ('1', '0', '1'),
+        ['1', '0'],
+        '0110',
+        ('10', '1', '0'),
+        ('1', '0', '10'),
+    ])
+    def test_should_store_trusted_perception_like_validated(self, _obs):
+        # when
+        p = Perception._from_tuple(_obs)
+
+        # then
+        assert p._items == Perception(_obs)._items
+
+    def test_should_intern_perception(self):
+        # given
+        p0 = Perception.intern(('1', '0', '1', '1'))
+
+        # when
+        p1 = Perception.intern(('1', '0', '1', '1'))
+        p2 = Perception.intern('1011')
+        p3 = Perception.intern(Perception('1011'))
+
+        # then
+        assert p1 is p0 and p2 is p0 and p3 is p0
+        assert Perception.intern(p0) is p0
+        assert Perception.intern('1010') is not p0
+        assert p0 == Perception('1011')
+        assert hash(p0) == hash(Perception('1011'))
+
+    def test_should_keep_interned_perceptions_valid_when_pool_is_full(
+            self, mocker):
+        # given
+        mocker.patch('lcs.Perception.INTERN_POOL_SIZE', 2)
+        mocker.patch.object(Perception, '_pool', {})
+        p0 = Perception.intern('00')
+
+        # when
+        Perception.intern('01')
+        Perception.intern('10')
+        p1 = Perception.intern('00')
+
+        # then
+        assert len(Perception._pool) <= 2
+        assert p1 is not p0
+        assert p1 == p0
+        assert hash(p1) == hash(p0)
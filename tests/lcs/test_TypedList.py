@@ -132,3 +132,45 @@ class TestTypedList:
         # then
         sorted_lst = TypedList(*[1, 3, 5, 8], oktypes=(int,))
         assert lst == sorted_lst
+
+    def test_should_bump_version_on_modification(self):
+        # given
+        lst = TypedList(*[3, 5, 1, 8], oktypes=(int,))
+        version = lst.version
+
+        # when
+        lst.append(2)
+        lst.safe_remove(5)
+        lst.safe_remove(42)
+        lst[0] = 4
+
+        # then
+        assert lst.version == version + 3
+
+    def test_should_copy_shared_storage_on_modification(self):
+        # given
+        items = [1, 2, 3]
+        lst = TypedList.view(items, oktypes=(int,))
+
+        # when
+        lst.append(4)
+        del lst[0]
+
+        # then
+        assert items == [1, 2, 3]
+        assert list(lst) == [2, 3, 4]
+
+    def test_should_not_check_types_when_extending_with_typed_list(
+            self, mocker):
+        # given
+        lst1 = TypedList(*[1, 2, 3], oktypes=(int,))
+        lst2 = TypedList(*[4, 5], oktypes=(int,))
+        check_types = mocker.patch('lcs.TypedList.check_types')
+
+        # when
+        lst1.extend(lst2)
+        lst1.extend([6])
+
+        # then
+        assert list(lst1) == [1, 2, 3, 4, 5, 6]
+        check_types.assert_called_once_with((int,), 6)
@@ -1,6 +1,7 @@
 import pytest
 
 from lcs import check_types
+from lcs.utils import bitset_insert, bitset_remove, bitset_indices
 
 
 class TestUtils:
@@ -13,3 +14,22 @@ class TestUtils:
     def test_deny_mismatched_types(self):
         with pytest.raises(TypeError) as _:
             check_types((str,), 5)
+
+    def test_should_insert_bitset_gap(self):
+        assert bitset_insert(0b1011, 0) == 0b10110
+        assert bitset_insert(0b1011, 2) == 0b10011
+        assert bitset_insert(0b1011, 4) == 0b1011
+
+    def test_should_remove_bitset_position(self):
+        assert bitset_remove(0b1011, 0) == 0b101
+        assert bitset_remove(0b1011, 2) == 0b111
+        assert bitset_remove(0b1011, 3) == 0b011
+
+    @pytest.mark.parametrize("_bits, _indices", [
+        (0, []),
+        (0b1, [0]),
+        (0b1010, [1, 3]),
+        (1 << 100 | 1 << 9, [9, 100]),
+    ])
+    def test_should_list_bitset_indices(self, _bits, _indices):
+        assert list(bitset_indices(_bits)) == _indices